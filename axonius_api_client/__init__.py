@@ -42,7 +42,21 @@ Examples:
     >>> dashboard = ctx.dashboard
 
 """
-from . import api, auth, cli, constants, data, exceptions, http, logs, tools, url_parser, version
+from . import (
+    api,
+    auth,
+    cache,
+    cli,
+    constants,
+    data,
+    exceptions,
+    http,
+    logs,
+    metrics,
+    tools,
+    url_parser,
+    version,
+)
 from .api import (
     Adapters,
     Dashboard,
@@ -57,8 +71,8 @@ from .api import (
     WizardText,
 )
 from .auth import ApiKey
-from .connect import Connect
-from .http import Http
+from .connect import AsyncConnect, Connect
+from .http import AsyncHttp, Http
 from .url_parser import UrlParser
 
 __version__ = version.__version__
@@ -67,8 +81,10 @@ LOG = logs.LOG
 __all__ = (
     # Connection handler
     "Connect",
+    "AsyncConnect",
     # http client
     "Http",
+    "AsyncHttp",
     # authentication
     "ApiKey",
     # api
@@ -87,6 +103,7 @@ __all__ = (
     # modules
     "api",
     "auth",
+    "cache",
     "http",
     "exceptions",
     "version",
@@ -94,6 +111,7 @@ __all__ = (
     "constants",
     "cli",
     "logs",
+    "metrics",
     "data",
     "url_parser",
 )
@@ -65,7 +65,35 @@ class Adapters(ModelMixins):
         return API_VERSION.adapters
 
     def get(self) -> List[dict]:
-        """Get all adapters on all nodes."""
+        """Get all adapters on all nodes.
+
+        Notes:
+            The parsed adapters are cached in the ``adapters`` namespace of :attr:`CACHE`,
+            which is invalidated when connections or advanced settings are changed by this client.
+            Each call returns copies of the adapter, config, and connection dicts, while the
+            values in them and the lazily parsed schemas are shared with the cache.
+        """
+        parsed = self.CACHE.get(namespace="adapters", key=self.router.root, loader=self._get_parsed)
+        return [self._copy_adapter(adapter=x) for x in parsed]
+
+    @staticmethod
+    def _copy_adapter(adapter: dict) -> dict:
+        """Copy the dicts of a cached adapter that callers may change.
+
+        Args:
+            adapter: parsed adapter from the cache
+        """
+        value = dict(adapter)
+        value["config"] = {k: dict(v) for k, v in adapter["config"].items()}
+        value["cnx"] = [dict(x) for x in adapter["cnx"]]
+        return value
+
+    def cache_clear(self):
+        """Remove the parsed adapters from :attr:`CACHE`."""
+        self.CACHE.invalidate(namespace="adapters")
+
+    def _get_parsed(self) -> List[dict]:
+        """Get and parse all adapters on all nodes."""
         parsed = parse_adapters(raw=self._get())
         parsed = sorted(parsed, key=lambda x: [x["node_name"], x["name"]])
         return parsed
@@ -238,7 +266,9 @@ class Adapters(ModelMixins):
         path = self.router.config_set.format(
             adapter_name_raw=name_raw, adapter_config_name=name_config
         )
-        return self.request(method="post", path=path, json=new_config, error_json_invalid=False)
+        response = self.request(method="post", path=path, json=new_config, error_json_invalid=False)
+        self.cache_clear()
+        return response
 
     def _config_get(self, name_plugin: str, name_config: str) -> dict:
         """Direct API method to set advanced settings for an adapter.
@@ -191,6 +191,7 @@ class Cnx(ChildMixins):
 
             time.sleep(sleep)
 
+            self.parent.cache_clear()
             cnxs = self.get_by_adapter(adapter_name=adapter_name, adapter_node=adapter_node)
 
         value_key = value_key.upper()
@@ -633,13 +634,15 @@ class Cnx(ChildMixins):
 
         path = self.parent.router.cnxs.format(adapter_name_raw=adapter_name_raw)
 
-        return self.parent.request(
+        response = self.parent.request(
             method="put",
             path=path,
             json=data,
             error_json_bad_status=False,
             error_status=False,
         )
+        self.parent.cache_clear()
+        return response
 
     def _test(self, adapter_name_raw: str, adapter_node_id: str, config: dict) -> str:
         """Direct API method to add a connection to an adapter.
@@ -681,7 +684,7 @@ class Cnx(ChildMixins):
             adapter_name_raw=adapter_name_raw, cnx_uuid=cnx_uuid
         )
 
-        return self.parent.request(
+        response = self.parent.request(
             method="delete",
             path=path,
             json=data,
@@ -689,6 +692,8 @@ class Cnx(ChildMixins):
             error_json_bad_status=False,
             error_status=False,
         )
+        self.parent.cache_clear()
+        return response
 
     def _update(
         self,
@@ -713,10 +718,12 @@ class Cnx(ChildMixins):
         path = self.parent.router.cnxs_uuid.format(
             adapter_name_raw=adapter_name_raw, cnx_uuid=cnx_uuid
         )
-        return self.parent.request(
+        response = self.parent.request(
             method="post",
             path=path,
             json=data,
             error_json_bad_status=False,
             error_status=False,
         )
+        self.parent.cache_clear()
+        return response
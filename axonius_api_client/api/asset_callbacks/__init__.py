@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
 """Asset export callbacks."""
-from . import base, base_csv, base_json, base_table, base_xlsx, tools
+from . import (
+    base,
+    base_csv,
+    base_json,
+    base_multi,
+    base_parquet,
+    base_sqlite,
+    base_table,
+    base_xlsx,
+    tools,
+)
 from .base import Base
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_multi import Multi
+from .base_parquet import Arrow, Parquet
+from .base_sqlite import Sqlite
 from .base_table import Table
 from .base_xlsx import Xlsx
 from .tools import get_callbacks_cls
@@ -16,10 +29,17 @@ __all__ = (
     "Table",
     "Xlsx",
     "JsonToCsv",
+    "Parquet",
+    "Arrow",
+    "Sqlite",
+    "Multi",
     "get_callbacks_cls",
     "base",
     "base_csv",
     "base_json",
+    "base_multi",
+    "base_parquet",
+    "base_sqlite",
     "base_table",
     "base_xlsx",
     "tools",
@@ -1,14 +1,29 @@
 # -*- coding: utf-8 -*-
 """Base export callbacks class."""
-import copy
+import hashlib
+import json
 import logging
+import os
 import re
 import sys
-from typing import Generator, List, Optional, Tuple, Union
-
-from ...constants import DEFAULT_PATH, FIELD_JOINER, FIELD_TRIM_LEN, FIELD_TRIM_STR, SCHEMAS_CUSTOM
+import tempfile
+from collections.abc import Mapping
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+from ...constants import (
+    AGG_ADAPTER_NAME,
+    DEFAULT_PATH,
+    DELTA_HASH_VERSION,
+    EXPORT_COMPRESSIONS,
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    FIELD_TRIM_STR,
+    LABELS_WORKERS,
+    SCHEMAS_CUSTOM,
+)
 from ...exceptions import ApiError
 from ...tools import (
+    CompressedWriter,
     calc_percent,
     coerce_int,
     echo_error,
@@ -16,7 +31,11 @@ from ...tools import (
     echo_warn,
     get_path,
     join_kv,
+    json_default,
+    json_dump,
+    json_load,
     listify,
+    strip_right,
 )
 from ..parsers import schema_custom
 
@@ -34,6 +53,43 @@ class Base:
     FIND_KEYS: List[str] = ["name", "name_qual", "column_title", "name_base"]
     """field schema keys to use when finding a fields schema"""
 
+    CHECKPOINTS: bool = True
+    """this callback can resume writing its output from a checkpoint"""
+
+    COMPRESS: bool = False
+    """this callback can compress the export file it writes to"""
+
+    CALLBACK_ARGS: dict = {
+        "do_custom_cbs": "custom_cbs",
+        "process_tags_to_add": "tags_add",
+        "process_tags_to_remove": "tags_remove",
+        "add_report_adapters_missing": "report_adapters_missing",
+        "add_report_software_whitelist": "report_software_whitelist",
+        "do_excludes": "field_excludes",
+        "do_delta": "delta_manifest",
+        "do_add_null_values": "field_null",
+        "do_flatten_fields": "field_flatten",
+        "do_explode_field": "field_explode",
+        "do_join_values": "field_join",
+        "do_change_field_titles": "field_titles",
+    }
+    """GETARGS key that must be set for each callback in :attr:`callbacks` to do anything"""
+
+    CALLBACK_COPIES: dict = {
+        "do_custom_cbs": "deep",
+        "add_report_adapters_missing": "shallow",
+        "add_report_software_whitelist": "shallow",
+        "do_excludes": "deep",
+        "do_delta": "shallow",
+        "do_add_null_values": "deep",
+        "do_flatten_fields": "deep",
+        "do_explode_field": "deep",
+        "do_join_values": "shallow",
+        "do_change_field_titles": "shallow",
+    }
+    """How each callback in :attr:`callbacks` changes the rows it is given: shallow only sets
+    the keys of a row, deep also changes the dicts and lists in it"""
+
     def __init__(
         self,
         apiobj,
@@ -71,15 +127,24 @@ class Base:
         self.GETARGS: dict = getargs or {}
         """original kwargs supplied to get assets method."""
 
-        self.TAG_ROWS_ADD: List[dict] = []
-        """assets to add tags to in do_tagging."""
+        self.TAG_IDS_ADD: dict = {}
+        """internal_axon_id of assets to add tags to in do_tagging, used as an ordered set."""
 
-        self.TAG_ROWS_REMOVE: List[dict] = []
-        """assets to remove tags from in do_tagging."""
+        self.TAG_IDS_REMOVE: dict = {}
+        """internal_axon_id of assets to remove tags from in do_tagging, used as an ordered set."""
 
         self.CUSTOM_CB_EXC: List[dict] = []
         """list of custom callbacks that have been executed"""
 
+        self.CHECKPOINT: Optional[dict] = None
+        """output of :meth:`get_checkpoint` from a previous export to resume writing from"""
+
+        self.DELTA_HASHES: Dict[str, str] = {}
+        """internal_axon_id -> content hash of the assets processed by :meth:`do_delta`"""
+
+        self.DELTA_COUNTS: Dict[str, int] = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        """number of assets per change type found by :meth:`do_delta`"""
+
         self._init()
 
     def _init(self):
@@ -100,6 +165,10 @@ class Base:
         store = join + join.join(join_kv(obj=self.STORE))
         self.echo(msg=f"Get Arguments: {store}")
 
+        if self.GETARGS.get("delta_manifest", None):
+            # check the previous manifest before the export file is overwritten
+            self.delta_previous
+
     def echo_columns(self, **kwargs):
         """Echo the columns of the fields selected."""
         if getattr(self, "ECHO_DONE", False):
@@ -117,6 +186,7 @@ class Base:
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         self.do_tagging()
+        self.delta_save()
         self.echo(msg=f"Stopping {self}")
 
     def echo_page_progress(self):
@@ -183,6 +253,7 @@ class Base:
             self.add_report_adapters_missing,
             self.add_report_software_whitelist,
             self.do_excludes,
+            self.do_delta,
             self.do_add_null_values,
             self.do_flatten_fields,
             self.do_explode_field,
@@ -196,10 +267,66 @@ class Base:
         Args:
             rows: rows to process
         """
-        for cb in self.callbacks:
+        if getattr(self, "_delta_removing", False):
+            for cb in self.plan["callbacks_removed"]:
+                rows = cb(rows=rows)
+            return rows
+
+        if self.plan["explode_stream"]:
+            return self.do_row_stream(rows=rows)
+
+        for cb in self.plan["callbacks"]:
             rows = cb(rows=rows)
         return rows
 
+    def do_row_stream(self, rows: Union[List[dict], dict]) -> Generator[dict, None, None]:
+        """Execute the callbacks for current row, yielding each exploded row as it is built.
+
+        Args:
+            rows: rows to process
+
+        Notes:
+            The callbacks after :meth:`do_explode_field` are run against one exploded row at
+            a time, so the rows exploded from an asset are never all held in memory at once.
+        """
+        callbacks = self.plan["callbacks"]
+        idx = callbacks.index(self.do_explode_field)
+
+        for cb in callbacks[:idx]:
+            rows = cb(rows=rows)
+
+        for row in listify(rows):
+            for new_row in self._iter_explode_field(row=row):
+                new_rows = [new_row]
+                for cb in callbacks[idx:][1:]:
+                    new_rows = cb(rows=new_rows)
+                yield from new_rows
+
+    @property
+    def row_copy(self) -> Optional[str]:
+        """Get how a row must be copied before it is handed to :meth:`process_row` so that
+        the original row is not changed: None, shallow, or deep.
+
+        Notes:
+            Used by :obj:`axonius_api_client.api.asset_callbacks.base_multi.Multi` to only
+            copy rows for the exports that change them.
+        """
+        copies = [self.CALLBACK_COPIES.get(x.__name__, None) for x in self.plan["callbacks"]]
+        if "deep" in copies:
+            return "deep"
+        if "shallow" in copies:
+            return "shallow"
+        return None
+
+    @staticmethod
+    def iter_rows(rows: Union[Iterable[dict], dict]) -> Iterable[dict]:
+        """Get rows returned by :meth:`do_row` as something that can be iterated over.
+
+        Args:
+            rows: rows to get, a generator is returned as is instead of being consumed
+        """
+        return rows if isinstance(rows, Generator) else listify(rows)
+
     def do_custom_cbs(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute any custom callbacks for current row.
 
@@ -207,7 +334,7 @@ class Base:
             rows: rows to process
         """
         rows = listify(rows)
-        custom_cbs = listify(self.GETARGS.get("custom_cbs", []))
+        custom_cbs = self.plan["custom_cbs"]
 
         for custom_cb in custom_cbs:
             try:
@@ -230,7 +357,7 @@ class Base:
             return rows
 
         for row in rows:
-            for schema in self.schemas_selected:
+            for schema in self.plan["schemas"]:
                 self._do_add_null_values(row=row, schema=schema)
         return rows
 
@@ -245,7 +372,7 @@ class Base:
         if self.is_excluded(schema=schema):
             return row
 
-        null_value = self.GETARGS.get("field_null_value", None)
+        null_value = self.plan["null_value"]
 
         field = schema[key]
 
@@ -279,17 +406,14 @@ class Base:
         Args:
             row: row being processed
         """
-        for schema in self.schemas_selected:
-            if self.is_excluded(schema=schema):
-                row.pop(schema["name_qual"], None)
+        for field, sub_fields in self.plan["excludes"]:
+            if not sub_fields:
+                row.pop(field, None)
                 continue
 
-            if schema["is_complex"]:
-                items = listify(row.get(schema["name_qual"], []))
-                for sub_schema in schema["sub_fields"]:
-                    if self.is_excluded(schema=sub_schema):
-                        for item in items:
-                            item.pop(sub_schema["name"], None)
+            for item in listify(row.get(field, [])):
+                for sub_field in sub_fields:
+                    item.pop(sub_field, None)
 
     def do_join_values(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Join values.
@@ -311,8 +435,8 @@ class Base:
         Args:
             row: row being processed
         """
-        joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
-        trim_len = coerce_int(self.GETARGS.get("field_join_trim", FIELD_TRIM_LEN))
+        joiner = self.plan["join_value"]
+        trim_len = self.plan["join_trim"]
         trim_str = FIELD_TRIM_STR
 
         for field in row:
@@ -344,14 +468,8 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.GETARGS.get("field_null_value", None)
-
-        for schema in self.final_schemas:
-            title = schema["column_title"]
-            name = schema["name_qual"]
-            is_complex = schema["is_complex"]
-            default = [] if is_complex else null_value
-            row[title] = row.pop(name, default)
+        for title, name, is_complex in self.plan["titles"]:
+            row[title] = row.pop(name, [] if is_complex else self.plan["null_value"])
 
     def do_flatten_fields(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Asset callback to flatten complex fields.
@@ -364,9 +482,8 @@ class Base:
             return rows
 
         for row in rows:
-            for schema in self.schemas_selected:
-                if self.schema_to_explode != schema:
-                    self._do_flatten_fields(row=row, schema=schema)
+            for schema in self.plan["flatten"]:
+                self._do_flatten_fields(row=row, schema=schema)
 
         return rows
 
@@ -382,7 +499,7 @@ class Base:
         if not schema["is_complex"]:
             return
 
-        null_value = self.GETARGS.get("field_null_value", None)
+        null_value = self.plan["null_value"]
 
         items = listify(row.pop(schema["name_qual"], []))
 
@@ -417,30 +534,217 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.GETARGS.get("field_null_value", None)
+        return list(self._iter_explode_field(row=row))
+
+    def _iter_explode_field(self, row: dict) -> Generator[dict, None, None]:
+        """Explode a field into multiple rows, yielding each new row as it is built.
+
+        Args:
+            row: row being processed
+
+        Notes:
+            Each new row is a shallow copy of ``row`` with the exploded value(s) set on it, so
+            the values of all other fields are shared between the new rows instead of being
+            deep copied for every item of the exploded field.
+        """
+        null_value = self.plan["null_value"]
 
         schema = self.schema_to_explode
         field = schema["name_qual"]
 
         if len(listify(row.get(field, []))) <= 1:
             self._do_flatten_fields(row=row, schema=schema)
-            return [row]
+            yield row
+            return
 
         items = listify(row.pop(field, []))
-        new_rows_map = {}
 
         if schema["is_complex"]:
-            for sub_schema in self.get_sub_schemas(schema=schema):
-                for idx, item in enumerate(items):
-                    new_rows_map.setdefault(idx, copy.deepcopy(row))
-                    value = item.pop(sub_schema["name"], null_value)
-                    new_rows_map[idx][sub_schema["name_qual"]] = value
+            sub_schemas = self.get_sub_schemas(schema=schema)
+            for item in items:
+                new_row = dict(row)
+                for sub_schema in sub_schemas:
+                    new_row[sub_schema["name_qual"]] = item.pop(sub_schema["name"], null_value)
+                yield new_row
         else:
-            for idx, item in enumerate(items):
-                new_rows_map.setdefault(idx, copy.deepcopy(row))
-                new_rows_map[idx][schema["name_qual"]] = item
+            for item in items:
+                new_row = dict(row)
+                new_row[field] = item
+                yield new_row
+
+    def do_delta(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Remove rows of assets that have not changed since the previous export and set the
+        change type of the rest.
+
+        Args:
+            rows: rows to process
+
+        Notes:
+            Each row is hashed after excluded fields are removed and compared to the hash of
+            the asset in the manifest of the previous export. New assets are marked as
+            ``added`` and assets with a different hash as ``changed``.
+        """
+        rows = listify(rows)
+        if not self.GETARGS.get("delta_manifest", None):
+            return rows
+
+        field = SCHEMAS_CUSTOM["delta"]["delta_change"]["name_qual"]
+        previous = self.delta_previous
+
+        new_rows = []
+        for row in rows:
+            asset_id = row["internal_axon_id"]
+            digest = self.get_row_hash(row=row)
+            self.DELTA_HASHES[asset_id] = digest
+
+            if previous.get(asset_id, None) == digest:
+                self.DELTA_COUNTS["unchanged"] += 1
+                continue
+
+            change = "changed" if asset_id in previous else "added"
+            self.DELTA_COUNTS[change] += 1
+            row[field] = change
+            new_rows.append(row)
+        return new_rows
+
+    def process_delta_removed(self) -> Generator[dict, None, None]:
+        """Process a row for each asset in the manifest of the previous export that was not
+        returned by this export.
+
+        Notes:
+            Only the callbacks after :meth:`do_delta` are run against these rows, so they are
+            not tagged or reported on. Nothing is done if this export did not fetch all assets,
+            i.e. if max_rows, max_pages, or page_start were supplied or it was resumed.
+        """
+        field = SCHEMAS_CUSTOM["delta"]["delta_change"]["name_qual"]
+
+        self._delta_removing = True
+        try:
+            for asset_id in self.delta_removed:
+                self.DELTA_COUNTS["removed"] += 1
+                row = {"internal_axon_id": asset_id, field: "removed"}
+                yield from self.iter_rows(rows=self.process_row(row=row))
+        finally:
+            self._delta_removing = False
+
+    def delta_save(self):
+        """Save the hash of each asset to the delta manifest for the next export.
+
+        Notes:
+            If this export did not fetch all assets, the hashes of the assets in the previous
+            manifest that were not returned are kept.
+        """
+        manifest = self.GETARGS.get("delta_manifest", None)
+        if not manifest:
+            return
+
+        hashes = self.DELTA_HASHES
+        if not self.delta_complete:
+            hashes = {**self.delta_previous, **hashes}
+
+        data = {
+            "asset_type": self.APIOBJ.router.OBJ_TYPE,
+            "hash_version": DELTA_HASH_VERSION,
+            "selection": self.delta_selection,
+            "hashes": hashes,
+        }
+
+        path = get_path(obj=manifest)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(json_dump(obj=data, indent=None))
+        os.replace(temp_file, str(path))
+
+        counts = ", ".join(f"{k}={v}" for k, v in self.DELTA_COUNTS.items())
+        self.echo(msg=f"Saved delta manifest of {len(hashes)} assets to '{path}' ({counts})")
+
+    @property
+    def delta_previous(self) -> Dict[str, Optional[str]]:
+        """Get the internal_axon_id -> content hash map from the previous delta manifest.
+
+        Notes:
+            If the hashes of the previous manifest were made by a different version of
+            :meth:`get_row_hash`, they can not be compared, so every asset in it is changed.
+        """
+        if hasattr(self, "_delta_previous"):
+            return self._delta_previous
+
+        self._delta_previous = {}
+        path = get_path(obj=self.GETARGS["delta_manifest"])
+        if path.is_file():
+            data = json_load(obj=path.read_bytes())
+            asset_type = self.APIOBJ.router.OBJ_TYPE
+            if data.get("asset_type") != asset_type:
+                msg = (
+                    f"Delta manifest '{path}' is for {data.get('asset_type')!r}, not {asset_type!r}"
+                )
+                self.echo(msg=msg, error=ApiError, level="error")
+
+            selection = data.get("selection", None)
+            if selection and selection != self.delta_selection:
+                msg = (
+                    f"Delta manifest '{path}' is for a different query, fields, or excluded "
+                    "fields than this export"
+                )
+                self.echo(msg=msg, error=ApiError, level="error")
+
+            self._delta_previous = data["hashes"]
+
+            version = data.get("hash_version", 1)
+            if version != DELTA_HASH_VERSION:
+                msg = (
+                    f"Delta manifest '{path}' has hash version {version!r}, not "
+                    f"{DELTA_HASH_VERSION!r}, all assets in it will be changed"
+                )
+                self.echo(msg=msg, warning=True)
+                self._delta_previous = {x: None for x in self._delta_previous}
+        return self._delta_previous
+
+    @property
+    def delta_selection(self) -> str:
+        """Get the digest of the query, fields, and excluded fields of this export.
+
+        Notes:
+            Saved to the delta manifest, since comparing exports of different assets or
+            fields would report assets as removed or changed that were not.
+        """
+        value = {
+            "query": self.STORE.get("query", None),
+            "fields": sorted(listify(self.STORE.get("fields", []))),
+            "excludes": sorted(str(x) for x in listify(self.GETARGS.get("field_excludes", []))),
+        }
+        return self.get_row_hash(row=value)
+
+    @property
+    def delta_removed(self) -> List[str]:
+        """Get the internal_axon_id of the assets in the previous delta manifest that were not
+        returned by this export."""
+        if not self.GETARGS.get("delta_manifest", None) or not self.delta_complete:
+            return []
+        return [x for x in self.delta_previous if x not in self.DELTA_HASHES]
+
+    @property
+    def delta_complete(self) -> bool:
+        """Get if this export fetched all assets, so that missing assets were removed."""
+        partial = ["max_rows", "max_pages", "page_start"]
+        return not (any(self.STATE.get(x, None) for x in partial) or self.CHECKPOINT)
+
+    @staticmethod
+    def get_row_hash(row: dict) -> str:
+        """Get the hash of the content of a row.
+
+        Args:
+            row: row to hash
 
-        return [new_rows_map[idx] for idx in new_rows_map]
+        Notes:
+            The row is serialized by the stdlib json module in a fixed format, so the hash does
+            not change with the json codec in use, see :data:`DELTA_HASH_VERSION`.
+        """
+        value = json.dumps(
+            row, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=json_default
+        ).encode("utf-8")
+        return hashlib.blake2b(value, digest_size=16).hexdigest()
 
     def do_tagging(self):
         """Add or remove tags to assets."""
@@ -453,7 +757,8 @@ class Base:
         rows_add = self.TAG_ROWS_ADD
         if tags_add and rows_add:
             self.echo(msg=f"Adding tags {tags_add} to {len(rows_add)} assets")
-            self.APIOBJ.labels.add(rows=rows_add, labels=tags_add)
+            self.APIOBJ.labels.add(rows=rows_add, labels=tags_add, workers=self.tags_workers)
+        self.TAG_IDS_ADD.clear()
 
     def do_tag_remove(self):
         """Remove tags from assets."""
@@ -461,13 +766,30 @@ class Base:
         rows_remove = self.TAG_ROWS_REMOVE
         if tags_remove and rows_remove:
             self.echo(msg=f"Removing tags {tags_remove} from {len(rows_remove)} assets")
-            self.APIOBJ.labels.remove(rows=rows_remove, labels=tags_remove)
+            self.APIOBJ.labels.remove(
+                rows=rows_remove, labels=tags_remove, workers=self.tags_workers
+            )
+        self.TAG_IDS_REMOVE.clear()
+
+    @property
+    def TAG_ROWS_ADD(self) -> List[dict]:
+        """Get the assets to add tags to in do_tagging."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_ADD]
+
+    @property
+    def TAG_ROWS_REMOVE(self) -> List[dict]:
+        """Get the assets to remove tags from in do_tagging."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_REMOVE]
 
     def process_tags_to_add(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Add assets to tracker for adding tags.
 
         Args:
             rows: rows to process
+
+        Notes:
+            If tags_batch_size is supplied, tags will be added every time that many assets
+            are being tracked instead of waiting for all assets to be fetched.
         """
         rows = listify(rows)
         tags = listify(self.GETARGS.get("tags_add", []))
@@ -475,10 +797,10 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
+            self.TAG_IDS_ADD[row["internal_axon_id"]] = None
 
-            if tag_row not in self.TAG_ROWS_ADD:
-                self.TAG_ROWS_ADD.append(tag_row)
+        if self.tags_batch_size and len(self.TAG_IDS_ADD) >= self.tags_batch_size:
+            self.do_tag_add()
         return rows
 
     def process_tags_to_remove(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -486,6 +808,10 @@ class Base:
 
         Args:
             rows: rows to process
+
+        Notes:
+            If tags_batch_size is supplied, tags will be removed every time that many assets
+            are being tracked instead of waiting for all assets to be fetched.
         """
         rows = listify(rows)
         tags = listify(self.GETARGS.get("tags_remove", []))
@@ -493,13 +819,30 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_REMOVE:
-                self.TAG_ROWS_REMOVE.append(tag_row)
+            self.TAG_IDS_REMOVE[row["internal_axon_id"]] = None
 
+        if self.tags_batch_size and len(self.TAG_IDS_REMOVE) >= self.tags_batch_size:
+            self.do_tag_remove()
         return rows
 
+    @property
+    def tags_workers(self) -> int:
+        """Get the number of threads to use when adding or removing tags."""
+        if hasattr(self, "_tags_workers"):
+            return self._tags_workers
+
+        self._tags_workers = coerce_int(self.GETARGS.get("tags_workers", None) or LABELS_WORKERS)
+        return self._tags_workers
+
+    @property
+    def tags_batch_size(self) -> int:
+        """Get the number of assets to track before adding or removing tags."""
+        if hasattr(self, "_tags_batch_size"):
+            return self._tags_batch_size
+
+        self._tags_batch_size = coerce_int(self.GETARGS.get("tags_batch_size", None) or 0)
+        return self._tags_batch_size
+
     def add_report_software_whitelist(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Software whitelist.
 
@@ -508,7 +851,7 @@ class Base:
         """
         rows = listify(rows)
 
-        if not listify(self.GETARGS.get("report_software_whitelist", [])):
+        if not self.plan["software_whitelist"]:
             return rows
 
         for row in rows:
@@ -530,7 +873,7 @@ class Base:
         sws = listify(row.get(sw_field, []))
         names = [x.get("name") for x in sws if x.get("name") and isinstance(x.get("name"), str)]
 
-        whitelists = listify(self.GETARGS.get("report_software_whitelist", []))
+        whitelists = self.plan["software_whitelist"]
         extras = [n for n in names if any([re.search(x, n, re.I)] for x in whitelists)]
         missing = [x for x in whitelists if any([re.search(x, n, re.I) for n in names])]
 
@@ -586,14 +929,13 @@ class Base:
         Args:
             schema: field schema
         """
-        excludes = listify(self.GETARGS.get("field_excludes", []))
+        if not hasattr(self, "_excludes"):
+            self._excludes = {x for x in listify(self.GETARGS.get("field_excludes", [])) if x}
 
-        for exclude in excludes:
-            for key in self.FIND_KEYS:
-                name = schema.get(key, None)
-                if (name and exclude) and name == exclude:
-                    return True
-        return False
+        if not self._excludes:
+            return False
+
+        return any(schema.get(key, None) in self._excludes for key in self.FIND_KEYS)
 
     def open_fd_arg(self):
         """Open a file descriptor supplied in GETARGS."""
@@ -604,6 +946,7 @@ class Base:
 
     def open_fd_path(self):
         """Open a file descriptor for a path."""
+        self._export_compression = compression = self.get_export_compression()
         self._export_file = self.GETARGS.get("export_file", None)
         self._export_path = self.GETARGS.get("export_path", DEFAULT_PATH)
         self._export_overwrite = self.GETARGS.get("export_overwrite", False)
@@ -612,6 +955,13 @@ class Base:
         file_path.mkdir(mode=0o700, parents=True, exist_ok=True)
         self._file_path = fp = (file_path / self._export_file).resolve()
 
+        if compression and (self.CHECKPOINT or self.STATE.get("checkpoint", None)):
+            msg = f"Export file '{fp}' can not be checkpointed when compressed with {compression}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if self.CHECKPOINT and self.CHECKPOINT.get("file_path"):
+            return self.open_fd_resume()
+
         if self._file_path.exists():
             self._file_mode = "overwrote"
             mode = "overwriting"
@@ -625,10 +975,85 @@ class Base:
 
         self._file_path.touch(mode=0o600)
         self._fd_close = self.GETARGS.get("export_fd_close", True)
-        self._fd = self._file_path.open(mode="w", encoding="utf-8")
+        if compression:
+            level = self.GETARGS.get("export_compression_level", None)
+            self._fd = CompressedWriter(path=fp, compression=compression, level=level)
+            mode = f"{mode}, {compression} compressed"
+        else:
+            self._fd = self._file_path.open(mode="w", encoding="utf-8")
         self.echo(msg=f"Exporting to file '{fp}' ({mode})")
         return self._fd
 
+    def get_export_compression(self) -> Optional[str]:
+        """Get the compression codec to use for the export file.
+
+        Notes:
+            Uses export_compression if supplied, adding its extension to export_file if
+            missing, otherwise the codec that matches the extension of export_file.
+        """
+        if not self.COMPRESS:
+            return None
+
+        export_file = str(self.GETARGS.get("export_file", None))
+        compression = self.GETARGS.get("export_compression", None)
+
+        if not compression:
+            for name, ext in EXPORT_COMPRESSIONS.items():
+                if export_file.endswith(ext):
+                    return name
+            return None
+
+        if compression == "none":
+            return None
+
+        if compression not in EXPORT_COMPRESSIONS:
+            valid = list(EXPORT_COMPRESSIONS) + ["none"]
+            msg = f"Invalid export_compression {compression!r}, valids: {valid}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        ext = EXPORT_COMPRESSIONS[compression]
+        if not export_file.endswith(ext):
+            self.GETARGS["export_file"] = f"{export_file}{ext}"
+        return compression
+
+    def open_fd_resume(self):
+        """Open a file descriptor for a path and truncate it to the offset in CHECKPOINT."""
+        fp = self._file_path
+        offset = self.CHECKPOINT["file_offset"]
+
+        if str(fp) != self.CHECKPOINT["file_path"]:
+            msg = (
+                f"Export file '{fp}' is not the file in checkpoint {self.CHECKPOINT['file_path']!r}"
+            )
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if not fp.is_file() or fp.stat().st_size < offset:
+            msg = f"Export file '{fp}' is missing or smaller than checkpoint offset {offset}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._file_mode = "resumed"
+        self._fd_close = self.GETARGS.get("export_fd_close", True)
+        self._fd = fp.open(mode="r+", encoding="utf-8")
+        self._fd.seek(offset)
+        self._fd.truncate()
+        self.echo(msg=f"Exporting to file '{fp}' (resuming at offset {offset})")
+        return self._fd
+
+    def get_checkpoint(self) -> dict:
+        """Get the state needed to resume writing the output of this callbacks object.
+
+        Notes:
+            Pending tags are added or removed first, since they are not saved.
+        """
+        self.do_tagging()
+
+        checkpoint = {"cb_name": self.CB_NAME}
+        if getattr(self, "_file_path", None) and getattr(self, "_fd", None):
+            self._fd.flush()
+            checkpoint["file_path"] = str(self._file_path)
+            checkpoint["file_offset"] = self._fd.tell()
+        return checkpoint
+
     def open_fd_stdout(self):
         """Open a file descriptor to STDOUT."""
         self._file_path = None
@@ -655,6 +1080,11 @@ class Base:
             self.echo(msg=f"Finished exporting to {name!r}")
             self._fd.close()
 
+            if isinstance(self._fd, CompressedWriter):
+                ratio = calc_percent(part=self._fd.bytes_out, whole=self._fd.bytes_in)
+                msg = f"Compressed {self._fd.bytes_in} bytes to {self._fd.bytes_out} ({ratio}%)"
+                self.echo(msg=msg)
+
     def echo(
         self,
         msg: str,
@@ -696,17 +1126,86 @@ class Base:
         else:
             getattr(self.LOG, level)(msg)
 
-    def get_sub_schemas(self, schema: dict) -> Generator[dict, None, None]:
+    def get_sub_schemas(self, schema: dict) -> List[dict]:
         """Get all the schemas of sub fields for a complex field.
 
         Args:
             schema: schema of complex field
         """
-        sub_schemas = listify(schema.get("sub_fields"))
-        for sub_schema in sub_schemas:
-            if self.is_excluded(schema=sub_schema) or not sub_schema["is_root"]:
+        if not hasattr(self, "_sub_schemas"):
+            self._sub_schemas = {}
+
+        key = schema.get("name_qual")
+        if key not in self._sub_schemas:
+            self._sub_schemas[key] = [
+                x
+                for x in listify(schema.get("sub_fields"))
+                if x["is_root"] and not self.is_excluded(schema=x)
+            ]
+        return self._sub_schemas[key]
+
+    @property
+    def plan(self) -> dict:
+        """Get the callbacks, options, and field schemas to use for each row.
+
+        Notes:
+            Resolved once from GETARGS and :attr:`schemas_selected` so that processing a row
+            only does the work for the options that were actually supplied.
+        """
+        if hasattr(self, "_plan"):
+            return self._plan
+
+        getargs = self.GETARGS
+
+        callbacks = []
+        for cb in self.callbacks:
+            arg = self.CALLBACK_ARGS.get(cb.__name__, None)
+            if arg is None or getargs.get(arg, None):
+                callbacks.append(cb)
+
+        schemas = []
+        excludes = []
+        for schema in self.schemas_selected:
+            if self.is_excluded(schema=schema):
+                excludes.append((schema["name_qual"], []))
                 continue
-            yield sub_schema
+
+            schemas.append(schema)
+            if schema["is_complex"]:
+                sub_fields = listify(schema.get("sub_fields"))
+                sub_excludes = [x["name"] for x in sub_fields if self.is_excluded(schema=x)]
+                if sub_excludes:
+                    excludes.append((schema["name_qual"], sub_excludes))
+
+        explode = self.schema_to_explode
+        flatten = [x for x in schemas if x["is_complex"] and x != explode]
+        callbacks_removed = []
+        if self.do_delta in callbacks:
+            idx = callbacks.index(self.do_delta) + 1
+            callbacks_removed = callbacks[idx:]
+        explode_stream = (
+            getargs.get("field_explode_stream", False)
+            and self.do_explode_field in callbacks
+            and not self.is_excluded(schema=explode)
+        )
+
+        self._plan = {
+            "callbacks": callbacks,
+            "callbacks_removed": callbacks_removed,
+            "custom_cbs": listify(getargs.get("custom_cbs", [])),
+            "schemas": schemas,
+            "excludes": excludes,
+            "flatten": flatten,
+            "explode_stream": bool(explode_stream),
+            "null_value": getargs.get("field_null_value", None),
+            "join_value": str(getargs.get("field_join_value", FIELD_JOINER)),
+            "join_trim": coerce_int(getargs.get("field_join_trim", FIELD_TRIM_LEN)),
+            "software_whitelist": listify(getargs.get("report_software_whitelist", [])),
+            "titles": [
+                (x["column_title"], x["name_qual"], x["is_complex"]) for x in self.final_schemas
+            ],
+        }
+        return self._plan
 
     @property
     def custom_schemas(self) -> List[dict]:
@@ -716,6 +1215,8 @@ class Base:
             schemas += list(SCHEMAS_CUSTOM["report_adapters_missing"].values())
         if self.GETARGS.get("report_software_whitelist", False):
             schemas += list(SCHEMAS_CUSTOM["report_software_whitelist"].values())
+        if self.GETARGS.get("delta_manifest", None):
+            schemas += list(SCHEMAS_CUSTOM["delta"].values())
         return schemas
 
     @property
@@ -792,10 +1293,16 @@ class Base:
 
         all_schemas = self.ALL_SCHEMAS
 
-        if isinstance(self.ALL_SCHEMAS, dict):
+        if isinstance(self.ALL_SCHEMAS, Mapping):
+            # only load the schemas of the adapters that have fields selected
+            adapters = [AGG_ADAPTER_NAME]
+            for field in self.fields_selected:
+                if field.startswith("adapters_data."):
+                    adapters.append(strip_right(obj=field.split(".")[1], fix="_adapter"))
+
             all_schemas = []
-            for schemas in self.ALL_SCHEMAS.values():
-                all_schemas += schemas
+            for adapter in dict.fromkeys(adapters):
+                all_schemas += self.ALL_SCHEMAS.get(adapter, [])
 
         all_schemas_map = {x["name_qual"]: x for x in all_schemas}
 
@@ -869,6 +1376,7 @@ class Base:
             ("field_excludes", "Exclude fields:", []),
             ("field_flatten", "Flatten complex fields:", False),
             ("field_explode", "Explode field:", None),
+            ("field_explode_stream", "Explode field streaming:", False),
             ("field_titles", "Rename fields to titles:", False),
             ("field_join", "Join field values:", False),
             ("field_join_value", "Join field values using:", FIELD_JOINER),
@@ -877,10 +1385,15 @@ class Base:
             ("field_null_value", "Missing field value:", None),
             ("tags_add", "Add tags:", []),
             ("tags_remove", "Remove tags:", []),
+            ("tags_batch_size", "Tag assets in batches of:", None),
+            ("tags_workers", "Tag assets using threads:", LABELS_WORKERS),
             ("report_adapters_missing", "Report Missing Adapters:", False),
+            ("delta_manifest", "Delta manifest file:", None),
             ("export_file", "Export to file:", None),
             ("export_path", "Export file to path:", DEFAULT_PATH),
             ("export_overwrite", "Export overwrite file:", False),
+            ("export_compression", "Export compression:", None),
+            ("export_compression_level", "Export compression level:", None),
             ("export_schema", "Export schema:", False),
             ("page_progress", "Progress per row count:", 10000),
         ]
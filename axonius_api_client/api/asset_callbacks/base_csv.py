@@ -18,6 +18,9 @@ class Csv(Base):
     CB_NAME: str = "csv"
     """name for this callback"""
 
+    COMPRESS: bool = True
+    """this callback can compress the export file it writes to"""
+
     def _init(self, **kwargs):
         """Override defaults in GETARGS to make export readable."""
         self.GETARGS["field_null"] = True
@@ -41,22 +44,28 @@ class Csv(Base):
         dialect = self.GETARGS.get("csv_dialect", "excel")
         quote = self.GETARGS.get("csv_quoting", "nonnumeric")
         quote = getattr(csv, f"QUOTE_{quote.upper()}")
-
-        try:
-            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
-        except Exception:  # pragma: no cover
-            # only happens on windows sometimes
-            self.LOG.error("Unable to write UTF8 BOM!")
+        resume = self.CHECKPOINT and self.CHECKPOINT.get("file_path")
+        fieldnames = self.CHECKPOINT["fieldnames"] if resume else self.final_columns
 
         self._stream = csv.DictWriter(
             self._fd,
-            fieldnames=self.final_columns,
+            fieldnames=list(fieldnames),
             quoting=quote,
             lineterminator="\n",
             restval=restval,
             dialect=dialect,
             extrasaction=extras,
         )
+
+        if resume:
+            return
+
+        try:
+            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
+        except Exception:  # pragma: no cover
+            # only happens on windows sometimes
+            self.LOG.error("Unable to write UTF8 BOM!")
+
         self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
         self.do_export_schema()
 
@@ -70,13 +79,20 @@ class Csv(Base):
         self._fd.write("\n")
         self.close_fd()
 
+    def get_checkpoint(self) -> dict:
+        """Get the state needed to resume writing the output of this callbacks object."""
+        checkpoint = super(Csv, self).get_checkpoint()
+        stream = getattr(self, "_stream", None)
+        checkpoint["fieldnames"] = list(stream.fieldnames) if stream else self.final_columns
+        return checkpoint
+
     def write_rows(self, rows: Union[List[dict], dict]):
         """Write rows to the file descriptor.
 
         Args:
             rows: rows to process
         """
-        rows = listify(rows)
+        rows = self.iter_rows(rows=rows)
         for row in rows:
             self._stream.fieldnames += [x for x in row if x not in self._stream.fieldnames]
             self._stream.writerow(row)
@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
 """JSON export callbacks class."""
-import json
-import textwrap
 from typing import List, Optional, Tuple, Union
 
-from ...tools import listify
+from ...tools import json_dump, listify
 from .base import Base
 
 JSON_FLAT: bool = False
@@ -20,6 +18,9 @@ class Json(Base):
     CB_NAME: str = "json"
     """name for this callback"""
 
+    COMPRESS: bool = True
+    """this callback can compress the export file it writes to"""
+
     def start(self, **kwargs):
         """Start this callbacks object."""
         super(Json, self).start(**kwargs)
@@ -27,6 +28,11 @@ class Json(Base):
 
         self._first_row = True
         self.open_fd()
+
+        if self.CHECKPOINT and self.CHECKPOINT.get("file_path"):
+            self._first_row = self.CHECKPOINT["first_row"]
+            return
+
         begin = "" if flat else "["
         self._fd.write(begin)
 
@@ -40,6 +46,12 @@ class Json(Base):
         self._fd.write(end)
         self.close_fd()
 
+    def get_checkpoint(self) -> dict:
+        """Get the state needed to resume writing the output of this callbacks object."""
+        checkpoint = super(Json, self).get_checkpoint()
+        checkpoint["first_row"] = self._first_row
+        return checkpoint
+
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
 
@@ -60,7 +72,7 @@ class Json(Base):
         Args:
             rows: rows to process
         """
-        rows = listify(rows)
+        rows = self.iter_rows(rows=rows)
         flat = self.GETARGS.get("json_flat", JSON_FLAT)
 
         indent = None if flat else 2
@@ -75,8 +87,9 @@ class Json(Base):
             self._first_row = False
             self._fd.write(pre)
 
-            value = json.dumps(row, indent=indent)
-            value = textwrap.indent(value, prefix=prefix) if indent else value
+            value = json_dump(obj=row, indent=indent)
+            # json str values can not contain newlines, so this is the same as textwrap.indent
+            value = prefix + value.replace("\n", "\n" + prefix) if indent else value
             self._fd.write(value)
             del value, row
 
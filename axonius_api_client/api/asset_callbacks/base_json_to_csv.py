@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 """JSON to CSV export callbacks class."""
-import json
 import tempfile
-from typing import List, Union
+from typing import List, Optional, Union
 
-from ...tools import listify
+from ...tools import JSON_SEPARATORS, json_dump, json_load, listify
 from .base_csv import Csv
 
 
@@ -18,6 +17,14 @@ class JsonToCsv(Csv):
     CB_NAME: str = "json_to_csv"
     """name for this callback"""
 
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
+    @property
+    def row_copy(self) -> Optional[str]:
+        """Rows are written to the temporary file as is and re-read before they are changed."""
+        return None
+
     def start(self, **kwargs):
         """Start this callbacks object."""
         super(Csv, self).start(**kwargs)
@@ -33,8 +40,8 @@ class JsonToCsv(Csv):
         self.echo(msg="Re-reading temporary file and converting to CSV")
         self._temp_file.file.seek(0)
 
-        for line in self._temp_file.file.readlines():
-            row = json.loads(line.strip())
+        for line in self._temp_file.file:
+            row = json_load(obj=line)
             rows = listify(row)
             rows = self.do_pre_row(rows=rows)
             rows = self.do_row(rows=rows)
@@ -56,7 +63,7 @@ class JsonToCsv(Csv):
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
         for row in rows:
-            value = json.dumps(row)
+            value = json_dump(obj=row, indent=None, separators=JSON_SEPARATORS)
             self._temp_file.file.write(f"{value}\n")
             del row, value
 
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Multiple export callbacks class."""
+from collections import ChainMap
+from typing import Any, Generator, List, Optional, Tuple, Union
+
+from ...constants import DEFAULT_PATH, LABELS_WORKERS
+from ...exceptions import ApiError
+from ...tools import get_path, listify
+from .base import Base
+from .tools import get_callbacks_cls
+
+
+class Multi(Base):
+    """Multiple export callbacks class.
+
+    Notes:
+        Created by :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+        when ``export`` is a list of exports, so that the assets are fetched once and each row
+        is handed to every export. Each export is the name of an export, or a dict with the
+        name of an export under ``export`` and the GETARGS to use for that export, which
+        override the GETARGS supplied to the get assets method.
+
+        Assets are tagged once by this object instead of by each export. A row is only copied
+        for the exports whose callbacks change the rows they are given, see
+        :attr:`Base.row_copy`.
+    """
+
+    CB_NAME: str = "multi"
+    """name for this callback"""
+
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
+    MULTI_ARGS: List[str] = [
+        "export_sinks",
+        "tags_add",
+        "tags_remove",
+        "tags_batch_size",
+        "tags_workers",
+        "page_progress",
+    ]
+    """GETARGS used by this object instead of being passed to each export"""
+
+    UNIQUE_ARGS: List[str] = ["export_file", "delta_manifest"]
+    """GETARGS that can not be the same for more than one export"""
+
+    def _init(self):
+        """Split GETARGS into the args of this object and the exports created from them."""
+        getargs = self.GETARGS
+        self.GETARGS = {k: getargs[k] for k in self.MULTI_ARGS if k in getargs}
+
+        shared = {k: v for k, v in getargs.items() if k not in self.MULTI_ARGS}
+        shared["page_progress"] = None
+
+        self.SINKS: List[Base] = [
+            self.get_sink(spec=spec, getargs=shared)
+            for spec in listify(getargs.get("export_sinks", []))
+        ]
+        """callbacks objects of each export"""
+
+        if not self.SINKS:
+            msg = "Must supply at least one export in export_sinks"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self.check_unique()
+
+    def get_sink(self, spec: Union[str, dict], getargs: dict) -> Base:
+        """Create the callbacks object of an export.
+
+        Args:
+            spec: name of export, or dict with the name of an export under ``export`` and the
+                GETARGS to use for it
+            getargs: GETARGS shared by all exports
+        """
+        spec = {"export": spec} if isinstance(spec, str) else spec
+        if not isinstance(spec, dict) or not isinstance(spec.get("export", None), str):
+            msg = f"Export {spec!r} must be a str or a dict with an 'export' key"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        spec = dict(spec)
+        callbacks_cls = get_callbacks_cls(export=spec.pop("export"))
+
+        state = ChainMap({"rows_processed_total": self.rows_processed_total}, self.STATE)
+        return callbacks_cls(
+            apiobj=self.APIOBJ, store=self.STORE, state=state, getargs={**getargs, **spec}
+        )
+
+    def check_unique(self):
+        """Check that no two exports write to the same file."""
+        for arg in self.UNIQUE_ARGS:
+            seen = {}
+            for sink in self.SINKS:
+                value = sink.GETARGS.get(arg, None)
+
+                if arg == "export_file":
+                    if sink.CB_NAME == "base" or sink.GETARGS.get("export_fd", None):
+                        continue
+                    path = sink.GETARGS.get("export_path", DEFAULT_PATH)
+                    value = str(get_path(obj=path) / value) if value else "STDOUT"
+                elif value:
+                    value = str(get_path(obj=value))
+                else:
+                    continue
+
+                if value in seen:
+                    msg = f"Exports {seen[value]} and {sink} can not use the same {arg} {value!r}"
+                    self.echo(msg=msg, error=ApiError, level="error")
+                seen[value] = sink
+
+    def start(self, **kwargs):
+        """Start this callbacks object and each export."""
+        super(Multi, self).start(**kwargs)
+        for sink in self.SINKS:
+            sink.start(**kwargs)
+
+        self._sink_copies = [(sink, sink.row_copy) for sink in self.SINKS]
+        copies = ", ".join(f"{sink}: {copy}" for sink, copy in self._sink_copies)
+        self.echo(msg=f"Row copies per export: {copies}")
+
+    def stop(self, **kwargs):
+        """Stop each export, then tag the assets and stop this callbacks object."""
+        for sink in self.SINKS:
+            sink.stop(**kwargs)
+
+        super(Multi, self).stop(**kwargs)
+
+    def echo_columns(self, **kwargs):
+        """Columns are echoed by each export."""
+        pass
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Hand the current row to each export, copying it for exports that change it.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+
+        for sink, copy in self._sink_copies:
+            sink_rows = self.copy_rows(rows=rows, copy=copy)
+            for _ in sink.iter_rows(rows=sink.process_row(row=sink_rows)):
+                pass
+
+        del rows, row
+        return row_return
+
+    @property
+    def callbacks(self) -> list:
+        """Get order of callbacks to run."""
+        return [self.process_tags_to_add, self.process_tags_to_remove]
+
+    def process_delta_removed(self) -> Generator[dict, None, None]:
+        """Process the rows of removed assets of each export that has a delta manifest.
+
+        Notes:
+            An asset removed from the exports of more than one delta manifest is only
+            returned once.
+        """
+        seen = {}
+        for sink in self.SINKS:
+            removed = sink.delta_removed
+            for _ in sink.process_delta_removed():
+                pass
+
+            for asset_id in removed:
+                if asset_id not in seen:
+                    seen[asset_id] = None
+                    yield {"internal_axon_id": asset_id}
+
+    @property
+    def rows_processed_total(self) -> int:
+        """Get the number of rows processed so far."""
+        return self.STATE.get("rows_processed_total", 0) or 0
+
+    @classmethod
+    def copy_rows(cls, rows: List[dict], copy: Optional[str]) -> List[dict]:
+        """Copy rows so that an export can change them.
+
+        Args:
+            rows: rows to copy
+            copy: None to not copy, shallow to copy the top level of each row, or deep to copy
+                every dict and list in each row
+        """
+        if copy == "deep":
+            return [cls.copy_value(value=row) for row in rows]
+        if copy == "shallow":
+            return [dict(row) for row in rows]
+        return rows
+
+    @classmethod
+    def copy_value(cls, value: Any) -> Any:
+        """Copy every dict and list in a value, leaving all other values as is.
+
+        Args:
+            value: value to copy
+        """
+        if isinstance(value, dict):
+            return {k: cls.copy_value(value=v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls.copy_value(value=v) for v in value]
+        return value
+
+    @classmethod
+    def args_map(cls) -> List[Tuple[str, str, Optional[Union[list, bool, str, int]]]]:
+        """Argument maps specific to this callbacks class."""
+        return [
+            ("tags_add", "Add tags:", []),
+            ("tags_remove", "Remove tags:", []),
+            ("tags_batch_size", "Tag assets in batches of:", None),
+            ("tags_workers", "Tag assets using threads:", LABELS_WORKERS),
+            ("page_progress", "Progress per row count:", 10000),
+        ]
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        sinks = ", ".join(str(x) for x in getattr(self, "SINKS", []))
+        return f"{self.CB_NAME.upper()} processor ({sinks})"
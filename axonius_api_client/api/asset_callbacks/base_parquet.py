@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""Parquet and Arrow IPC export callbacks classes."""
+import datetime
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from ...constants import (
+    ARROW_COMPRESSION,
+    FIELD_JOINER,
+    PARQUET_COMPRESSION,
+    PARQUET_ROW_GROUP_SIZE,
+)
+from ...exceptions import ApiError
+from ...tools import coerce_int, dt_parse, json_dump, listify
+from .base import Base
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class Parquet(Base):
+    """Parquet export callbacks class.
+
+    Notes:
+        See :meth:`args_map` for the arguments this callbacks class.
+
+        The columns are typed using the normalized type of each field schema in
+        :attr:`final_schemas`. Rows are buffered per column and written as a row group every
+        ``parquet_row_group_size`` rows, so only one row group is held in memory at a time.
+        Values that can not be converted to the type of their column are written as null.
+    """
+
+    CB_NAME: str = "parquet"
+    """name for this callback"""
+
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
+    FILE_EXT: str = ".parquet"
+    """extension to add to export_file"""
+
+    def _init(self, **kwargs):
+        """Override defaults in GETARGS to produce typed columns."""
+        self.GETARGS["field_null"] = True
+        self.GETARGS["field_flatten"] = True
+        self.GETARGS["field_join"] = False
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Parquet, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Create the writer for the export file."""
+        if pyarrow is None:  # pragma: no cover
+            msg = (
+                f"Must install pyarrow for {self.CB_NAME} export: "
+                "pip install axonius_api_client[parquet]"
+            )
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        export_file = self.GETARGS.get("export_file", None)
+        if export_file:
+            if not str(export_file).endswith(self.FILE_EXT):
+                self.GETARGS["export_file"] = f"{export_file}{self.FILE_EXT}"
+            self.open_fd_path()
+            self._fd.close()
+        else:
+            msg = "Must supply export_file for this export method"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self._columns = [
+            self.get_column(name=name, schema=schema)
+            for name, schema in zip(self.final_columns, self.final_schemas)
+        ]
+        self._arrow_schema = pyarrow.schema([x[1] for x in self._columns])
+        self._buffers = [[] for _ in self._columns]
+        self._buffered = 0
+        self._rows_written = 0
+        self._values_nulled = 0
+        self._writer = self.open_writer()
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Parquet, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Write the buffered rows and close the writer."""
+        self.write_buffers()
+        self.close_writer()
+
+        if self._values_nulled:
+            msg = f"Wrote {self._values_nulled} values that could not be converted as null"
+            self.echo(msg=msg, warning=True)
+        self.echo(msg=f"Wrote {self._rows_written} rows to '{self._file_path}'")
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Buffer the values of each row per column, writing a row group when the buffers
+        are full.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+
+        for row in self.iter_rows(rows=rows):
+            for buffer, (name, field, convert) in zip(self._buffers, self._columns):
+                buffer.append(convert(row.get(name, None)))
+
+            self._buffered += 1
+            if self._buffered >= self.row_group_size:
+                self.write_buffers()
+            del row
+
+        del rows
+
+        return row_return
+
+    def write_buffers(self):
+        """Write the buffered rows as a row group and empty the buffers."""
+        if not self._buffered:
+            return
+
+        arrays = [
+            self.get_array(values=buffer, field=field)
+            for buffer, (name, field, convert) in zip(self._buffers, self._columns)
+        ]
+        table = pyarrow.Table.from_arrays(arrays, schema=self._arrow_schema)
+        self.write_table(table=table)
+
+        self._rows_written += self._buffered
+        self._buffers = [[] for _ in self._columns]
+        self._buffered = 0
+
+    def get_array(self, values: list, field: "pyarrow.Field") -> "pyarrow.Array":
+        """Convert the buffered values of a column to an array.
+
+        Args:
+            values: buffered values of the column
+            field: arrow field of the column
+
+        Notes:
+            If the values can not be converted as a whole, each value is converted on its own
+            and the values that fail are set to null.
+        """
+        try:
+            return pyarrow.array(values, type=field.type)
+        except (pyarrow.ArrowException, TypeError, ValueError, OverflowError):
+            pass
+
+        checked = []
+        for value in values:
+            try:
+                pyarrow.scalar(value, type=field.type)
+            except (pyarrow.ArrowException, TypeError, ValueError, OverflowError):
+                self._values_nulled += 1
+                value = None
+            checked.append(value)
+        return pyarrow.array(checked, type=field.type)
+
+    def get_column(self, name: str, schema: dict) -> Tuple[str, "pyarrow.Field", Callable]:
+        """Get the arrow field and value converter for a column.
+
+        Args:
+            name: name of the column
+            schema: field schema of the column
+
+        Notes:
+            Sub fields of complex fields that were flattened hold a list of the values of every
+            item of the complex field, sub fields of the exploded field hold a single value.
+        """
+        type_norm = schema.get("type_norm") or "string"
+        parent = schema.get("parent", "root")
+        explode = self.schema_to_explode.get("name_qual", None)
+
+        is_list = schema.get("is_list", False) or type_norm.startswith(("array_", "list_"))
+        if parent not in ["root", explode]:
+            is_list = True
+
+        arrow_type, convert = self.get_type(type_norm=type_norm)
+        metadata = {
+            "name_qual": schema["name_qual"],
+            "column_title": schema["column_title"],
+            "type_norm": type_norm,
+        }
+
+        if is_list:
+            arrow_type = pyarrow.list_(arrow_type)
+            convert = self.get_list_converter(convert=convert)
+        else:
+            convert = self.get_scalar_converter(
+                convert=convert, join=arrow_type == pyarrow.string()
+            )
+
+        field = pyarrow.field(name, arrow_type, nullable=True, metadata=metadata)
+        return name, field, convert
+
+    def get_type(self, type_norm: str) -> Tuple["pyarrow.DataType", Callable]:
+        """Get the arrow type and value converter for the items of a normalized field type.
+
+        Args:
+            type_norm: normalized type of a field schema
+        """
+        if "object" in type_norm:
+            return pyarrow.string(), self.convert_json
+        if "datetime" in type_norm:
+            return pyarrow.timestamp("us", tz="UTC"), self.convert_datetime
+        if "boolean" in type_norm:
+            return pyarrow.bool_(), self.convert_value
+        if "integer" in type_norm:
+            return pyarrow.int64(), self.convert_value
+        if "number" in type_norm:
+            return pyarrow.float64(), self.convert_value
+        return pyarrow.string(), self.convert_string
+
+    def get_list_converter(self, convert: Callable) -> Callable:
+        """Get a value converter for a list column.
+
+        Args:
+            convert: converter for the items of the list
+        """
+
+        def convert_list(value: Any) -> Optional[list]:
+            if value is None:
+                return None
+            return [convert(x) for x in listify(value)]
+
+        return convert_list
+
+    def get_scalar_converter(self, convert: Callable, join: bool) -> Callable:
+        """Get a value converter for a column that is not a list.
+
+        Args:
+            convert: converter for the value
+            join: join lists with more than one item using field_join_value, else set them to
+                null
+        """
+        joiner = str(self.GETARGS.get("field_join_value", FIELD_JOINER))
+
+        def convert_scalar(value: Any) -> Any:
+            if isinstance(value, list):
+                if len(value) == 1:
+                    value = value[0]
+                elif not value:
+                    return None
+                elif join:
+                    return joiner.join(convert(x) or "" for x in value)
+                else:
+                    self._values_nulled += 1
+                    return None
+            return convert(value)
+
+        return convert_scalar
+
+    @staticmethod
+    def convert_value(value: Any) -> Any:
+        """Convert a boolean or numeric value (arrow does the actual conversion)."""
+        return value
+
+    @staticmethod
+    def convert_string(value: Any) -> Optional[str]:
+        """Convert a value to a string."""
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (dict, list)):
+            return json_dump(obj=value, indent=None)
+        return str(value)
+
+    @staticmethod
+    def convert_json(value: Any) -> Optional[str]:
+        """Convert an object to a json string."""
+        if value is None or isinstance(value, str):
+            return value
+        return json_dump(obj=value, indent=None)
+
+    def convert_datetime(self, value: Any) -> Optional[datetime.datetime]:
+        """Convert a value to a datetime, or null if it can not be parsed."""
+        if value is None or isinstance(value, datetime.datetime):
+            return value
+        try:
+            return dt_parse(obj=value)
+        except Exception:
+            self._values_nulled += 1
+            return None
+
+    @property
+    def row_group_size(self) -> int:
+        """Get the number of rows to buffer before writing a row group."""
+        value = self.GETARGS.get("parquet_row_group_size", None)
+        return max(1, coerce_int(value or PARQUET_ROW_GROUP_SIZE))
+
+    @property
+    def compression(self) -> Optional[str]:
+        """Get the compression codec to use."""
+        value = self.GETARGS.get("parquet_compression", None) or PARQUET_COMPRESSION
+        return None if str(value).lower() == "none" else str(value).lower()
+
+    def open_writer(self):
+        """Open the parquet writer for the export file."""
+        level = self.GETARGS.get("parquet_compression_level", None)
+        return pyarrow.parquet.ParquetWriter(
+            str(self._file_path),
+            self._arrow_schema,
+            compression=self.compression or "none",
+            compression_level=coerce_int(level) if level is not None else None,
+        )
+
+    def write_table(self, table: "pyarrow.Table"):
+        """Write a table of buffered rows as a row group.
+
+        Args:
+            table: buffered rows
+        """
+        self._writer.write_table(table, row_group_size=table.num_rows)
+
+    def close_writer(self):
+        """Close the writer."""
+        self._writer.close()
+
+    @classmethod
+    def args_map(cls) -> List[Tuple[str, str, Optional[Union[list, bool, str, int]]]]:
+        """Argument maps specific to this callbacks class."""
+        args = super(Parquet, cls).args_map()
+        return args + [
+            ("parquet_compression", "Parquet compression:", PARQUET_COMPRESSION),
+            ("parquet_compression_level", "Parquet compression level:", None),
+            ("parquet_row_group_size", "Parquet rows per row group:", PARQUET_ROW_GROUP_SIZE),
+        ]
+
+
+class Arrow(Parquet):
+    """Arrow IPC file export callbacks class.
+
+    Notes:
+        See :meth:`args_map` for the arguments this callbacks class.
+
+        Columns are typed the same as :obj:`Parquet`, the buffered rows are written as a
+        record batch every ``arrow_batch_size`` rows.
+    """
+
+    CB_NAME: str = "arrow"
+    """name for this callback"""
+
+    FILE_EXT: str = ".arrow"
+    """extension to add to export_file"""
+
+    @property
+    def row_group_size(self) -> int:
+        """Get the number of rows to buffer before writing a record batch."""
+        value = self.GETARGS.get("arrow_batch_size", None)
+        return max(1, coerce_int(value or PARQUET_ROW_GROUP_SIZE))
+
+    @property
+    def compression(self) -> Optional[str]:
+        """Get the compression codec to use."""
+        value = self.GETARGS.get("arrow_compression", None) or ARROW_COMPRESSION
+        return None if str(value).lower() == "none" else str(value).lower()
+
+    def open_writer(self):
+        """Open the arrow IPC file writer for the export file."""
+        self._sink = pyarrow.OSFile(str(self._file_path), "wb")
+        options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+        return pyarrow.ipc.new_file(self._sink, self._arrow_schema, options=options)
+
+    def write_table(self, table: "pyarrow.Table"):
+        """Write a table of buffered rows as a record batch.
+
+        Args:
+            table: buffered rows
+        """
+        self._writer.write_table(table, max_chunksize=table.num_rows)
+
+    def close_writer(self):
+        """Close the writer and the export file."""
+        self._writer.close()
+        self._sink.close()
+
+    @classmethod
+    def args_map(cls) -> List[Tuple[str, str, Optional[Union[list, bool, str, int]]]]:
+        """Argument maps specific to this callbacks class."""
+        args = super(Parquet, cls).args_map()
+        return args + [
+            ("arrow_compression", "Arrow compression:", ARROW_COMPRESSION),
+            ("arrow_batch_size", "Arrow rows per record batch:", PARQUET_ROW_GROUP_SIZE),
+        ]
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""SQLite export callbacks class."""
+import re
+import sqlite3
+from typing import Any, List, Optional, Tuple, Union
+
+from ...constants import DEFAULT_PATH, SQLITE_BATCH_SIZE
+from ...exceptions import ApiError
+from ...tools import coerce_int, get_path, json_dump, listify
+from .base import Base
+
+
+class Sqlite(Base):
+    """SQLite export callbacks class.
+
+    Notes:
+        See :meth:`args_map` for the arguments this callbacks class.
+
+        Simple fields are written as columns of the main table, named after the asset type
+        unless ``sqlite_table`` is supplied. Each complex field (i.e. installed software) is
+        written to a child table with one row per item of the field, linked to the main table
+        by ``internal_axon_id``. Complex fields are never flattened or exploded.
+
+        Rows are inserted in batches of ``sqlite_batch_size`` inside of a single transaction
+        and the indexes are built after all rows are inserted. With ``sqlite_upsert``, the
+        rows of assets that already exist in the tables are replaced instead.
+    """
+
+    CB_NAME: str = "sqlite"
+    """name for this callback"""
+
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
+    FILE_EXT: str = ".sqlite"
+    """extension to add to export_file"""
+
+    ID_COLUMN: str = "internal_axon_id"
+    """column of child tables that links them to the main table"""
+
+    INDEX_COLUMN: str = "item_index"
+    """column of child tables with the position of the item in the complex field"""
+
+    TYPES: List[Tuple[str, str]] = [
+        ("boolean", "INTEGER"),
+        ("integer", "INTEGER"),
+        ("number", "REAL"),
+    ]
+    """normalized field types and the SQLite column type to use for them, TEXT if no match"""
+
+    def _init(self, **kwargs):
+        """Override defaults in GETARGS to write complex fields to child tables."""
+        self.GETARGS["field_null"] = True
+        self.GETARGS["field_flatten"] = False
+        self.GETARGS["field_explode"] = ""
+        self.GETARGS["field_join"] = False
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Sqlite, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Connect to the export file and create the tables."""
+        export_file = self.GETARGS.get("export_file", None)
+        if not export_file:
+            msg = "Must supply export_file for this export method"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        if not str(export_file).endswith(self.FILE_EXT):
+            self.GETARGS["export_file"] = f"{export_file}{self.FILE_EXT}"
+
+        if self.upsert:
+            self.open_db_path()
+        else:
+            self.open_fd_path()
+            self._fd.close()
+
+        self._tables = self.get_tables()
+        columns = [x[0] for x in self._tables[0]["columns"]]
+        self._index_columns = [
+            self.find_column(field=x, columns=columns)
+            for x in listify(self.GETARGS.get("sqlite_indexes", []))
+        ]
+
+        self._conn = sqlite3.connect(str(self._file_path), isolation_level=None)
+        self._conn.execute("BEGIN")
+        for table in self._tables:
+            self.create_table(table=table)
+
+        if self.upsert:
+            self.create_indexes()
+
+        self._buffered = 0
+        self._rows_written = 0
+
+    def open_db_path(self):
+        """Resolve the path of an export file that will be updated instead of overwritten."""
+        self._export_file = self.GETARGS.get("export_file", None)
+        self._export_path = self.GETARGS.get("export_path", DEFAULT_PATH)
+
+        file_path = get_path(obj=self._export_path)
+        file_path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._file_path = fp = (file_path / self._export_file).resolve()
+
+        self._file_mode = "updated" if fp.exists() else "created"
+        self.echo(msg=f"Exporting to file '{fp}' ({self._file_mode[:-1]}ing)")
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Sqlite, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Insert the buffered rows, build the indexes, and commit."""
+        self.write_buffers()
+
+        if not self.upsert:
+            self.create_indexes()
+
+        self._conn.execute("COMMIT")
+        self._conn.close()
+
+        tables = ", ".join(f"{x['name']}={x['count']}" for x in self._tables)
+        self.echo(msg=f"Wrote {self._rows_written} rows to '{self._file_path}' ({tables})")
+
+    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
+        """Buffer the values of each row per table, inserting them when the buffers are full.
+
+        Args:
+            row: row to process
+        """
+        rows = listify(row)
+        rows = self.do_pre_row(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+
+        main = self._tables[0]
+        for row, ret in zip(self.iter_rows(rows=rows), row_return):
+            asset_id = ret["internal_axon_id"]
+            main["buffer"].append([self.convert(row.get(x, None)) for x in main["keys"]])
+
+            for table in self._tables[1:]:
+                items = listify(row.get(table["key"], None))
+                for idx, item in enumerate(items):
+                    item = item if isinstance(item, dict) else {}
+                    values = [self.convert(item.get(x, None)) for x in table["keys"]]
+                    table["buffer"].append([asset_id, idx] + values)
+                table["ids"].append((asset_id,))
+
+            self._buffered += 1
+            if self._buffered >= self.batch_size:
+                self.write_buffers()
+            del row
+
+        del rows
+
+        return row_return
+
+    def write_buffers(self):
+        """Insert the buffered rows of each table and empty the buffers."""
+        if not self._buffered:
+            return
+
+        verb = "INSERT OR REPLACE" if self.upsert else "INSERT"
+        for table in self._tables:
+            name = self.quote(table["name"])
+            if self.upsert and table["ids"]:
+                sql = f"DELETE FROM {name} WHERE {self.quote(self.ID_COLUMN)} = ?"
+                self._conn.executemany(sql, table["ids"])
+
+            if table["buffer"]:
+                columns = ", ".join(self.quote(x[0]) for x in table["columns"])
+                marks = ", ".join("?" for _ in table["columns"])
+                sql = f"{verb} INTO {name} ({columns}) VALUES ({marks})"
+                self._conn.executemany(sql, table["buffer"])
+
+            table["count"] += len(table["buffer"])
+            table["buffer"] = []
+            table["ids"] = []
+
+        self._rows_written += self._buffered
+        self._buffered = 0
+
+    def get_tables(self) -> List[dict]:
+        """Get the tables to create from :attr:`final_schemas`.
+
+        Notes:
+            The first table is the main table.
+        """
+        name = self.table_name
+        main = {"name": name, "columns": [], "keys": [], "key": None, "id": None}
+        tables = [main]
+
+        for column, schema in zip(self.final_columns, self.final_schemas):
+            if schema["name_qual"] == "internal_axon_id":
+                main["id"] = column
+
+            if not schema["is_complex"]:
+                main["columns"].append((column, self.get_sql_type(schema=schema)))
+                main["keys"].append(column)
+                continue
+
+            sub_schemas = self.get_sub_schemas(schema=schema)
+            child = {
+                "name": f"{name}_{re.sub(r'[^0-9a-zA-Z]+', '_', schema['name_qual'])}",
+                "columns": [(self.ID_COLUMN, "TEXT"), (self.INDEX_COLUMN, "INTEGER")],
+                "keys": [x["name"] for x in sub_schemas],
+                "key": column,
+            }
+            child["columns"] += [(x["name"], self.get_sql_type(schema=x)) for x in sub_schemas]
+            tables.append(child)
+
+        for table in tables:
+            table.update({"buffer": [], "ids": [], "count": 0})
+        return tables
+
+    def get_sql_type(self, schema: dict) -> str:
+        """Get the SQLite column type for a field schema.
+
+        Args:
+            schema: field schema
+
+        Notes:
+            Lists and objects are stored as json strings.
+        """
+        type_norm = schema.get("type_norm") or "string"
+        if schema.get("is_list", False) or "object" in type_norm:
+            return "TEXT"
+
+        for check, sql_type in self.TYPES:
+            if check in type_norm:
+                return sql_type
+        return "TEXT"
+
+    def create_table(self, table: dict):
+        """Create a table if it does not exist and add any columns it is missing.
+
+        Args:
+            table: table from :meth:`get_tables`
+        """
+        name = self.quote(table["name"])
+        columns = ", ".join(f"{self.quote(x)} {y}" for x, y in table["columns"])
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {name} ({columns})")
+
+        existing = [x[1] for x in self._conn.execute(f"PRAGMA table_info({name})")]
+        for column, sql_type in table["columns"]:
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE {name} ADD COLUMN {self.quote(column)} {sql_type}")
+
+    def create_indexes(self):
+        """Create the indexes on internal_axon_id of each table and on sqlite_indexes."""
+        main = self._tables[0]
+        if main["id"]:
+            self.create_index(table=main["name"], column=main["id"], unique=True)
+
+        for table in self._tables[1:]:
+            self.create_index(table=table["name"], column=self.ID_COLUMN)
+
+        for column in self._index_columns:
+            self.create_index(table=main["name"], column=column)
+
+    def create_index(self, table: str, column: str, unique: bool = False):
+        """Create an index on a column of a table if it does not exist.
+
+        Args:
+            table: name of table
+            column: name of column
+            unique: create a unique index
+        """
+        name = f"ix_{table}_{re.sub(r'[^0-9a-zA-Z]+', '_', column)}"
+        unique = "UNIQUE " if unique else ""
+        self._conn.execute(
+            f"CREATE {unique}INDEX IF NOT EXISTS {self.quote(name)} "
+            f"ON {self.quote(table)} ({self.quote(column)})"
+        )
+
+    def find_column(self, field: str, columns: List[str]) -> str:
+        """Find the column of the main table for a field to index.
+
+        Args:
+            field: name of field as name, name_qual, column_title, or name_base
+            columns: columns of the main table
+        """
+        for schema, column in zip(self.final_schemas, self.final_columns):
+            if column in columns and any(schema.get(x) == field for x in self.FIND_KEYS):
+                return column
+
+        msg = f"Index field {field!r} not found, valid fields: {columns}"
+        self.echo(msg=msg, error=ApiError, level="error")
+
+    @staticmethod
+    def quote(name: str) -> str:
+        """Quote a table or column name."""
+        return '"{}"'.format(str(name).replace('"', '""'))
+
+    @staticmethod
+    def convert(value: Any) -> Any:
+        """Convert a value to a type SQLite supports."""
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if isinstance(value, (dict, list, tuple)):
+            return json_dump(obj=value, indent=None)
+        return str(value)
+
+    @property
+    def upsert(self) -> bool:
+        """Get if rows of assets that already exist should be replaced."""
+        return bool(self.GETARGS.get("sqlite_upsert", False))
+
+    @property
+    def batch_size(self) -> int:
+        """Get the number of rows to buffer before inserting them."""
+        value = self.GETARGS.get("sqlite_batch_size", None)
+        return max(1, coerce_int(value or SQLITE_BATCH_SIZE))
+
+    @property
+    def table_name(self) -> str:
+        """Get the name of the main table."""
+        value = self.GETARGS.get("sqlite_table", None)
+        return value or self.APIOBJ.router.OBJ_TYPE
+
+    @classmethod
+    def args_map(cls) -> List[Tuple[str, str, Optional[Union[list, bool, str, int]]]]:
+        """Argument maps specific to this callbacks class."""
+        args = super(Sqlite, cls).args_map()
+        return args + [
+            ("sqlite_table", "SQLite main table:", None),
+            ("sqlite_upsert", "SQLite replace existing assets:", False),
+            ("sqlite_indexes", "SQLite index fields:", []),
+            ("sqlite_batch_size", "SQLite rows per batch:", SQLITE_BATCH_SIZE),
+        ]
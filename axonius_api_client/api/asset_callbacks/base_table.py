@@ -20,6 +20,9 @@ class Table(Base):
     CB_NAME: str = "table"
     """name for this callback"""
 
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
     def _init(self):
         """Override defaults in GETARGS to make table export readable."""
         self.GETARGS["field_null"] = True
@@ -73,7 +76,7 @@ class Table(Base):
         rows = listify(row)
         rows = self.do_pre_row(rows=rows)
         self.check_stop()
-        rows = self.do_row(rows=rows)
+        rows = list(self.iter_rows(rows=self.do_row(rows=rows)))
         # TBD textwrap key/values
         self._rows += rows
         return rows
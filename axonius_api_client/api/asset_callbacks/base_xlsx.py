@@ -19,6 +19,9 @@ class Xlsx(Base):
     CB_NAME: str = "xlsx"
     """name for this callback"""
 
+    CHECKPOINTS: bool = False
+    """this callback can resume writing its output from a checkpoint"""
+
     CELL_FORMAT: dict = {"text_wrap": True}
     """Excel cell formatting to use for every cell"""
 
@@ -78,7 +81,7 @@ class Xlsx(Base):
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
 
-        for row in listify(rows):
+        for row in self.iter_rows(rows=rows):
             for idx, column_name in enumerate(self.final_columns):
                 self._worksheet.write(
                     self._rowtracker, idx, row.get(column_name), self._cell_format
@@ -7,6 +7,8 @@ from .base import Base
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_parquet import Arrow, Parquet
+from .base_sqlite import Sqlite
 from .base_table import Table
 from .base_xlsx import Xlsx
 
@@ -20,6 +22,9 @@ CALLBACKS_MAP: Dict[str, Base] = {
     "base": Base,
     "json_to_csv": JsonToCsv,
     "xlsx": Xlsx,
+    "parquet": Parquet,
+    "arrow": Arrow,
+    "sqlite": Sqlite,
 }
 
 
@@ -1,15 +1,40 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import asyncio
+import collections
+import concurrent.futures
 import datetime
+import functools
+import json
 import math
+import os
+import pathlib
+import queue
+import tempfile
+import threading
 import time
-from typing import Generator, List, Optional, Union
-
-from ...constants import MAX_PAGE_SIZE, PAGE_SIZE
-from ...exceptions import ApiError, JsonError, NotFoundError
-from ...tools import dt_now, dt_parse_tmpl, dt_sec_ago, json_dump, listify
+from typing import AsyncGenerator, Generator, List, Optional, Tuple, Union
+
+from ...constants import (
+    FIELDS_CACHE_PATH,
+    FIELDS_CACHE_TTL,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    STREAM_CHUNK_SIZE,
+)
+from ...exceptions import ApiError, JsonError, JsonInvalid, NotFoundError
+from ...tools import (
+    dt_now,
+    dt_parse_tmpl,
+    dt_sec_ago,
+    get_path,
+    json_dump,
+    json_load,
+    json_stream_object,
+    listify,
+)
 from ..adapters import Adapters
-from ..asset_callbacks import Base, get_callbacks_cls
+from ..asset_callbacks import Base, Multi, get_callbacks_cls
 from ..mixins import ModelMixins
 from ..wizard import Wizard, WizardCsv, WizardText
 from .fields import Fields
@@ -50,6 +75,21 @@ class AssetMixin(ModelMixins):
     ]
     """Pass."""
 
+    CHECKPOINT_STATE_KEYS: List[str] = [
+        "use_cursor",
+        "page_cursor",
+        "page_number",
+        "pages_to_fetch_total",
+        "rows_to_fetch_total",
+        "rows_fetched_total",
+        "rows_processed_total",
+        "fetch_seconds_total",
+    ]
+    """Keys of the paging state saved to a checkpoint file by :meth:`get_generator`."""
+
+    AGET_UNSUPPORTED: List[str] = ["workers", "prefetch_pages", "stream"]
+    """Arguments of :meth:`get_generator` that :meth:`aget` does not support."""
+
     @property
     def fields_default(self) -> List[dict]:
         """Fields to add to all get calls for this asset type."""
@@ -109,15 +149,42 @@ class AssetMixin(ModelMixins):
         page_start: int = 0,
         page_sleep: int = 0,
         use_cursor: bool = True,
-        export: Optional[str] = None,
+        export: Optional[Union[str, List[Union[str, dict]]]] = None,
         include_details: bool = False,
         sort_field: Optional[str] = None,
         sort_descending: bool = False,
         history_date: Optional[Union[str, datetime.datetime]] = None,
+        workers: int = 0,
+        workers_ordered: bool = True,
+        prefetch_pages: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[Union[str, pathlib.Path]] = None,
+        resume: bool = False,
         **kwargs,
     ) -> Generator[dict, None, None]:
         """Get an iterator of objects for a given query using paging.
 
+        Notes:
+            If workers is greater than 1, the first page is fetched to get the total number of
+            assets, then the rest of the pages are fetched in parallel using skip/limit paging
+            (use_cursor is ignored). Since the pages are not fetched using a DB cursor, assets
+            that are added or removed while the pages are being fetched may be missed or
+            returned twice.
+
+            If prefetch_pages is supplied (and workers is not), a background thread fetches up
+            to N pages ahead while the rows of the current page are being processed by the
+            callbacks, blocking once N fetched pages are waiting to be processed.
+
+            If stream is True (and workers and prefetch_pages are not), the assets of each page
+            are parsed from the response body as it is read and handed to the callbacks one at
+            a time, instead of loading the entire page into memory first.
+
+            If checkpoint is supplied, the paging state and the offset of the export file are
+            saved to it after each page is processed, and removed once all pages have been
+            processed. If resume is also True and the checkpoint file exists, paging starts from
+            the last page saved to it and the export file is truncated to the saved offset and
+            appended to. Only the csv and json exports (or no export) can be resumed.
+
         Args:
             query: if supplied, only return the assets that match the query
             fields: fields to return for each asset (will be validated)
@@ -133,13 +200,176 @@ class AssetMixin(ModelMixins):
             page_start: start at page N
             page_sleep: sleep for N seconds between each page fetch
             use_cursor: use the endpoint that fetches rows using a DB cursor
-            export: export assets using a callback method
+            export: export assets using a callback method, or a list of exports to hand each
+                row to, see :obj:`axonius_api_client.api.asset_callbacks.base_multi.Multi`
             include_details: include details fields showing the adapter source of agg values
             sort_field: sort the returned assets on a given field
             sort_descending: reverse the sort of the returned assets
             history_date: return assets for a given historical date
+            workers: fetch pages in parallel using N threads
+            workers_ordered: if workers is greater than 1, yield the rows in page order instead
+                of the order the pages finish fetching in
+            prefetch_pages: fetch up to N pages ahead of the page being processed
+            stream: parse the assets of each page as the response body is read
+            checkpoint: path to a file to save the paging state to after each page
+            resume: continue from the paging state saved to checkpoint if it exists
             **kwargs: passed thru to the asset callback defined in ``export``
         """
+        state, store, callbacks = self._get_start(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_fuzzy=fields_fuzzy,
+            fields_default=fields_default,
+            fields_root=fields_root,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            row_start=row_start,
+            page_size=page_size,
+            page_start=page_start,
+            page_sleep=page_sleep,
+            use_cursor=use_cursor,
+            export=export,
+            include_details=include_details,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+            history_date=history_date,
+            workers=workers,
+            workers_ordered=workers_ordered,
+            prefetch_pages=prefetch_pages,
+            stream=stream,
+            checkpoint=checkpoint,
+            resume=resume,
+            **kwargs,
+        )
+
+        pages = self._get_pages(state=state, store=store)
+
+        try:
+            for page in pages:
+                yield from self._process_page(page=page, state=state, callbacks=callbacks)
+
+                if state["stop_fetch"]:
+                    break
+
+                self._checkpoint_save(state=state, store=store, callbacks=callbacks)
+
+                time.sleep(state["page_sleep"])
+        finally:
+            pages.close()
+
+        yield from callbacks.process_delta_removed()
+        self._get_stop(state=state, store=store, callbacks=callbacks)
+
+    async def aget(self, **kwargs) -> AsyncGenerator[dict, None]:
+        """Get an async iterator of objects for a given query using paging.
+
+        Examples:
+            >>> async with AsyncConnect(url=AX_URL, key=AX_KEY, secret=AX_SECRET) as client:
+            ...     async for row in client.devices.aget(query=query):
+            ...         print(row)
+
+        Notes:
+            Requires this API model to be created by
+            :obj:`axonius_api_client.connect.AsyncConnect`. Pages are fetched using
+            :meth:`arequest`, so many calls to aget (for different queries, asset types, or
+            instances) can run concurrently on a single event loop.
+
+            Fetching the field schemas to validate the fields, saving checkpoints, reading and
+            writing delta manifests, and tagging assets use the sync HTTP client or files, so
+            they are run in a thread to not block the event loop. Pages are retried using the
+            retry policy of the HTTP client, the same as :meth:`get_generator`.
+
+        Args:
+            **kwargs: passed to :meth:`get_generator`
+
+        Raises:
+            :exc:`ApiError`: if any of :attr:`AGET_UNSUPPORTED` are supplied
+        """
+        unsupported = [x for x in self.AGET_UNSUPPORTED if kwargs.get(x, None)]
+        if unsupported:
+            raise ApiError(f"Arguments {unsupported} are not supported by aget")
+
+        loop = asyncio.get_running_loop()
+        state, store, callbacks = await loop.run_in_executor(
+            None, functools.partial(self._get_start, **kwargs)
+        )
+        sargs = {"state": state, "store": store, "callbacks": callbacks}
+
+        while True:
+            page = await self._aget_page(state=state, store=store)
+
+            for row in self._process_page(page=page, state=state, callbacks=callbacks):
+                yield row
+
+            if state["stop_fetch"]:
+                break
+
+            await loop.run_in_executor(None, functools.partial(self._checkpoint_save, **sargs))
+
+            await asyncio.sleep(state["page_sleep"])
+
+        rows = await loop.run_in_executor(None, lambda: list(callbacks.process_delta_removed()))
+        for row in rows:
+            yield row
+
+        await loop.run_in_executor(None, functools.partial(self._get_stop, **sargs))
+
+    async def acount(self, query: Optional[str] = None, history_date: Optional[str] = None) -> int:
+        """Get the count of assets using asyncio.
+
+        Notes:
+            history_date is validated in a thread, since validating it may fetch the valid
+            history dates using the sync HTTP client.
+
+        Args:
+            query: if supplied, only return the count of assets that match the query
+            history_date: return count for a given historical date
+        """
+        loop = asyncio.get_running_loop()
+        history_date = await loop.run_in_executor(
+            None, functools.partial(self.validate_history_date, value=history_date)
+        )
+        params = {}
+        params["filter"] = query
+        params["history"] = history_date
+        return await self.arequest(method="post", path=self.router.count, json=params)
+
+    def _get_start(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[Union[List[str], str]] = None,
+        fields_manual: Optional[Union[List[str], str]] = None,
+        fields_regex: Optional[Union[List[str], str]] = None,
+        fields_fuzzy: Optional[Union[List[str], str]] = None,
+        fields_default: bool = True,
+        fields_root: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        row_start: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        page_start: int = 0,
+        page_sleep: int = 0,
+        use_cursor: bool = True,
+        export: Optional[Union[str, List[Union[str, dict]]]] = None,
+        include_details: bool = False,
+        sort_field: Optional[str] = None,
+        sort_descending: bool = False,
+        history_date: Optional[Union[str, datetime.datetime]] = None,
+        workers: int = 0,
+        workers_ordered: bool = True,
+        prefetch_pages: int = 0,
+        stream: bool = False,
+        checkpoint: Optional[Union[str, pathlib.Path]] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> Tuple[dict, dict, Base]:
+        """Build the state, store, and started callbacks for :meth:`get_generator`.
+
+        Args:
+            **kwargs: see :meth:`get_generator`
+        """
         page_size = self._get_page_size(page_size=page_size, max_rows=max_rows)
 
         fields = self.fields.validate(
@@ -185,71 +415,522 @@ class AssetMixin(ModelMixins):
             "fetch_seconds_this_page": None,
             "stop_fetch": False,
             "stop_msg": None,
+            "workers": workers,
+            "workers_ordered": workers_ordered,
+            "prefetch_pages": prefetch_pages,
+            "stream": stream,
+            "checkpoint": str(get_path(obj=checkpoint)) if checkpoint else None,
         }
 
-        callbacks_cls = get_callbacks_cls(export=export)
+        if isinstance(export, (list, tuple)):
+            kwargs["export_sinks"] = export
+            callbacks_cls = Multi
+        else:
+            callbacks_cls = get_callbacks_cls(export=export)
+
+        if checkpoint and not callbacks_cls.CHECKPOINTS:
+            raise ApiError(f"Export {callbacks_cls.CB_NAME!r} does not support checkpoints")
+
+        if checkpoint and not workers_ordered:
+            self.LOG.debug("ORDERED WORKERS: checkpoints need pages to be processed in order")
+            state["workers_ordered"] = True
+
+        saved = self._checkpoint_load(state=state, store=store) if resume else None
+
         callbacks = callbacks_cls(apiobj=self, getargs=kwargs, state=state, store=store)
         self.LAST_CALLBACKS: Base = callbacks
 
+        if saved:
+            if saved["callbacks"]["cb_name"] != callbacks.CB_NAME:
+                raise ApiError(
+                    f"Checkpoint file {state['checkpoint']!r} was saved by export "
+                    f"{saved['callbacks']['cb_name']!r}, not {callbacks.CB_NAME!r}"
+                )
+            callbacks.CHECKPOINT = saved["callbacks"]
+
         callbacks.start()
 
         self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
         self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
 
-        while not state["stop_fetch"]:
-            if state["use_cursor"]:
-                page = self._get_page_cursor(state=state, store=store)
-            else:
-                page = self._get_page_normal(state=state, store=store)
+        return state, store, callbacks
 
-            rows = page.pop("assets")
+    def _get_stop(self, state: dict, store: dict, callbacks: Base):
+        """Finish :meth:`get_generator` and stop the callbacks.
 
-            self.LOG.debug(f"FETCHED PAGE: {json_dump(page)}")
-            self.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+            callbacks: callbacks object of :meth:`get_generator`
+        """
+        self.LOG.info(f"FINISHED FETCH store={store}")
+        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
 
-            if not rows:
-                stop_msg = "no more rows returned"
-                state["stop_fetch"] = True
-                state["stop_msg"] = stop_msg
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
-                break
+        callbacks.stop()
+        self._checkpoint_clear(state=state)
 
-            for row in rows:
-                proc_rows = callbacks.process_row(row=row)
+    def _checkpoint_load(self, state: dict, store: dict) -> Optional[dict]:
+        """Load a checkpoint file saved by :meth:`_checkpoint_save` into state.
 
-                for proc_row in listify(obj=proc_rows):
-                    yield proc_row
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
 
-                if state["stop_fetch"]:  # pragma: no cover
-                    break
+        Raises:
+            :exc:`ApiError`: if the checkpoint was saved for a different store
+        """
+        checkpoint = state["checkpoint"]
+        if not checkpoint or not os.path.isfile(checkpoint):
+            self.LOG.debug(f"NOT RESUMING: no checkpoint file {checkpoint!r}")
+            return None
 
-                if state["max_rows"] and state["rows_processed_total"] >= state["max_rows"]:
-                    stop_msg = "'rows_processed_total' greater than 'max_rows'"
-                    state["stop_msg"] = stop_msg
-                    state["stop_fetch"] = True
-                    break
+        saved = json_load(obj=pathlib.Path(checkpoint).read_bytes())
 
-            if state["stop_fetch"]:
-                stop_msg = state["stop_msg"]
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
+        current = json_load(obj=json_dump(obj=store))
+        diffs = [k for k in current if current[k] != saved["store"].get(k)]
+        if diffs:
+            raise ApiError(
+                f"Checkpoint file {checkpoint!r} was saved for different arguments: {diffs}"
+            )
+
+        use_cursor = state["use_cursor"]
+        state.update(saved["state"])
+
+        # fall back to skip offset paging if the checkpoint has no cursor to continue from
+        state["use_cursor"] = bool(use_cursor and saved["state"]["page_cursor"])
+        if not state["use_cursor"]:
+            state["page_cursor"] = None
+
+        self.LOG.info(
+            f"RESUMING FETCH from checkpoint {checkpoint!r} at page {state['page_number']} "
+            f"rows_fetched_total={state['rows_fetched_total']}"
+        )
+        return saved
+
+    def _checkpoint_save(self, state: dict, store: dict, callbacks: Base):
+        """Save the paging state and the offset of the export to a checkpoint file.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+            callbacks: callbacks object of :meth:`get_generator`
+        """
+        checkpoint = state["checkpoint"]
+        if not checkpoint:
+            return
+
+        data = {
+            "store": store,
+            "state": {k: state[k] for k in self.CHECKPOINT_STATE_KEYS},
+            "callbacks": callbacks.get_checkpoint(),
+        }
+
+        parent = os.path.dirname(checkpoint)
+        os.makedirs(parent, mode=0o700, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(json_dump(obj=data, indent=None))
+        os.replace(temp_file, checkpoint)
+        self.LOG.debug(f"SAVED CHECKPOINT to {checkpoint!r}: {json_dump(data['state'])}")
+
+    def _checkpoint_clear(self, state: dict):
+        """Remove the checkpoint file once all pages have been processed.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+        """
+        checkpoint = state.get("checkpoint")
+        if checkpoint and os.path.isfile(checkpoint):
+            self.LOG.debug(f"REMOVING CHECKPOINT {checkpoint!r}")
+            os.remove(checkpoint)
+
+    def _process_page(
+        self, page: dict, state: dict, callbacks: Base
+    ) -> Generator[dict, None, None]:
+        """Process the rows of a page using the callbacks and check if paging should stop.
+
+        Args:
+            page: page of assets to process
+            state: state tracker of :meth:`get_generator`
+            callbacks: callbacks object of :meth:`get_generator`
+        """
+        # assets is a generator when streaming, so the page and state are only complete
+        # once all of its rows have been processed
+        rows = page.pop("assets")
+        rows_this_page = 0
+
+        for row in rows:
+            rows_this_page += 1
+            proc_rows = callbacks.process_row(row=row)
+
+            for proc_row in callbacks.iter_rows(rows=proc_rows):
+                yield proc_row
+
+            if state["stop_fetch"]:  # pragma: no cover
                 break
 
-            if state["max_pages"] and state["page_number"] >= state["max_pages"]:
-                stop_msg = "'page_number' greater than 'max_pages'"
+            if state["max_rows"] and state["rows_processed_total"] >= state["max_rows"]:
+                stop_msg = "'rows_processed_total' greater than 'max_rows'"
                 state["stop_msg"] = stop_msg
                 state["stop_fetch"] = True
-                self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
                 break
 
-            if state["use_cursor"]:
-                state["page_number"] += 1
+        self.LOG.debug(f"FETCHED PAGE: {json_dump(page)}")
+        self.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
 
-            time.sleep(state["page_sleep"])
+        if not rows_this_page:
+            stop_msg = "no more rows returned"
+            state["stop_fetch"] = True
+            state["stop_msg"] = stop_msg
+            self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
+            return
 
-        self.LOG.info(f"FINISHED FETCH store={store}")
-        self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
+        if state["stop_fetch"]:
+            stop_msg = state["stop_msg"]
+            self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
+            return
 
-        callbacks.stop()
+        if state["max_pages"] and state["page_number"] >= state["max_pages"]:
+            stop_msg = "'page_number' greater than 'max_pages'"
+            state["stop_msg"] = stop_msg
+            state["stop_fetch"] = True
+            self.LOG.debug(f"STOPPED FETCH: {stop_msg}")
+            return
+
+        if state["use_cursor"]:
+            state["page_number"] += 1
+
+    def _get_pages(self, state: dict, store: dict) -> Generator[dict, None, None]:
+        """Get pages of assets until the caller stops asking for more.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        if state["workers"] and state["workers"] > 1:
+            yield from self._get_pages_parallel(state=state, store=store)
+            return
+
+        if state["prefetch_pages"]:
+            yield from self._get_pages_prefetch(state=state, store=store)
+            return
+
+        while True:
+            if state["stream"]:
+                yield self._get_page_stream(state=state, store=store)
+            elif state["use_cursor"]:
+                yield self._get_page_cursor(state=state, store=store)
+            else:
+                yield self._get_page_normal(state=state, store=store)
+
+    def _get_pages_parallel(self, state: dict, store: dict) -> Generator[dict, None, None]:
+        """Get pages of assets using a pool of threads.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        if state["use_cursor"]:
+            self.LOG.debug("DISABLED CURSOR: not supported when fetching pages in parallel")
+            state["use_cursor"] = False
+
+        fetch_start_dt = dt_now()
+        row_start = state["rows_fetched_total"]
+        page_size = state["page_size"]
+
+        page = self._get_page_normal(state=state, store=store)
+
+        row_stop = state["rows_to_fetch_total"]
+        if state["max_rows"]:
+            row_stop = min(row_stop, row_start + state["max_rows"])
+
+        offsets = list(range(state["rows_fetched_total"], row_stop, page_size))
+        if state["max_pages"]:
+            offsets = offsets[: max(state["max_pages"] - state["page_number"], 0)]
+
+        state["pages_to_fetch_total"] = state["page_number"] + len(offsets)
+        state["pages_to_fetch_left"] = len(offsets)
+
+        workers = state["workers"]
+        self.LOG.debug(f"FETCHING {len(offsets)} PAGES IN PARALLEL: workers={workers}")
+
+        offsets = collections.deque(offsets)
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        pending = collections.deque()
+
+        def submit():
+            while offsets and len(pending) < workers:
+                future = pool.submit(
+                    self._get_page_offset,
+                    store=store,
+                    row_start=offsets.popleft(),
+                    page_size=page_size,
+                )
+                pending.append(future)
+
+        try:
+            submit()
+            yield page
+
+            while pending:
+                if state["workers_ordered"]:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    page, seconds = future.result()
+                    submit()
+
+                    state["fetch_seconds_this_page"] = seconds
+                    state["fetch_seconds_total"] = dt_sec_ago(obj=fetch_start_dt, exact=True)
+                    state["rows_fetched_this_page"] = len(page["assets"])
+                    state["rows_fetched_total"] += state["rows_fetched_this_page"]
+                    state["rows_to_fetch_left"] = (
+                        state["rows_to_fetch_total"] - state["rows_fetched_total"]
+                    )
+                    state["page_number"] += 1
+                    state["pages_to_fetch_left"] = (
+                        state["pages_to_fetch_total"] - state["page_number"]
+                    )
+
+                    # an empty page would stop get_generator before pages still pending are done
+                    if page["assets"]:
+                        yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _get_pages_prefetch(self, state: dict, store: dict) -> Generator[dict, None, None]:
+        """Get pages of assets using a thread that fetches pages ahead of the caller.
+
+        Notes:
+            The thread pages using a copy of state, the paging keys of the copy are merged into
+            state as each page is handed to the caller so that state always describes the page
+            being processed.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        fetch_state = dict(state)
+        owned_keys = ["rows_processed_total", "stop_fetch", "stop_msg"]
+        if state["use_cursor"]:
+            owned_keys.append("page_number")
+
+        pages = queue.Queue(maxsize=state["prefetch_pages"])
+        stop = threading.Event()
+
+        def put(item: tuple) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch():
+            row_start = fetch_state["rows_fetched_total"]
+            max_pages = fetch_state["max_pages"]
+            max_rows = fetch_state["max_rows"]
+
+            try:
+                while not stop.is_set():
+                    if fetch_state["use_cursor"]:
+                        page = self._get_page_cursor(state=fetch_state, store=store)
+                    else:
+                        page = self._get_page_normal(state=fetch_state, store=store)
+
+                    updates = {k: v for k, v in fetch_state.items() if k not in owned_keys}
+                    if not put((page, updates, None)):
+                        return
+
+                    if not page["assets"]:
+                        break
+
+                    if max_rows and fetch_state["rows_fetched_total"] - row_start >= max_rows:
+                        break
+
+                    if max_pages and fetch_state["page_number"] >= max_pages:
+                        break
+
+                    if fetch_state["use_cursor"]:
+                        fetch_state["page_number"] += 1
+            except Exception as exc:
+                put((None, None, exc))
+                return
+
+            put((None, None, None))
+
+        thread = threading.Thread(target=fetch, name=f"{self.__class__.__name__}Prefetch")
+        thread.daemon = True
+
+        self.LOG.debug(f"PREFETCHING PAGES: prefetch_pages={state['prefetch_pages']}")
+        thread.start()
+
+        try:
+            while True:
+                page, updates, exc = pages.get()
+
+                if exc:
+                    raise exc
+
+                if page is None:
+                    return
+
+                state.update(updates)
+                yield page
+        finally:
+            stop.set()
+
+    def _get_page_offset(self, store: dict, row_start: int, page_size: int) -> Tuple[dict, float]:
+        """Get a page of assets starting at a given row, used by :meth:`_get_pages_parallel`.
+
+        Args:
+            store: store tracker of :meth:`get_generator`
+            row_start: start at row N
+            page_size: fetch N rows
+        """
+        page_start_dt = dt_now()
+
+        page = self._get(
+            query=store["query"],
+            fields=store["fields"],
+            row_start=row_start,
+            page_size=page_size,
+            include_details=store["include_details"],
+            sort_field=store["sort_field"],
+            sort_descending=store["sort_descending"],
+            history_date=store["history_date"],
+        )
+
+        return page, dt_sec_ago(obj=page_start_dt, exact=True)
+
+    async def _aget_page(self, state: dict, store: dict) -> dict:
+        """Get a page of assets using asyncio, used by :meth:`aget`.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        page_start_dt = dt_now()
+        path, params = self._build_page_params(state=state, store=store)
+        page = await self.arequest(method="post", path=path, json=params, safe=True, compress=True)
+
+        if state["use_cursor"]:
+            self._set_page_state_cursor(
+                page=page,
+                state=state,
+                page_start_dt=page_start_dt,
+                rows_fetched=len(page["assets"]),
+            )
+        else:
+            self._set_page_state_normal(
+                page=page,
+                state=state,
+                page_start_dt=page_start_dt,
+                rows_fetched=len(page["assets"]),
+            )
+        return page
+
+    def _get_page_stream(self, state: dict, store: dict) -> dict:
+        """Get a page of assets with the assets parsed from the response as it is read.
+
+        Notes:
+            The assets of the returned page is a generator, the other keys of the page and the
+            paging keys of state are updated once all of the assets have been read.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        page_start_dt = dt_now()
+        path, params = self._build_page_params(state=state, store=store)
+        self.LAST_GET: dict = params
+
+        response = self.request(
+            method="post", path=path, json=params, raw=True, stream=True, safe=True, compress=True
+        )
+
+        if not response.ok:
+            try:
+                self._get_response_data(response=response)
+            finally:
+                response.close()
+
+        page = {}
+        page["assets"] = self._get_page_stream_rows(
+            response=response, page=page, state=state, page_start_dt=page_start_dt
+        )
+        return page
+
+    def _get_page_stream_rows(
+        self, response, page: dict, state: dict, page_start_dt: datetime.datetime
+    ) -> Generator[dict, None, None]:
+        """Parse the assets from a streamed response, used by :meth:`_get_page_stream`.
+
+        Args:
+            response: :obj:`requests.Response` object with a body that has not been read
+            page: page to add the keys other than assets of the response body to
+            state: state tracker of :meth:`get_generator`
+            page_start_dt: time the request for the page was sent
+        """
+        rows_fetched = 0
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+
+        try:
+            for row in json_stream_object(chunks=chunks, array_key="assets", store=page):
+                rows_fetched += 1
+                yield row
+        except json.JSONDecodeError as exc:
+            respexc = JsonInvalid(f"JSON is not valid in streamed response from {response.url!r}")
+            respexc.exc = exc
+            respexc.response = response
+            raise respexc from exc
+        finally:
+            response.close()
+
+        if page.get("error") or page.get("status") == "error":
+            respexc = JsonError(f"Error in streamed response from {response.url!r}: {page}")
+            respexc.response = response
+            raise respexc
+
+        if state["use_cursor"]:
+            self._set_page_state_cursor(
+                page=page, state=state, page_start_dt=page_start_dt, rows_fetched=rows_fetched
+            )
+        else:
+            self._set_page_state_normal(
+                page=page, state=state, page_start_dt=page_start_dt, rows_fetched=rows_fetched
+            )
+
+    def _build_page_params(self, state: dict, store: dict) -> Tuple[str, dict]:
+        """Build the path and request body to get the next page of assets.
+
+        Args:
+            state: state tracker of :meth:`get_generator`
+            store: store tracker of :meth:`get_generator`
+        """
+        params = self._build_get_params(
+            query=store["query"],
+            fields=store["fields"],
+            row_start=state["rows_fetched_total"],
+            page_size=state["page_size"],
+            include_details=store["include_details"],
+            sort_field=store["sort_field"],
+            sort_descending=store["sort_descending"],
+            history_date=store["history_date"],
+        )
+
+        if state["use_cursor"]:
+            return self.router.cached, {"cursor": state["page_cursor"], **params}
+        return self.router.root, params
 
     def _get_page_cursor(self, state: dict, store: dict) -> dict:
         page_start_dt = dt_now()
@@ -266,6 +947,14 @@ class AssetMixin(ModelMixins):
             history_date=store["history_date"],
         )
 
+        self._set_page_state_cursor(
+            page=page, state=state, page_start_dt=page_start_dt, rows_fetched=len(page["assets"])
+        )
+        return page
+
+    def _set_page_state_cursor(
+        self, page: dict, state: dict, page_start_dt: datetime.datetime, rows_fetched: int
+    ):
         state["fetch_seconds_this_page"] = dt_sec_ago(obj=page_start_dt, exact=True)
         state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
 
@@ -275,14 +964,13 @@ class AssetMixin(ModelMixins):
         if rows_to_fetch_total is not None:
             state["rows_to_fetch_total"] = rows_to_fetch_total
 
-        state["rows_fetched_this_page"] = len(page["assets"])
+        state["rows_fetched_this_page"] = rows_fetched
         state["rows_fetched_total"] += state["rows_fetched_this_page"]
         state["rows_to_fetch_left"] = state["rows_to_fetch_total"] - state["rows_fetched_total"]
         state["pages_to_fetch_total"] = math.ceil(state["rows_to_fetch_total"] / state["page_size"])
         state["pages_to_fetch_left"] = math.ceil(state["rows_to_fetch_left"] / state["page_size"])
 
         state["page_cursor"] = page.get("cursor")
-        return page
 
     def _get_page_normal(self, state: dict, store: dict) -> dict:
         page_start_dt = dt_now()
@@ -298,17 +986,24 @@ class AssetMixin(ModelMixins):
             history_date=store["history_date"],
         )
 
+        self._set_page_state_normal(
+            page=page, state=state, page_start_dt=page_start_dt, rows_fetched=len(page["assets"])
+        )
+        return page
+
+    def _set_page_state_normal(
+        self, page: dict, state: dict, page_start_dt: datetime.datetime, rows_fetched: int
+    ):
         state["fetch_seconds_this_page"] = dt_sec_ago(obj=page_start_dt, exact=True)
         state["fetch_seconds_total"] += state["fetch_seconds_this_page"]
 
         state["rows_to_fetch_total"] = page["page"]["totalResources"]
-        state["rows_fetched_this_page"] = len(page["assets"])
+        state["rows_fetched_this_page"] = rows_fetched
         state["rows_fetched_total"] += state["rows_fetched_this_page"]
         state["rows_to_fetch_left"] = state["rows_to_fetch_total"] - state["rows_fetched_total"]
         state["page_number"] = page["page"]["number"]
         state["pages_to_fetch_total"] = page["page"]["totalPages"]
         state["pages_to_fetch_left"] = state["pages_to_fetch_total"] - state["page_number"]
-        return page
 
     def get_by_id(self, id: str) -> dict:
         """Get the full metadata of all adapters for a single asset.
@@ -417,17 +1112,33 @@ class AssetMixin(ModelMixins):
         return self.get(**kwargs)
 
     def history_dates(self) -> dict:
-        """Get all known historical dates for this asset type."""
-        return self._history_dates()
+        """Get all known historical dates for this asset type.
+
+        Notes:
+            The dates are cached in the ``history_dates`` namespace of :attr:`CACHE`.
+        """
+        dates = self.CACHE.get(
+            namespace="history_dates", key=self.router.root, loader=self._history_dates
+        )
+        return dict(dates)
 
     def validate_history_date(self, value: str) -> str:
-        """Validate that a given date is known historical date."""
+        """Validate that a given date is known historical date.
+
+        Notes:
+            If the date is not in the cached dates, the dates are fetched again before
+            raising an error, in case a new date was added after they were cached.
+        """
         if not value:
             return None
 
         dt = dt_parse_tmpl(obj=value)
 
         known_dates = self.history_dates()
+        if dt not in known_dates:
+            self.CACHE.invalidate(namespace="history_dates", key=self.router.root)
+            known_dates = self.history_dates()
+
         if dt not in known_dates:
             expl = "known history dates"
             known = "\n  " + "\n  ".join(list(known_dates))
@@ -464,6 +1175,14 @@ class AssetMixin(ModelMixins):
         self.saved_query: SavedQuery = SavedQuery(parent=self)
         """Work with saved queries for this asset type."""
 
+        self.FIELDS_CACHE_PATH: Optional[Union[str, pathlib.Path]] = kwargs.get(
+            "fields_cache_path", FIELDS_CACHE_PATH
+        )
+        """directory to cache parsed field schemas in ``kwargs=fields_cache_path``"""
+
+        self.FIELDS_CACHE_TTL: int = kwargs.get("fields_cache_ttl", FIELDS_CACHE_TTL)
+        """seconds that cached field schemas are valid for ``kwargs=fields_cache_ttl``"""
+
         self.fields: Fields = Fields(parent=self)
         """Work with fields for this asset type."""
 
@@ -498,7 +1217,9 @@ class AssetMixin(ModelMixins):
         params = {}
         params["filter"] = query
         params["history"] = history_date
-        return self.request(method="post", path=self.router.count, json=params)
+        return self.request(
+            method="post", path=self.router.count, json=params, safe=True, compress=True
+        )
 
     def _get(
         self,
@@ -513,6 +1234,47 @@ class AssetMixin(ModelMixins):
     ) -> dict:
         """Direct API method to get a page of assets.
 
+        Args:
+            query: if supplied, only return the assets that match the query
+            fields: CSV or list of fields to include in return
+            row_start: start at row N
+            page_size: fetch N assets
+            include_details: include details fields showing the adapter source of agg values
+            sort_field: sort the returned assets on a given field
+            sort_descending: reverse the sort of the returned assets
+            history_date: return assets for a given historical date
+        """
+        params = self._build_get_params(
+            query=query,
+            fields=fields,
+            row_start=row_start,
+            page_size=page_size,
+            include_details=include_details,
+            history_date=history_date,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+        )
+
+        self.LAST_GET: dict = params
+
+        # getting a page does not change anything, so it is safe to retry
+        return self.request(
+            method="post", path=self.router.root, json=params, safe=True, compress=True
+        )
+
+    def _build_get_params(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[Union[List[str], str]] = None,
+        row_start: int = 0,
+        page_size: int = PAGE_SIZE,
+        include_details: bool = False,
+        history_date: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_descending: bool = False,
+    ) -> dict:
+        """Build the request body to get a page of assets.
+
         Args:
             query: if supplied, only return the assets that match the query
             fields: CSV or list of fields to include in return
@@ -540,9 +1302,7 @@ class AssetMixin(ModelMixins):
 
             params["fields"] = fields
 
-        self.LAST_GET: dict = params
-
-        return self.request(method="post", path=self.router.root, json=params)
+        return params
 
     def _get_cursor(
         self,
@@ -569,26 +1329,25 @@ class AssetMixin(ModelMixins):
             history_date: return assets for a given historical date
             cursor: cursor returned by previous call to continue paging through
         """
-        page_size = self._get_page_size(page_size=page_size, max_rows=None)
-
         params = {}
         params["cursor"] = cursor
-        params["skip"] = row_start
-        params["limit"] = page_size
-        params["include_details"] = include_details
-        params["history"] = history_date
-        params["sort"] = sort_field
-        params["desc"] = "1" if sort_descending else None
-        params["filter"] = query
-
-        if fields:
-            if isinstance(fields, list):
-                fields = ",".join(fields)
-
-            params["fields"] = fields
+        params.update(
+            self._build_get_params(
+                query=query,
+                fields=fields,
+                row_start=row_start,
+                page_size=page_size,
+                include_details=include_details,
+                history_date=history_date,
+                sort_field=sort_field,
+                sort_descending=sort_descending,
+            )
+        )
 
         self.LAST_GET: dict = params
-        return self.request(method="post", path=self.router.cached, json=params)
+        return self.request(
+            method="post", path=self.router.cached, json=params, safe=True, compress=True
+        )
 
     def _get_by_id(self, id: str) -> dict:
         """Direct API method to get the full metadata of all adapters for a single asset.
@@ -1,107 +1,332 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import collections
+import hashlib
+import os
+import pathlib
 import re
+import tempfile
+import time
 from typing import List, Optional, Tuple, Union
 
-from cachetools import TTLCache, cached
+from cachetools import LRUCache
 
 from ...constants import (
     AGG_ADAPTER_ALTS,
     AGG_ADAPTER_NAME,
+    FIELDS_CACHE_PATH_MODE,
+    FIELDS_CACHE_TTL,
     FUZZY_SCHEMAS_KEYS,
     GET_SCHEMA_KEYS,
     GET_SCHEMAS_KEYS,
 )
 from ...exceptions import ApiError, NotFoundError
-from ...tools import listify, split_str, strip_right
+from ...tools import get_path, json_dump, json_load, listify, split_str, strip_right
 from ..mixins import ChildMixins
 from ..parsers import parse_fields
+from ..routers import API_VERSION
 
 try:
     import warnings
 
     warnings.filterwarnings("ignore", message="Using slow pure-python SequenceMatcher")
     from fuzzywuzzy import fuzz
+    from fuzzywuzzy import utils as fuzz_utils
 except Exception:
     raise
 
-CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+try:
+    from rapidfuzz import fuzz as rapid_fuzz
+except ImportError:  # pragma: no cover
+    rapid_fuzz = None
 
+FUZZY_CACHE: LRUCache = LRUCache(maxsize=256)
 
-class Fields(ChildMixins):
-    """Child API model for working with fields for the parent asset type."""
 
-    @staticmethod
-    def fuzzy_filter(
+class FuzzyIndex:
+    """Index of field schemas used by :meth:`Fields.fuzzy_filter` to find fuzzy matches.
+
+    Notes:
+        The values of each schema are processed once when the index is built. If rapidfuzz is
+        installed it is used for scoring, otherwise fuzzywuzzy is used and schemas that can not
+        possibly reach the minimum score (based on the characters they have in common with the
+        search) are skipped before scoring them.
+    """
+
+    def __init__(self, schemas: List[dict], keys: List[str], root_only: bool = True):
+        """Index of field schemas used by :meth:`Fields.fuzzy_filter`.
+
+        Args:
+            schemas: field schemas to index
+            keys: keys of each schema to match against
+            root_only: only index schemas that are root fields
+        """
+        self.KEYS: List[str] = keys
+        """keys of each schema to match against"""
+
+        self.ENTRIES: List[Tuple[dict, List[dict]]] = [
+            (x, [self._get_entry(value=x[key]) for key in keys])
+            for x in schemas
+            if self._is_valid(schema=x, root_only=root_only)
+        ]
+        """tuple of each schema that can be matched and the processed values of its keys"""
+
+    def search(
+        self,
         search: str,
-        schemas: List[dict],
-        root_only: bool = True,
         do_contains: bool = True,
         token_score: int = 70,
         partial_score: int = 50,
-        names: bool = False,
-        **kwargs,
     ) -> List[dict]:
-        def do_skip():
-            if schema in matches:
-                return True
+        """Get the schemas that match a search, ordered from best to worst score.
+
+        Args:
+            search: value to search for
+            do_contains: match schemas that have a value that contains search
+            token_score: match schemas that have a token set ratio of at least this score
+            partial_score: if no schemas matched, match schemas that have a partial ratio of
+                at least this score
+        """
+        query = self._get_entry(value=search)
+        matches = []
 
-            if schema["name"].endswith("_details"):
-                return True
+        for idx, (schema, entries) in enumerate(self.ENTRIES):
+            score = 0
+            if do_contains and any(query["lower"] in x["lower"] for x in entries):
+                score = 100
+            elif token_score:
+                score = max(self._token_score(query, x, token_score) for x in entries)
+            if score:
+                matches.append((-score, idx, schema))
 
-            if schema["name"] == "all":
-                return True
+        if partial_score and not matches:
+            for idx, (schema, entries) in enumerate(self.ENTRIES):
+                score = max(self._partial_score(query, x, partial_score) for x in entries)
+                if score:
+                    matches.append((-score, idx, schema))
 
-            if root_only and not schema["is_root"]:
-                return True
+        return [x[-1] for x in sorted(matches, key=lambda x: x[:2])]
 
-            if not schema.get("selectable", True):
-                return True
+    @staticmethod
+    def _is_valid(schema: dict, root_only: bool = True) -> bool:
+        """Check if a schema can be matched."""
+        if schema["name"].endswith("_details") or schema["name"] == "all":
+            return False
 
+        if root_only and not schema["is_root"]:
             return False
 
-        def is_match(method, **kwargs):
-            for key in keys:
-                if method(search, schema[key], **kwargs):
-                    return True
+        return schema.get("selectable", True)
 
-            return False
+    @staticmethod
+    def _get_entry(value: str) -> dict:
+        """Process a value for matching."""
+        value = str(value)
+        tokens = " ".join(sorted(set(fuzz_utils.full_process(value, force_ascii=True).split())))
+        return {
+            "value": value,
+            "lower": value.strip().lower(),
+            "tokens": tokens,
+            "tokens_set": set(tokens.split()),
+            "tokens_chars": collections.Counter(tokens),
+            "chars": collections.Counter(value),
+        }
 
-        def token_set_ratio(search, value, score=70, **kwargs):
-            return fuzz.token_set_ratio(search, value) >= score
+    @staticmethod
+    def _token_score(query: dict, entry: dict, score: int) -> int:
+        """Get the token set ratio of a query and a value, or 0 if it is less than score."""
+        if rapid_fuzz:
+            ratio = rapid_fuzz.token_set_ratio(query["tokens"], entry["tokens"], score_cutoff=score)
+            return round(ratio)
+
+        if not query["tokens"] or not entry["tokens"]:
+            return 0
+
+        # with no tokens in common the ratio is of the sorted tokens, which can match no more
+        # characters than the two have in common
+        if not query["tokens_set"] & entry["tokens_set"]:
+            common = sum((query["tokens_chars"] & entry["tokens_chars"]).values())
+            total = len(query["tokens"]) + len(entry["tokens"])
+            if round(200 * common / total) < score:
+                return 0
+
+        ratio = fuzz.token_set_ratio(query["value"], entry["value"])
+        return ratio if ratio >= score else 0
 
-        def partial_ratio(search, value, score=50, **kwargs):
-            return fuzz.partial_ratio(search, value) >= score
+    @staticmethod
+    def _partial_score(query: dict, entry: dict, score: int) -> int:
+        """Get the partial ratio of a query and a value, or 0 if it is less than score."""
+        if rapid_fuzz:
+            return round(
+                rapid_fuzz.partial_ratio(query["value"], entry["value"], score_cutoff=score)
+            )
 
-        def contains(search, value, **kwargs):
-            return search.strip().lower() in value.strip().lower()
+        shortest = min(len(query["value"]), len(entry["value"]))
+        if not shortest:
+            return 0
 
-        keys = kwargs.get("fuzzy_keys", FUZZY_SCHEMAS_KEYS)
+        # each window compared can match no more characters than the two have in common
+        common = sum((query["chars"] & entry["chars"]).values())
+        if round(200 * common / (shortest + common)) < score:
+            return 0
 
-        matches = []
+        ratio = fuzz.partial_ratio(query["value"], entry["value"])
+        return ratio if ratio >= score else 0
 
-        for schema in schemas:
-            if do_contains and not do_skip() and is_match(contains):
-                matches.append(schema)
 
-            if token_score and not do_skip() and is_match(token_set_ratio):
-                matches.append(schema)
+class Fields(ChildMixins):
+    """Child API model for working with fields for the parent asset type."""
 
-        if partial_score and not matches:
-            for schema in schemas:
-                if not do_skip() and is_match(partial_ratio):
-                    matches.append(schema)
+    @staticmethod
+    def fuzzy_filter(
+        search: str,
+        schemas: List[dict],
+        root_only: bool = True,
+        do_contains: bool = True,
+        token_score: int = 70,
+        partial_score: int = 50,
+        names: bool = False,
+        **kwargs,
+    ) -> List[dict]:
+        """Find schemas that fuzzy match a search, ordered from best to worst score.
+
+        Args:
+            search: value to search for
+            schemas: field schemas to search
+            root_only: only match schemas that are root fields
+            do_contains: match schemas that have a value that contains search
+            token_score: match schemas that have a token set ratio of at least this score
+            partial_score: if no schemas matched, match schemas that have a partial ratio of
+                at least this score
+            names: return the qualified names of the matching schemas instead of the schemas
+            **kwargs: fuzzy_keys: keys of each schema to match against
+
+        Notes:
+            The :obj:`FuzzyIndex` for schemas is cached as long as the list of schemas is the
+            same object with the same length.
+        """
+        keys = kwargs.get("fuzzy_keys", FUZZY_SCHEMAS_KEYS)
 
+        cache_key = (id(schemas), len(schemas), tuple(keys), root_only)
+        cached = FUZZY_CACHE.get(cache_key)
+        if cached and cached[0] is schemas:
+            index = cached[1]
+        else:
+            index = FuzzyIndex(schemas=schemas, keys=keys, root_only=root_only)
+            FUZZY_CACHE[cache_key] = (schemas, index)
+
+        matches = index.search(
+            search=search,
+            do_contains=do_contains,
+            token_score=token_score,
+            partial_score=partial_score,
+        )
         return [x["name_qual"] for x in matches] if names else matches
 
-    @cached(cache=CACHE)
     def get(self) -> dict:
         """Get the schema of all adapters and their fields.
 
+        Notes:
+            The parsed schema is cached in the ``fields`` namespace of :attr:`CACHE`, and the
+            fields of each adapter are only parsed the first time the adapter is accessed.
+            If the parent API model has FIELDS_CACHE_PATH set, the raw schema is also
+            cached on disk in that directory for FIELDS_CACHE_TTL seconds, keyed by the URL and
+            version of Axonius, so that other processes do not need to fetch it again.
+
         Returns:
-            :obj:`dict`: parsed output from :meth:`ParserFields.parse`
+            :obj:`axonius_api_client.tools.LazyMap`: parsed output from
+            :func:`axonius_api_client.api.parsers.fields.parse_fields`
         """
-        return parse_fields(raw=self._get())
+        return self.CACHE.get(namespace="fields", key=self._cache_key, loader=self._get_parsed)
+
+    def cache_clear(self):
+        """Remove the parsed schema of all adapters and their fields from all caches."""
+        self.CACHE.invalidate(namespace="fields", key=self._cache_key)
+        cache_file = self.cache_file
+        if cache_file and cache_file.is_file():
+            self.LOG.debug(f"Removing cached fields from {str(cache_file)!r}")
+            cache_file.unlink()
+
+    @property
+    def _cache_key(self) -> Tuple[str, Optional[str]]:
+        """Get the key of the parsed schema of all fields in :attr:`CACHE`."""
+        cache_file = self.cache_file
+        return (self.router.fields, str(cache_file) if cache_file else None)
+
+    def _get_parsed(self) -> dict:
+        """Get the parsed schema of all fields from :attr:`cache_file` or the API."""
+        fields = self._cache_load()
+        if fields is None:
+            raw = self._get()
+            self._cache_save(raw=raw)
+            fields = parse_fields(raw=raw)
+        return fields
+
+    @property
+    def cache_file(self) -> Optional[pathlib.Path]:
+        """Get the path to the file to cache the parsed schema of all fields in."""
+        if hasattr(self, "_cache_file"):
+            return self._cache_file
+
+        self._cache_file = None
+        cache_path = getattr(self.parent, "FIELDS_CACHE_PATH", None)
+        if cache_path:
+            self._cache_version = version = self._get_version()
+            key = "|".join([self.http.url, version, self.router.fields])
+            name = f"fields_{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+            self._cache_file = get_path(obj=cache_path) / name
+        return self._cache_file
+
+    def _cache_load(self) -> Optional[dict]:
+        """Load the schema of all fields from :attr:`cache_file` if it is not expired.
+
+        Notes:
+            The raw schema is stored in :attr:`cache_file` and parsed lazily once loaded, older
+            cache files that store the parsed schema are loaded as is.
+        """
+        cache_file = self.cache_file
+        if not cache_file or not cache_file.is_file():
+            return None
+
+        ttl = getattr(self.parent, "FIELDS_CACHE_TTL", FIELDS_CACHE_TTL)
+        age = time.time() - cache_file.stat().st_mtime
+        if ttl and age > ttl:
+            self.LOG.debug(f"Cached fields in {str(cache_file)!r} expired {age:.0f}s > {ttl}s")
+            return None
+
+        try:
+            data = json_load(obj=cache_file.read_bytes())
+            return parse_fields(raw=data["raw"]) if "raw" in data else data["fields"]
+        except Exception as exc:
+            self.LOG.warning(f"Unable to load cached fields from {str(cache_file)!r}: {exc}")
+            return None
+
+    def _cache_save(self, raw: dict):
+        """Save the raw schema of all fields to :attr:`cache_file`.
+
+        Args:
+            raw: raw schema of all fields from :meth:`_get`
+        """
+        cache_file = self.cache_file
+        if not cache_file:
+            return
+
+        data = {"url": self.http.url, "version": self._cache_version, "raw": raw}
+        try:
+            cache_file.parent.mkdir(mode=FIELDS_CACHE_PATH_MODE, parents=True, exist_ok=True)
+            fd, temp_file = tempfile.mkstemp(dir=str(cache_file.parent), suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                fh.write(json_dump(obj=data, indent=None))
+            os.replace(temp_file, str(cache_file))
+            self.LOG.debug(f"Saved cached fields to {str(cache_file)!r}")
+        except Exception as exc:
+            self.LOG.warning(f"Unable to save cached fields to {str(cache_file)!r}: {exc}")
+
+    def _get_version(self) -> str:
+        """Get the version of Axonius to use in the key for :attr:`cache_file`."""
+        about = self.request(method="get", path=API_VERSION.system.meta_about)
+        version = about.get("Version", "") or about.get("Installed Version", "")
+        return version.replace("_", ".")
 
     def get_adapter_names(self, value: str) -> List[str]:
         """Find an adapter by name regex."""
@@ -141,18 +366,13 @@ class Fields(ChildMixins):
     def get_field_schemas(self, value: str, schemas: List[dict], **kwargs) -> List[dict]:
         """Find a schema for a field by regex of name."""
         keys = kwargs.get("keys", GET_SCHEMAS_KEYS)
-        search = re.compile(value.lower().strip(), re.I)
-
-        matches = []
-
-        for schema in schemas:
-            if not schema.get("selectable"):
-                continue
-
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
-        return matches
+        search = re.compile(value.lower().strip(), re.I).search
+        index = self._get_schemas_index(schemas=schemas, keys=keys)
+        return [
+            schema
+            for schema, values in index["values"]
+            if schema.get("selectable") and any(map(search, values))
+        ]
 
     def get_field_schema(self, value: str, schemas: List[dict], **kwargs) -> dict:
         """Find a schema for a field by name."""
@@ -160,14 +380,12 @@ class Fields(ChildMixins):
         keys_fuzzy = kwargs.get("keys_fuzzy", FUZZY_SCHEMAS_KEYS)
 
         search = value.lower().strip()
+        index = self._get_schemas_index(schemas=schemas, keys=keys)
 
-        schemas = [x for x in schemas if x.get("selectable", True)]
-
-        for schema in schemas:
-            for key in keys:
-                if search.lower().strip() == schema[key].lower():
-                    return schema
+        if search in index["lookup"]:
+            return index["lookup"][search]
 
+        schemas = index["selectable"]
         err = "No fuzzy matches, all valid fields:"
 
         kwargs["search"] = value
@@ -204,7 +422,7 @@ class Fields(ChildMixins):
         adapter = self.get_adapter_name(value=adapter)
         schemas = fields[adapter]
         if fields_custom and adapter in fields_custom:
-            schemas += fields_custom[adapter]
+            schemas = schemas + fields_custom[adapter]
         schema = self.get_field_schema(value=field, schemas=schemas)
         return schema[key] if key else schema
 
@@ -213,7 +431,7 @@ class Fields(ChildMixins):
         splits = self.split_searches(value=value)
         fields = self.get()
 
-        matches = []
+        matches = {}
 
         for adapter_re, fields_re in splits:
             adapters = self.get_adapter_names(value=adapter_re)
@@ -221,42 +439,40 @@ class Fields(ChildMixins):
             for adapter in adapters:
                 for field_re in fields_re:
                     fschemas = self.get_field_schemas(value=field_re, schemas=fields[adapter])
-                    names = [x["name_qual"] for x in fschemas]
-                    matches += [x for x in names if x not in matches]
-        return matches
+                    matches.update((x["name_qual"], None) for x in fschemas)
+        return list(matches)
 
     def get_field_names_eq(self, value: str) -> List[str]:
         """Pass."""
         splits = self.split_searches(value=value)
         fields = self.get()
 
-        matches = []
+        matches = {}
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
                 schemas = fields[adapter]
                 schema = self.get_field_schema(value=name, schemas=schemas)
-                if schema["name_qual"] not in matches:
-                    matches.append(schema["name_qual"])
+                matches[schema["name_qual"]] = None
 
-        return matches
+        return list(matches)
 
     def get_field_names_fuzzy(self, value: str) -> List[str]:
         """Pass."""
         splits = self.split_searches(value=value)
         fields = self.get()
 
-        matches = []
+        matches = {}
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
                 schemas = fields[adapter]
                 amatches = self.fuzzy_filter(search=name, schemas=schemas, names=True)
-                matches += [x for x in amatches if x not in matches]
+                matches.update((x, None) for x in amatches)
 
-        return matches
+        return list(matches)
 
     def get_field_schemas_root(self, adapter: str) -> List[dict]:
         """Pass."""
@@ -286,7 +502,8 @@ class Fields(ChildMixins):
 
         def add(items):
             for item in items:
-                if item not in selected:
+                if item not in seen:
+                    seen.add(item)
                     selected.append(item)
 
         fields = listify(obj=fields)
@@ -294,6 +511,7 @@ class Fields(ChildMixins):
         fields_fuzzy = listify(obj=fields_fuzzy)
 
         selected = []
+        seen = set()
 
         if fields_default and not fields_root:
             add(self.parent.fields_default)
@@ -349,6 +567,42 @@ class Fields(ChildMixins):
 
         return adapter_split, fields
 
+    def _get_schemas_index(self, schemas: List[dict], keys: List[str]) -> dict:
+        """Get the index of a list of schemas used to find schemas by the values of keys.
+
+        Args:
+            schemas: schemas to index
+            keys: keys of each schema to index
+
+        Notes:
+            The index is cached for as long as the same list of schemas has the same length,
+            so looking up many fields in an adapter only indexes its schemas once.
+
+        Returns:
+            :obj:`dict`: with keys:
+                selectable: schemas that can be selected as fields
+                values: tuple of each selectable schema and the values of its keys
+                lookup: map of the lowercase values of keys to the first schema that has them
+        """
+        if not hasattr(self, "_schemas_indexes") or len(self._schemas_indexes) > 1024:
+            self._schemas_indexes = {}
+
+        cache_key = (id(schemas), len(schemas), tuple(keys))
+        cached = self._schemas_indexes.get(cache_key)
+        if cached and cached[0] is schemas:
+            return cached[1]
+
+        selectable = [x for x in schemas if x.get("selectable", True)]
+        values = [(x, tuple(x[key] for key in keys)) for x in selectable]
+        lookup = {}
+        for schema, schema_values in values:
+            for value in schema_values:
+                lookup.setdefault(value.lower(), schema)
+
+        index = {"selectable": selectable, "values": values, "lookup": lookup}
+        self._schemas_indexes[cache_key] = (schemas, index)
+        return index
+
     def _get(self) -> dict:
         """Direct API method to get the schema of all fields.
 
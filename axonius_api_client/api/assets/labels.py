@@ -1,67 +1,131 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
-from typing import List
+import concurrent.futures
+import time
+from typing import Callable, List
 
+from ...constants import (
+    HTTP_RETRY_STATUSES,
+    LABELS_BATCH_SIZE,
+    LABELS_RETRIES,
+    LABELS_RETRY_SLEEP,
+    LABELS_WORKERS,
+)
+from ...exceptions import ApiError
+from ...http import RetryPolicy
 from ...tools import grouper
-from ..mixins import ChildMixins
+from ..mixins import ChildMixins, Model
 
 
 class Labels(ChildMixins):
     """ChildMixins API model for working with labels/tags for the parent asset type."""
 
-    def add(self, rows: List[dict], labels: List[str]) -> int:
+    def _init(self, parent: Model):
+        """Post init method for subclasses to use for extra setup.
+
+        Args:
+            parent: parent API model of this child
+        """
+        self.LAST_SUMMARY: dict = {}
+        """summary of the batches sent by the last call to :meth:`add` or :meth:`remove`"""
+
+    def add(
+        self,
+        rows: List[dict],
+        labels: List[str],
+        batch_size: int = LABELS_BATCH_SIZE,
+        workers: int = LABELS_WORKERS,
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+    ) -> int:
         """Add labels/tags to assets.
 
         Args:
             rows (:obj:`list` of :obj:`dict`): assets returned from :meth:`get`
                 to process
             labels (:obj:`list` of `str`): labels to process
+            batch_size: number of assets to send per request
+            workers: number of threads to use for sending requests
+            retries: number of times to retry a request that failed
+            retry_sleep: seconds to sleep before retrying a request, times the try
+
+        Notes:
+            A summary of the batches that were sent is stored in :attr:`LAST_SUMMARY`
+
+        Raises:
+            :exc:`ApiError`: if any batch still failed after all retries
 
         Returns:
             :obj:`int`: number of labels processed
         """
         ids = [row["internal_axon_id"] for row in rows]
-
-        processed = 0
-
-        # only do 100 labels at a time, more seems to break API
-        for group in grouper(ids, 100):
-            group = [x for x in group if x is not None]
-            response = self._add(labels=labels, ids=group)
-            processed += response
-
-        return processed
+        summary = self._do_batches(
+            method=self._add,
+            labels=labels,
+            ids=ids,
+            batch_size=batch_size,
+            workers=workers,
+            retries=retries,
+            retry_sleep=retry_sleep,
+        )
+        return summary["processed"]
 
     def get(self) -> List[str]:
         """Get all known labels/tags.
 
+        Notes:
+            The labels are cached in the ``labels`` namespace of :attr:`CACHE`, which is
+            invalidated when labels are added or removed by this client.
+
         Returns:
             :obj:`list` of :obj:`str`: all labels that exist in Axonius
         """
-        return self._get()
+        return list(self.CACHE.get(namespace="labels", key=self.router.root, loader=self._get))
 
-    def remove(self, rows: List[dict], labels: List[str]) -> int:
+    def cache_clear(self):
+        """Remove the labels of this asset type from :attr:`CACHE`."""
+        self.CACHE.invalidate(namespace="labels", key=self.router.root)
+
+    def remove(
+        self,
+        rows: List[dict],
+        labels: List[str],
+        batch_size: int = LABELS_BATCH_SIZE,
+        workers: int = LABELS_WORKERS,
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+    ) -> int:
         """Remove labels/tags from assets.
 
         Args:
             rows (:obj:`list` of :obj:`dict`): assets returned from :meth:`get`
                 to process
             labels (:obj:`list` of `str`): labels to process
+            batch_size: number of assets to send per request
+            workers: number of threads to use for sending requests
+            retries: number of times to retry a request that failed
+            retry_sleep: seconds to sleep before retrying a request, times the try
+
+        Notes:
+            A summary of the batches that were sent is stored in :attr:`LAST_SUMMARY`
+
+        Raises:
+            :exc:`ApiError`: if any batch still failed after all retries
 
         Returns:
             :obj:`int`: number of labels processed
         """
         ids = [row["internal_axon_id"] for row in rows]
-
-        processed = 0
-
-        # only do 100 labels at a time, more seems to break API
-        for group in grouper(ids, 100):
-            group = [x for x in group if x is not None]
-            response = self._remove(labels=labels, ids=group)
-            processed += response
-
-        return processed
+        summary = self._do_batches(
+            method=self._remove,
+            labels=labels,
+            ids=ids,
+            batch_size=batch_size,
+            workers=workers,
+            retries=retries,
+            retry_sleep=retry_sleep,
+        )
+        return summary["processed"]
 
     def _add(self, labels: List[str], ids: List[str]) -> int:
         """Direct API method to add labels/tags to assets.
@@ -79,7 +143,9 @@ class Labels(ChildMixins):
         data["labels"] = labels
 
         path = self.router.labels
-        return self.request(method="post", path=path, json=data)
+        response = self.request(method="post", path=path, json=data, compress=True)
+        self.cache_clear()
+        return response
 
     def _get(self) -> List[str]:
         """Direct API method to get all known labels/tags.
@@ -108,4 +174,132 @@ class Labels(ChildMixins):
 
         path = self.router.labels
 
-        return self.request(method="delete", path=path, json=data)
+        response = self.request(method="delete", path=path, json=data, compress=True)
+        self.cache_clear()
+        return response
+
+    def _do_batches(
+        self,
+        method: Callable,
+        labels: List[str],
+        ids: List[str],
+        batch_size: int = LABELS_BATCH_SIZE,
+        workers: int = LABELS_WORKERS,
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+    ) -> dict:
+        """Send batches of ids to a direct API method using a pool of threads.
+
+        Args:
+            method: :meth:`_add` or :meth:`_remove`
+            labels: labels to process
+            ids: internal_axon_id of assets to process
+            batch_size: number of assets to send per request
+            workers: number of threads to use for sending requests
+            retries: number of times to retry a request that failed
+            retry_sleep: seconds to sleep before retrying a request, times the try
+
+        Raises:
+            :exc:`ApiError`: if any batch still failed after all retries
+        """
+        start = time.monotonic()
+        batches = [[x for x in group if x is not None] for group in grouper(ids, batch_size)]
+        workers = max(1, min(workers, len(batches)))
+
+        def do_batch(args):
+            number, batch = args
+            return self._do_batch(
+                method=method,
+                labels=labels,
+                ids=batch,
+                number=number,
+                retries=retries,
+                retry_sleep=retry_sleep,
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(do_batch, enumerate(batches, start=1)))
+
+        failed = [x for x in results if x["error"] is not None]
+        summary = {
+            "method": method.__name__,
+            "labels": labels,
+            "assets": len(ids),
+            "batch_size": batch_size,
+            "workers": workers,
+            "processed": sum(x["processed"] for x in results),
+            "retries": sum(x["tries"] - 1 for x in results),
+            "failed": len(failed),
+            "seconds": round(time.monotonic() - start, 3),
+            "batches": results,
+        }
+        self.LAST_SUMMARY = summary
+
+        msg = ", ".join(f"{k}={v!r}" for k, v in summary.items() if k != "batches")
+        self.LOG.debug(f"Label batches finished: {msg}")
+
+        if failed:
+            errs = "\n".join(f"batch #{x['number']}: {x['error']}" for x in failed)
+            raise ApiError(f"{len(failed)} of {len(results)} label batches failed:\n{errs}")
+        return summary
+
+    def _do_batch(
+        self,
+        method: Callable,
+        labels: List[str],
+        ids: List[str],
+        number: int,
+        retries: int = LABELS_RETRIES,
+        retry_sleep: int = LABELS_RETRY_SLEEP,
+    ) -> dict:
+        """Send a batch of ids to a direct API method, retrying on transient errors.
+
+        Notes:
+            Only connection errors, timeouts, and responses with a retryable status code
+            (see :meth:`_is_retryable`) are retried, any other error is raised at once.
+
+        Args:
+            method: :meth:`_add` or :meth:`_remove`
+            labels: labels to process
+            ids: internal_axon_id of assets to process
+            number: number of this batch
+            retries: number of times to retry a request that failed
+            retry_sleep: seconds to sleep before retrying a request, times the try
+        """
+        result = {"number": number, "assets": len(ids), "processed": 0, "tries": 0, "error": None}
+
+        while True:
+            result["tries"] += 1
+            try:
+                result["processed"] = method(labels=labels, ids=ids)
+                result["error"] = None
+                return result
+            except Exception as exc:
+                if not self._is_retryable(exc=exc):
+                    raise
+
+                result["error"] = f"{exc}"
+                if result["tries"] > retries:
+                    return result
+
+                self.LOG.warning(f"Label batch #{number} failed, try {result['tries']}: {exc}")
+                time.sleep(retry_sleep * result["tries"])
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        """Check if an error from sending a batch is transient and can be retried.
+
+        Args:
+            exc: error raised by the direct API method
+
+        Notes:
+            Connection errors and timeouts are retried, as are errors with a response whose
+            status code is in the statuses of the retry policy of :attr:`http`.
+        """
+        if isinstance(exc, RetryPolicy.EXCEPTIONS):
+            return True
+
+        response = getattr(exc, "response", None)
+        status_code = getattr(response, "status_code", None)
+        policy = getattr(self.http, "RETRY", None)
+        statuses = policy.STATUSES if policy is not None else HTTP_RETRY_STATUSES
+        return status_code in statuses
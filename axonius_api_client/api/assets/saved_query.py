@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """API models for working with device and user assets."""
+import copy
 from typing import List, Optional, Union
 
 from ...constants import GUI_PAGE_SIZES, PAGE_SIZE
@@ -61,6 +62,52 @@ class SavedQuery(ChildMixins, PagingMixinsObject):
 
     # XXX need update saved query, doc the other methods (get tags, get_by_tags, etc)
 
+    def get_by_name(self, value: str, **kwargs) -> dict:
+        """Get a saved query by name.
+
+        Notes:
+            If no kwargs are supplied, the saved queries are looked up in the ``saved_queries``
+            namespace of :attr:`CACHE` first, which is invalidated when saved queries are
+            added or deleted by this client.
+
+        Args:
+            value: name of saved query to get
+            **kwargs: passed to :meth:`get`
+        """
+        if not kwargs:
+            for row in self._get_cached():
+                if row["name"] == value:
+                    return copy.deepcopy(row)
+            self.cache_clear()
+        return super(SavedQuery, self).get_by_name(value=value, **kwargs)
+
+    def get_by_uuid(self, value: str, **kwargs) -> dict:
+        """Get a saved query by UUID.
+
+        Notes:
+            If no kwargs are supplied, the saved queries are looked up in the ``saved_queries``
+            namespace of :attr:`CACHE` first, which is invalidated when saved queries are
+            added or deleted by this client.
+
+        Args:
+            value: uuid of saved query to get
+            **kwargs: passed to :meth:`get`
+        """
+        if not kwargs:
+            for row in self._get_cached():
+                if row["uuid"] == value:
+                    return copy.deepcopy(row)
+            self.cache_clear()
+        return super(SavedQuery, self).get_by_uuid(value=value, **kwargs)
+
+    def _get_cached(self) -> List[dict]:
+        """Get all saved queries from the ``saved_queries`` namespace of :attr:`CACHE`."""
+        return self.CACHE.get(namespace="saved_queries", key=self.router.root, loader=self.get)
+
+    def cache_clear(self):
+        """Remove the saved queries of this asset type from :attr:`CACHE`."""
+        self.CACHE.invalidate(namespace="saved_queries", key=self.router.root)
+
     def get_by_tags(self, value: Union[str, List[str]], **kwargs) -> List[dict]:
         """Get saved queries by tags.
 
@@ -225,7 +272,9 @@ class SavedQuery(ChildMixins, PagingMixinsObject):
             data: saved query metadata
         """
         path = self.router.views
-        return self.request(method="put", path=path, json=data)
+        response = self.request(method="put", path=path, json=data)
+        self.cache_clear()
+        return response
 
     def _delete(self, ids: List[str]) -> str:
         """Direct API method to delete saved queries.
@@ -235,7 +284,9 @@ class SavedQuery(ChildMixins, PagingMixinsObject):
         """
         data = {"ids": listify(ids)}
         path = f"{self.router.views}/saved"
-        return self.request(method="delete", path=path, json=data)
+        response = self.request(method="delete", path=path, json=data)
+        self.cache_clear()
+        return response
 
     def _get(
         self, query: Optional[str] = None, row_start: int = 0, page_size: int = PAGE_SIZE
@@ -6,8 +6,9 @@ import time
 from typing import Any, Generator, List, Optional, Union
 
 from .. import auth
+from ..cache import CacheRegistry
 from ..constants import LOG_LEVEL_API, MAX_BODY_LEN, MAX_PAGE_SIZE
-from ..exceptions import JsonError, JsonInvalid, NotFoundError, ResponseNotOk
+from ..exceptions import ApiError, JsonError, JsonInvalid, NotFoundError, ResponseNotOk
 from ..logs import get_obj_log
 from ..tools import dt_now, dt_sec_ago, json_dump, json_load, json_reload
 from .routers import Router
@@ -56,6 +57,9 @@ class ModelMixins(Model, PageSizeMixin):
         """:obj:`axonius_api_client.auth.models.Mixins` authentication object."""
         self.http = auth.http
         """:obj:`axonius_api_client.http.Http` client to use to send requests,"""
+        self.CACHE: CacheRegistry = kwargs.get("cache") or CacheRegistry()
+        """cache of instance metadata shared with other API models ``kwargs=cache``"""
+        kwargs["cache"] = self.CACHE
         self._init(**kwargs)
 
         auth.check_login()
@@ -82,17 +86,21 @@ class ModelMixins(Model, PageSizeMixin):
         exc: Optional[Exception] = None,
     ) -> str:
         """Pass."""
-        request_size = len(response.request.body or "")
+        request = response.request
+        # httpx requests/responses (from AsyncHttp) name these attributes differently
+        request_body = request.body if hasattr(request, "body") else request.content
+        reason = response.reason if hasattr(response, "reason") else response.reason_phrase
+        request_size = len(request_body or "")
         response_size = len(response.text or "")
         msgs = []
         msgs += [f"Original exception: {exc}"] if exc else []
         msgs += [
             "Request Body:",
-            json_reload(obj=response.request.body, error=False, trim=MAX_BODY_LEN),
+            json_reload(obj=request_body, error=False, trim=MAX_BODY_LEN),
             "",
             "Response details:",
             f"  code: {response.status_code!r}",
-            f"  reason: {response.reason!r}",
+            f"  reason: {reason!r}",
             f"  method={response.request.method!r}",
             f"  url: {response.url!r}",
             f"  request_size: {request_size}",
@@ -156,6 +164,84 @@ class ModelMixins(Model, PageSizeMixin):
         if raw:
             return response
 
+        return self._get_response_data(
+            response=response,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    async def arequest(
+        self,
+        path: str,
+        method: Optional[str] = "get",
+        raw: Optional[bool] = False,
+        is_json: Optional[bool] = True,
+        error_status: Optional[bool] = True,
+        error_json_bad_status: Optional[bool] = True,
+        error_json_invalid: Optional[bool] = True,
+        **kwargs,
+    ) -> Any:
+        """Send a REST API request using asyncio.
+
+        Notes:
+            Requires the HTTP client to be a :obj:`axonius_api_client.http.AsyncHttp`, i.e. the
+            API model was created by :obj:`axonius_api_client.connect.AsyncConnect`.
+
+        Args:
+            path: path to use in request
+            method: method to use in request
+            raw: return the raw response object
+            is_json: return the response as deserialized json or just return the text body
+            error_status: throw error if response has a bad status code
+            error_json_bad_status: throw error if json response has non-empty error key
+            error_json_invalid: throw error if response can not be deserialized into json
+            **kwargs: Passed to :meth:`axonius_api_client.http.AsyncHttp.acall`
+
+        Raises:
+            :exc:`ApiError`: if the HTTP client does not support asyncio
+
+        Returns:
+            :obj:`httpx.Response` or :obj:`str` or :obj:`dict` or :obj:`int` or :obj:`list`
+        """
+        if not hasattr(self.http, "acall"):
+            raise ApiError(f"HTTP client {self.http} does not support asyncio, use AsyncConnect")
+
+        sargs = {}
+        sargs.update(kwargs)
+        sargs.update({"path": path, "method": method})
+
+        response = await self.http.acall(**sargs)
+
+        if raw:
+            return response
+
+        return self._get_response_data(
+            response=response,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    def _get_response_data(
+        self,
+        response,
+        is_json: Optional[bool] = True,
+        error_status: Optional[bool] = True,
+        error_json_bad_status: Optional[bool] = True,
+        error_json_invalid: Optional[bool] = True,
+    ) -> Any:
+        """Check a response and get the data from its body.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` object to check
+            is_json: return the response as deserialized json or just return the text body
+            error_status: throw error if response has a bad status code
+            error_json_bad_status: throw error if json response has non-empty error key
+            error_json_invalid: throw error if response can not be deserialized into json
+        """
         if is_json and response.text:
             data = self._check_response_json(
                 response=response,
@@ -218,7 +304,7 @@ class ModelMixins(Model, PageSizeMixin):
                 status key that == error
         """
         try:
-            data = response.json()
+            data = json_load(obj=response.content)
         except Exception as exc:
             if error_json_invalid:
                 respexc = JsonInvalid(
@@ -406,6 +492,7 @@ class ChildMixins:
         self.auth = parent.auth
         self.router = parent.router
         self.request = parent.request
+        self.CACHE = parent.CACHE
         self.LOG = parent.LOG.getChild(self.__class__.__name__)
         self._init(parent=parent)
 
@@ -3,7 +3,7 @@
 from typing import List
 
 from ...constants import DISCOVERY_NAME, GENERIC_NAME
-from ...tools import strip_right
+from ...tools import LazyMap, strip_right
 from .config import parse_schema
 
 
@@ -20,7 +20,11 @@ def parse_adapters(raw: dict) -> List[dict]:
 
 
 def parse_adapter(name: str, raw: dict) -> dict:
-    """Parse a single adapter."""
+    """Parse a single adapter.
+
+    Notes:
+        The schemas of the adapter are parsed the first time each one is accessed.
+    """
     parsed = {
         "name": strip_right(obj=name, fix="_adapter"),
         "name_raw": name,
@@ -37,32 +41,19 @@ def parse_adapter(name: str, raw: dict) -> dict:
     specific_name = get_specific_name(raw=raw)
     config = raw["config"]
 
-    specific_schema = config.get(specific_name, {}).get("schema", {})
-    specific_schema = parse_schema(raw=specific_schema)
-
-    generic_schema = config[generic_name]["schema"]
-    generic_schema = parse_schema(raw=generic_schema)
-
-    discovery_schema = config[discovery_name]["schema"]
-    discovery_schema = parse_schema(raw=discovery_schema)
-
-    cnx_schema = parse_schema(raw=raw["schema"])
-    cnx_schema["connection_label"] = {
-        "name": "connection_label",
-        "title": "Connection Label",
-        "type": "string",
-        "required": False,
-    }
-
-    parsed["schemas"] = {
-        "cnx": cnx_schema,
-        "specific": specific_schema,
-        "generic": generic_schema,
-        "discovery": discovery_schema,
-        "generic_name": generic_name,
-        "specific_name": specific_name,
-        "discovery_name": discovery_name,
-    }
+    parsed["schemas"] = LazyMap(
+        loaders={
+            "cnx": (parse_cnx_schema, {"raw": raw["schema"]}),
+            "specific": (parse_schema, {"raw": config.get(specific_name, {}).get("schema", {})}),
+            "generic": (parse_schema, {"raw": config[generic_name]["schema"]}),
+            "discovery": (parse_schema, {"raw": config[discovery_name]["schema"]}),
+        },
+        values={
+            "generic_name": generic_name,
+            "specific_name": specific_name,
+            "discovery_name": discovery_name,
+        },
+    )
 
     parsed["config"] = {
         "specific": raw["config"].get(specific_name, {}).get("config", {}),
@@ -78,6 +69,18 @@ def parse_adapter(name: str, raw: dict) -> dict:
     return parsed
 
 
+def parse_cnx_schema(raw: dict) -> dict:
+    """Parse the connection schema of an adapter."""
+    parsed = parse_schema(raw=raw)
+    parsed["connection_label"] = {
+        "name": "connection_label",
+        "title": "Connection Label",
+        "type": "string",
+        "required": False,
+    }
+    return parsed
+
+
 def get_specific_name(raw: dict) -> str:
     """Pass."""
     found = [x for x in raw["config"] if x not in [GENERIC_NAME, DISCOVERY_NAME]]
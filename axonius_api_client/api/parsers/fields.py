@@ -4,30 +4,38 @@ import copy
 from typing import List, Optional
 
 from ...constants import AGG_ADAPTER_NAME, AGG_ADAPTER_TITLE, AGG_EXPR_FIELD_TYPE, ALL_NAME
-from ...tools import strip_left, strip_right
+from ...tools import LazyMap, strip_left, strip_right
 from .constants import OperatorTypeMaps
 
 
-def parse_fields(raw: dict) -> dict:
+def parse_fields(raw: dict) -> LazyMap:
     """Parse all generic and adapter specific fields.
 
+    Notes:
+        The fields of each adapter are parsed the first time the adapter is accessed.
+
     Returns:
-        :obj:`dict`: parsed generic and adapter specific fields
+        :obj:`LazyMap`: parsed generic and adapter specific fields
     """
-    agg_fields: List[dict] = parse_schemas(
-        adapter_name=AGG_ADAPTER_NAME,
-        adapter_title=AGG_ADAPTER_TITLE,
-        adapter_name_raw=f"{AGG_ADAPTER_NAME}_adapter",
-        adapter_prefix="specific_data.data",
-        all_field="specific_data",
-        raw_fields=raw["generic"],
+    agg_prefix = "specific_data.data"
+    agg_base_names: List[str] = [ALL_NAME, "unique_adapter_names_details", "meta_data.client_used"]
+    for field in raw["generic"]:
+        name_base = strip_left(obj=field["name"], fix=agg_prefix).strip(".")
+        agg_base_names += [name_base, f"{name_base}_details"]
+
+    loaders = {}
+    loaders[AGG_ADAPTER_NAME] = (
+        parse_schemas,
+        {
+            "adapter_name": AGG_ADAPTER_NAME,
+            "adapter_title": AGG_ADAPTER_TITLE,
+            "adapter_name_raw": f"{AGG_ADAPTER_NAME}_adapter",
+            "adapter_prefix": agg_prefix,
+            "all_field": "specific_data",
+            "raw_fields": raw["generic"],
+        },
     )
 
-    agg_base_names: List[str] = [x["name_base"] for x in agg_fields]
-
-    parsed = {}
-    parsed[AGG_ADAPTER_NAME] = agg_fields
-
     for raw_name, raw_fields in raw["specific"].items():
         # raw_name = aws_adapter
 
@@ -39,19 +47,20 @@ def parse_fields(raw: dict) -> dict:
 
         title = " ".join(name.split("_")).title()
 
-        fields = parse_schemas(
-            adapter_name_raw=raw_name,
-            adapter_name=name,
-            adapter_prefix=prefix,
-            adapter_title=title,
-            all_field=prefix,
-            raw_fields=raw_fields,
-            agg_base_names=agg_base_names,
+        loaders[name] = (
+            parse_schemas,
+            {
+                "adapter_name_raw": raw_name,
+                "adapter_name": name,
+                "adapter_prefix": prefix,
+                "adapter_title": title,
+                "all_field": prefix,
+                "raw_fields": raw_fields,
+                "agg_base_names": agg_base_names,
+            },
         )
 
-        parsed[name] = fields
-
-    return parsed
+    return LazyMap(loaders=loaders)
 
 
 def is_complex(field: dict) -> bool:
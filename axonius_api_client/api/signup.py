@@ -4,6 +4,7 @@ from ..constants import LOG_LEVEL_API
 from ..exceptions import ResponseNotOk
 from ..http import Http
 from ..logs import get_obj_log
+from ..tools import json_load
 from .routers import API_VERSION, Router
 
 
@@ -35,7 +36,7 @@ class Signup:
     def _signup_get(self) -> dict:
         """Get the status of initial signup."""
         response = self.http(method="get", path=self.router.root)
-        return response.json()
+        return json_load(obj=response.content)
 
     def _signup_post(self, password: str, company_name: str, contact_email: str) -> dict:
         """Do the initial signup."""
@@ -47,7 +48,7 @@ class Signup:
             "confirmNewPassword": password,
         }
         response = self.http(method="post", path=self.router.root, json=data)
-        return response.json()
+        return json_load(obj=response.content)
 
     def __init__(self, url, **kwargs):
         """Pass."""
@@ -11,14 +11,19 @@ class Meta(ChildMixins):
     def about(self) -> dict:
         """Get about page metadata.
 
+        Notes:
+            The metadata is cached in the ``about`` namespace of :attr:`CACHE`.
+
         Returns:
             :obj:`dict`: about page metadata
         """
-        if not hasattr(self, "_about_data"):
-            data = self._about()
-            data["Version"] = self._get_version(about=data)
-            self._about_data = data
-        return self._about_data
+        return self.CACHE.get(namespace="about", key=self.router.meta_about, loader=self._get_about)
+
+    def _get_about(self) -> dict:
+        """Get about page metadata with the version normalized."""
+        data = self._about()
+        data["Version"] = self._get_version(about=data)
+        return data
 
     def historical_sizes(self) -> dict:
         """Get disk usage metadata.
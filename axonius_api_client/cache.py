@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Cache of instance metadata shared by all API models of a client."""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from cachetools import TTLCache
+
+from .constants import CACHE_MAXSIZE, CACHE_TTL, CACHE_TTLS
+
+
+class CacheRegistry:
+    """Cache of instance metadata shared by all API models of a client.
+
+    Notes:
+        Values are cached per namespace (i.e. ``adapters`` or ``labels``) and key (i.e. the
+        route of the asset type) until the TTL of the namespace expires or the namespace is
+        invalidated. API models invalidate a namespace when they change the metadata cached in
+        it, i.e. adding a connection invalidates ``adapters``.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, int]] = None,
+        ttl: int = CACHE_TTL,
+        maxsize: int = CACHE_MAXSIZE,
+        enabled: bool = True,
+    ):
+        """Cache of instance metadata shared by all API models of a client.
+
+        Args:
+            ttls: seconds to cache values for per namespace, merged into
+                :data:`axonius_api_client.constants.CACHE_TTLS`
+            ttl: seconds to cache values for in namespaces not in ttls
+            maxsize: number of keys to cache per namespace
+            enabled: cache values, or always call the loader
+        """
+        self.TTLS: Dict[str, int] = {**CACHE_TTLS, **(ttls or {})}
+        """seconds to cache values for per namespace, 0 to not cache a namespace"""
+
+        self.TTL: int = ttl
+        """seconds to cache values for in namespaces not in :attr:`TTLS`"""
+
+        self.MAXSIZE: int = maxsize
+        """number of keys to cache per namespace"""
+
+        self.ENABLED: bool = enabled
+        """cache values, or always call the loader"""
+
+        self._lock = threading.RLock()
+        self._caches = {}
+        self._generations = {}
+        self._stats = {}
+
+    def __str__(self) -> str:
+        """Show object info."""
+        sizes = ", ".join(f"{k}={len(v)}" for k, v in sorted(self._caches.items()))
+        return f"{self.__class__.__name__}({sizes})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+    def _get_cache(self, namespace: str) -> Optional[TTLCache]:
+        """Get the cache of a namespace, creating it if needed (must hold the lock).
+
+        Args:
+            namespace: namespace of the cache
+
+        Returns:
+            None if the namespace has a TTL of 0
+        """
+        if namespace not in self._caches:
+            ttl = self.TTLS.get(namespace, self.TTL)
+            self._caches[namespace] = TTLCache(maxsize=self.MAXSIZE, ttl=ttl) if ttl else None
+        return self._caches[namespace]
+
+    def _count(self, namespace: str, key: str):
+        """Increment a counter of a namespace (must hold the lock).
+
+        Args:
+            namespace: namespace of the counter
+            key: name of the counter
+        """
+        stats = self._stats.setdefault(
+            namespace, {"hits": 0, "misses": 0, "invalidations": 0, "discarded": 0}
+        )
+        stats[key] += 1
+
+    def get(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Get a value from the cache, calling loader to get it if it is not cached.
+
+        Notes:
+            If the namespace is invalidated while loader is running, the value returned by
+            loader is returned but not cached.
+
+        Args:
+            namespace: namespace of the value
+            key: key of the value in the namespace
+            loader: called with no arguments to get the value if it is not cached
+        """
+        with self._lock:
+            cache = self._get_cache(namespace=namespace) if self.ENABLED else None
+            if cache is not None and key in cache:
+                self._count(namespace=namespace, key="hits")
+                return cache[key]
+            self._count(namespace=namespace, key="misses")
+            generation = self._generations.get(namespace, 0)
+
+        value = loader()
+
+        if cache is not None:
+            with self._lock:
+                if self._generations.get(namespace, 0) == generation:
+                    cache[key] = value
+                else:
+                    self._count(namespace=namespace, key="discarded")
+        return value
+
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None):
+        """Remove values from the cache.
+
+        Args:
+            namespace: namespace to remove values from
+            key: key of the value to remove, or None to remove all values in namespace
+        """
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._count(namespace=namespace, key="invalidations")
+            cache = self._caches.get(namespace)
+            if cache is not None:
+                if key is None:
+                    cache.clear()
+                else:
+                    cache.pop(key, None)
+
+    def clear(self):
+        """Remove all values from the cache."""
+        with self._lock:
+            for namespace in list(self._caches):
+                self.invalidate(namespace=namespace)
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        """Get the hit, miss, and invalidation counts and the number of cached keys per
+        namespace."""
+        with self._lock:
+            stats = {}
+            for namespace, counts in sorted(self._stats.items()):
+                cache = self._caches.get(namespace)
+                stats[namespace] = {**counts, "keys": len(cache) if cache is not None else 0}
+            return stats
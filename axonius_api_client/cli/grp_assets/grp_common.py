@@ -3,7 +3,20 @@
 import tabulate
 
 from ...api.wizard.constants import Results, Types
-from ...constants import FIELD_JOINER, FIELD_TRIM_LEN, TABLE_FORMAT, TABLE_MAX_ROWS
+from ...constants import (
+    ARROW_COMPRESSION,
+    ARROW_COMPRESSIONS,
+    EXPORT_COMPRESSIONS,
+    FIELD_JOINER,
+    FIELD_TRIM_LEN,
+    LABELS_WORKERS,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSIONS,
+    PARQUET_ROW_GROUP_SIZE,
+    SQLITE_BATCH_SIZE,
+    TABLE_FORMAT,
+    TABLE_MAX_ROWS,
+)
 from ...tools import path_read
 from ..context import CONTEXT_SETTINGS, click
 from ..options import (
@@ -98,7 +111,9 @@ GET_EXPORT = [
         "export",
         default="json",
         help="Formatter to use when exporting asset data",
-        type=click.Choice(["csv", "json", "table", "json_to_csv", "xlsx"]),
+        type=click.Choice(
+            ["csv", "json", "table", "json_to_csv", "xlsx", "parquet", "arrow", "sqlite"]
+        ),
         show_envvar=True,
         show_default=True,
     ),
@@ -132,6 +147,97 @@ GET_EXPORT = [
         show_default=True,
         hidden=False,
     ),
+    click.option(
+        "--export-compression",
+        "export_compression",
+        default=None,
+        help="Compress --export-file for csv, json, and json_to_csv (default: by file extension)",
+        type=click.Choice(list(EXPORT_COMPRESSIONS) + ["none"]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-compression-level",
+        "export_compression_level",
+        default=None,
+        help="Compression level to use for --export-compression",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--parquet-compression",
+        "parquet_compression",
+        default=PARQUET_COMPRESSION,
+        help="Compression codec to use for --export-format=parquet",
+        type=click.Choice(PARQUET_COMPRESSIONS),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--parquet-row-group-size",
+        "parquet_row_group_size",
+        default=PARQUET_ROW_GROUP_SIZE,
+        help="Rows to buffer and write per row group for --export-format=parquet",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
+    click.option(
+        "--arrow-compression",
+        "arrow_compression",
+        default=ARROW_COMPRESSION,
+        help="Compression codec to use for --export-format=arrow",
+        type=click.Choice(ARROW_COMPRESSIONS),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-table",
+        "sqlite_table",
+        default=None,
+        help="Name of the main table for --export-format=sqlite (default: asset type)",
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+        metavar="TABLE",
+    ),
+    click.option(
+        "--sqlite-upsert/--no-sqlite-upsert",
+        "sqlite_upsert",
+        default=False,
+        help="Replace assets that already exist in --export-file for --export-format=sqlite",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-index",
+        "sqlite_indexes",
+        help="Fields to index after loading for --export-format=sqlite (multiples)",
+        multiple=True,
+        default=[],
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+        metavar="FIELD",
+    ),
+    click.option(
+        "--sqlite-batch-size",
+        "sqlite_batch_size",
+        default=SQLITE_BATCH_SIZE,
+        help="Rows to buffer and insert per batch for --export-format=sqlite",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
     click.option(
         "--schema/--no-schema",
         "export_schema",
@@ -201,6 +307,16 @@ GET_EXPORT = [
         hidden=False,
         metavar="FIELD",
     ),
+    click.option(
+        "--explode-stream/--no-explode-stream",
+        "field_explode_stream",
+        default=None,
+        help="Write each exploded row as it is built instead of exploding the whole asset first",
+        show_envvar=True,
+        show_default=True,
+        is_flag=True,
+        hidden=False,
+    ),
     click.option(
         "--flatten/--no-flatten",
         "field_flatten",
@@ -283,6 +399,58 @@ GET_EXPORT = [
         hidden=False,
         metavar="TAG",
     ),
+    click.option(
+        "--tag-batch-size",
+        "tags_batch_size",
+        help="Add/remove tags every N assets instead of after all assets are fetched",
+        default=None,
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+        metavar="N",
+    ),
+    click.option(
+        "--tag-workers",
+        "tags_workers",
+        help="Number of threads to use for adding/removing tags",
+        default=LABELS_WORKERS,
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+        metavar="N",
+    ),
+    click.option(
+        "--checkpoint-file",
+        "checkpoint",
+        help="Save the paging state and export file offset to this file after each page",
+        default=None,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+        metavar="PATH",
+    ),
+    click.option(
+        "--resume/--no-resume",
+        "resume",
+        help="Continue from the page saved in --checkpoint-file and append to --export-file",
+        default=False,
+        show_envvar=True,
+        show_default=True,
+        is_flag=True,
+        hidden=False,
+    ),
+    click.option(
+        "--delta-manifest",
+        "delta_manifest",
+        help="Only export assets added, changed, or removed since the export that saved this file",
+        default=None,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+        metavar="PATH",
+    ),
     click.option(
         "--include-details/--no-include-details",
         "-id/-nid",
@@ -263,6 +263,43 @@ PAGING = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--prefetch-pages",
+        "prefetch_pages",
+        default=0,
+        type=click.INT,
+        help="Fetch up to N pages in the background while processing the current page",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--workers",
+        "workers",
+        default=0,
+        type=click.INT,
+        help="Fetch pages in parallel using N threads (disables cursor paging)",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--workers-ordered/--no-workers-ordered",
+        "workers_ordered",
+        default=True,
+        help="Return rows from pages fetched in parallel in page order",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=True,
+    ),
+    click.option(
+        "--stream/--no-stream",
+        "stream",
+        default=False,
+        help="Parse rows from each page as it is read instead of loading the whole page",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 SPLIT_CONFIG_OPT = click.option(
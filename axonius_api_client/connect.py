@@ -1,15 +1,29 @@
 # -*- coding: utf-8 -*-
 """Easy all-in-one connection handler."""
+import asyncio
 import logging
 import pathlib
 import re
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 import requests
 
 from .api import Adapters, Dashboard, Devices, Enforcements, Instances, RunAction, System, Users
 from .auth import ApiKey
+from .cache import CacheRegistry
 from .constants import (
+    CACHE_TTLS,
+    FIELDS_CACHE_PATH,
+    FIELDS_CACHE_TTL,
+    HTTP_HISTORY_BODIES,
+    HTTP_HISTORY_MAX,
+    HTTP_HISTORY_MAX_BYTES,
+    HTTP_POOL_BLOCK,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_SOCKET_KEEPALIVE,
     LOG_FILE_MAX_FILES,
     LOG_FILE_MAX_MB,
     LOG_FILE_NAME,
@@ -26,7 +40,7 @@ from .constants import (
     TIMEOUT_RESPONSE,
 )
 from .exceptions import ConnectError, InvalidCredentials
-from .http import Http
+from .http import AsyncHttp, Http
 from .logs import LOG, add_file, add_stderr, get_obj_log, set_log_level
 from .tools import json_dump, sysinfo
 from .version import __version__ as VERSION
@@ -83,6 +97,9 @@ class Connect:
     ]
     """patterns to look for in exceptions that we can pretty up for user display."""
 
+    HTTP_CLS: type = Http
+    """HTTP client class to use for :attr:`HTTP`"""
+
     def start(self):
         """Connect to and authenticate with Axonius."""
         if not self.STARTED:
@@ -234,6 +251,18 @@ class Connect:
         """append responses to :attr:`axonius_api_client.http.Http.HISTORY`
         ``kwargs=save_history``"""
 
+        self.HISTORY_MAX: int = kwargs.get("history_max", HTTP_HISTORY_MAX)
+        """number of responses to keep in :attr:`axonius_api_client.http.Http.HISTORY`
+        ``kwargs=history_max``"""
+
+        self.HISTORY_MAX_BYTES: int = kwargs.get("history_max_bytes", HTTP_HISTORY_MAX_BYTES)
+        """number of bytes of response bodies to keep in
+        :attr:`axonius_api_client.http.Http.HISTORY` ``kwargs=history_max_bytes``"""
+
+        self.HISTORY_BODIES: bool = kwargs.get("history_bodies", HTTP_HISTORY_BODIES)
+        """keep responses in :attr:`axonius_api_client.http.Http.HISTORY`, or only their
+        metadata ``kwargs=history_bodies``"""
+
         self.LOG_LEVEL: Union[str, int] = kwargs.get("log_level", "debug")
         """log level for this class ``kwargs=log_level``"""
 
@@ -291,6 +320,41 @@ class Connect:
         self.LOG_FILE_MAX_FILES: int = kwargs.get("log_file_max_files", LOG_FILE_MAX_FILES)
         """number of rollover file logs to keep ``kwargs=log_file_max_files``"""
 
+        self.FIELDS_CACHE_PATH: Optional[Union[str, pathlib.Path]] = kwargs.get(
+            "fields_cache_path", FIELDS_CACHE_PATH
+        )
+        """directory to cache parsed field schemas in ``kwargs=fields_cache_path``"""
+
+        self.FIELDS_CACHE_TTL: int = kwargs.get("fields_cache_ttl", FIELDS_CACHE_TTL)
+        """seconds that cached field schemas are valid for ``kwargs=fields_cache_ttl``"""
+
+        self.CACHE_TTLS: Dict[str, int] = kwargs.get("cache_ttls", CACHE_TTLS)
+        """seconds to cache instance metadata for per namespace in :attr:`CACHE`
+        ``kwargs=cache_ttls``"""
+
+        self.CACHE_ENABLED: bool = kwargs.get("cache_enabled", True)
+        """cache instance metadata in :attr:`CACHE` ``kwargs=cache_enabled``"""
+
+        self.POOL_CONNECTIONS: int = kwargs.get("pool_connections", HTTP_POOL_CONNECTIONS)
+        """number of connection pools (one per host) to keep ``kwargs=pool_connections``"""
+
+        self.POOL_MAXSIZE: int = kwargs.get("pool_maxsize", HTTP_POOL_MAXSIZE)
+        """number of connections per host to keep open for re-use ``kwargs=pool_maxsize``"""
+
+        self.POOL_BLOCK: bool = kwargs.get("pool_block", HTTP_POOL_BLOCK)
+        """wait for a free connection when all connections to a host are in use
+        ``kwargs=pool_block``"""
+
+        self.SOCKET_KEEPALIVE: bool = kwargs.get("socket_keepalive", HTTP_SOCKET_KEEPALIVE)
+        """enable TCP keepalive on connections ``kwargs=socket_keepalive``"""
+
+        self.RETRIES: int = kwargs.get("retries", HTTP_RETRIES)
+        """number of times to retry requests that are safe to repeat ``kwargs=retries``"""
+
+        self.RETRY_BACKOFF: float = kwargs.get("retry_backoff", HTTP_RETRY_BACKOFF)
+        """seconds to sleep before the first retry, doubled for each retry after it
+        ``kwargs=retry_backoff``"""
+
         self.WRAPERROR: bool = kwargs.get("wraperror", True)
         """wrap errors in human friendly way or show full traceback ``kwargs=wraperror``"""
 
@@ -339,21 +403,40 @@ class Connect:
             "log_request_body": self.LOG_REQUEST_BODY,
             "log_response_body": self.LOG_RESPONSE_BODY,
             "save_history": self.SAVE_HISTORY,
+            "history_max": self.HISTORY_MAX,
+            "history_max_bytes": self.HISTORY_MAX_BYTES,
+            "history_bodies": self.HISTORY_BODIES,
             "connect_timeout": self.TIMEOUT_CONNECT,
             "response_timeout": self.TIMEOUT_RESPONSE,
+            "pool_connections": self.POOL_CONNECTIONS,
+            "pool_maxsize": self.POOL_MAXSIZE,
+            "pool_block": self.POOL_BLOCK,
+            "socket_keepalive": self.SOCKET_KEEPALIVE,
+            "retries": self.RETRIES,
+            "retry_backoff": self.RETRY_BACKOFF,
         }
         """arguments to use for creating :attr:`HTTP`"""
 
         self.AUTH_ARGS: dict = {"key": key, "secret": secret, "log_level": self.LOG_LEVEL_AUTH}
         """arguments to use for creating :attr:`AUTH`"""
 
-        self.HTTP = Http(**self.HTTP_ARGS)
+        self.HTTP = self.HTTP_CLS(**self.HTTP_ARGS)
         """:obj:`axonius_api_client.http.Http` client to use for :attr:`AUTH`"""
 
         self.AUTH = ApiKey(http=self.HTTP, **self.AUTH_ARGS)
         """:obj:`axonius_api_client.auth.api_key.ApiKey` auth method to use for all API models"""
 
-        self.API_ARGS: dict = {"auth": self.AUTH, "log_level": self.LOG_LEVEL_API}
+        self.CACHE = CacheRegistry(ttls=self.CACHE_TTLS, enabled=self.CACHE_ENABLED)
+        """:obj:`axonius_api_client.cache.CacheRegistry` of instance metadata shared by all
+        API models"""
+
+        self.API_ARGS: dict = {
+            "auth": self.AUTH,
+            "log_level": self.LOG_LEVEL_API,
+            "fields_cache_path": self.FIELDS_CACHE_PATH,
+            "fields_cache_ttl": self.FIELDS_CACHE_TTL,
+            "cache": self.CACHE,
+        }
         """arguments to use for all API models"""
 
     def __str__(self) -> str:
@@ -387,3 +470,50 @@ class Connect:
             if reason_re.search(reason):
                 return reason_re.sub(r"\1", reason).rstrip("')")
         return reason
+
+
+class AsyncConnect(Connect):
+    """Easy all-in-one connection handler for using the API client with asyncio.
+
+    Notes:
+        Requires the optional dependency httpx: ``pip install axonius_api_client[async]``.
+        Everything on :obj:`Connect` works the same, the API models also get async methods
+        that send requests using :meth:`axonius_api_client.http.AsyncHttp.acall`, such as
+        :meth:`axonius_api_client.api.mixins.ModelMixins.arequest` and
+        :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.aget`.
+
+    Examples:
+        >>> import asyncio
+        >>>
+        >>> from axonius_api_client.connect import AsyncConnect
+        >>>
+        >>> async def main():
+        ...     async with AsyncConnect(url=AX_URL, key=AX_KEY, secret=AX_SECRET) as client:
+        ...         async for row in client.devices.aget(max_rows=10):
+        ...             print(row)
+        >>>
+        >>> asyncio.run(main())
+
+    """
+
+    HTTP_CLS: type = AsyncHttp
+    """HTTP client class to use for :attr:`HTTP`"""
+
+    async def astart(self):
+        """Connect to and authenticate with Axonius without blocking the event loop."""
+        if not self.STARTED:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.start)
+
+    async def aclose(self):
+        """Close the connections opened by the async HTTP client."""
+        await self.HTTP.aclose()
+
+    async def __aenter__(self) -> "AsyncConnect":
+        """Start the client when used as an async context manager."""
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc):
+        """Close the async HTTP client when leaving an async context manager."""
+        await self.aclose()
@@ -65,9 +65,24 @@ MAX_PAGE_SIZE: int = 2000
 PAGE_SIZE: int = MAX_PAGE_SIZE
 """API wide default page size to use."""
 
+STREAM_CHUNK_SIZE: int = 65536
+"""bytes to read at a time from the response body when streaming pages"""
+
 PAGE_SLEEP: int = 0
 """API wide default number of seconds to sleep between in page."""
 
+LABELS_BATCH_SIZE: int = 100
+"""number of assets to add or remove labels/tags to per request, more seems to break API"""
+
+LABELS_WORKERS: int = 1
+"""number of threads to use for sending batches of label/tag requests"""
+
+LABELS_RETRIES: int = 2
+"""number of times to retry a batch of label/tag requests that failed"""
+
+LABELS_RETRY_SLEEP: int = 1
+"""number of seconds to sleep before retrying a batch of label/tag requests, times the try"""
+
 GUI_PAGE_SIZES: List[int] = [25, 50, 100]
 """valid page sizes for GUI paging"""
 
@@ -96,6 +111,86 @@ TIMEOUT_CONNECT: int = 5
 TIMEOUT_RESPONSE: int = 900
 """seconds to wait for response from API."""
 
+HTTP_POOL_CONNECTIONS: int = 10
+"""number of connection pools (one per host) to keep for the API"""
+
+HTTP_POOL_MAXSIZE: int = 10
+"""number of connections per host to keep open for re-use, raise this when using workers."""
+
+HTTP_POOL_BLOCK: bool = False
+"""wait for a connection to be free when HTTP_POOL_MAXSIZE connections are in use instead of
+opening a connection that will be thrown away after use"""
+
+HTTP_SOCKET_KEEPALIVE: bool = True
+"""enable TCP keepalive on connections to the API so idle connections stay open"""
+
+HTTP_SOCKET_KEEPALIVE_IDLE: int = 60
+"""seconds a connection is idle before sending TCP keepalive probes, where supported"""
+
+HTTP_SOCKET_KEEPALIVE_INTERVAL: int = 15
+"""seconds between TCP keepalive probes, where supported"""
+
+HTTP_SOCKET_KEEPALIVE_COUNT: int = 4
+"""number of TCP keepalive probes to send before dropping a connection, where supported"""
+
+HTTP_RETRIES: int = 3
+"""number of times to retry a request that is safe to repeat after a retryable error"""
+
+HTTP_RETRY_BACKOFF: float = 0.5
+"""seconds to sleep before the first retry, doubled for each retry after it"""
+
+HTTP_RETRY_BACKOFF_MAX: float = 30.0
+"""maximum seconds to sleep between retries, unless the response has a Retry-After header"""
+
+HTTP_RETRY_JITTER: float = 0.5
+"""fraction of the backoff to randomly remove from each sleep so that threads do not retry in
+lockstep"""
+
+HTTP_RETRY_STATUSES: List[int] = [429, 500, 502, 503, 504]
+"""response status codes that can be retried"""
+
+HTTP_RETRY_METHODS: List[str] = ["GET", "HEAD", "OPTIONS"]
+"""request methods that are safe to repeat unless a request is marked as safe"""
+
+HTTP_HISTORY_MAX: int = 100
+"""number of responses to keep in the history of the HTTP client when save_history is True"""
+
+HTTP_HISTORY_MAX_BYTES: int = 50 * 1024 * 1024
+"""number of bytes of response bodies to keep in the history of the HTTP client"""
+
+HTTP_HISTORY_BODIES: bool = True
+"""keep the responses in the history of the HTTP client, or only their metadata"""
+
+HTTP_GZIP_REQUEST_MIN_SIZE: Optional[int] = None
+"""gzip compress request bodies of at least this many bytes for requests to endpoints that
+accept compressed bodies, None to never compress request bodies"""
+
+HTTP_GZIP_LEVEL: int = 6
+"""compression level (1-9) to use when compressing request bodies"""
+
+METRICS_BUCKETS: List[float] = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300]
+"""upper bounds in seconds of the request latency histogram buckets of the metrics registry"""
+
+METRICS_PREFIX: str = "axonius_api_client"
+"""prefix of the metric names in the Prometheus text format of the metrics registry"""
+
+CACHE_TTLS: Dict[str, int] = {
+    "about": 3600,
+    "adapters": 60,
+    "fields": 300,
+    "history_dates": 300,
+    "labels": 60,
+    "saved_queries": 60,
+}
+"""seconds that metadata is cached for by the cache registry of a client, per namespace"""
+
+CACHE_TTL: int = 60
+"""seconds that metadata is cached for by the cache registry in namespaces not in
+:data:`CACHE_TTLS`"""
+
+CACHE_MAXSIZE: int = 128
+"""number of keys to cache per namespace in the cache registry of a client"""
+
 LOG_FMT_VERBOSE: str = (
     "%(asctime)s %(levelname)-8s [%(name)s:%(funcName)s:%(pathname)s:%(lineno)d] " "%(message)s"
 )
@@ -108,6 +203,17 @@ DEBUG: str = os.environ.get("AX_DEBUG", "").lower().strip()
 DEBUG: bool = any([DEBUG == x for x in YES])
 """Enable API wide debug logging, looks at environment variable AX_DEBUG."""
 
+FIELDS_CACHE_PATH: Optional[str] = os.environ.get("AX_FIELDS_CACHE_PATH", "").strip() or None
+"""directory to cache parsed field schemas in, looks at environment variable AX_FIELDS_CACHE_PATH.
+
+If not set, field schemas are only cached in memory for the life of the process."""
+
+FIELDS_CACHE_TTL: int = 3600
+"""number of seconds that field schemas cached in :attr:`FIELDS_CACHE_PATH` are valid for"""
+
+FIELDS_CACHE_PATH_MODE = 0o700
+"""permissions to set on :attr:`FIELDS_CACHE_PATH` when creating it"""
+
 LOG_FMT_CONSOLE: str = LOG_FMT_VERBOSE if DEBUG else LOG_FMT_BRIEF
 """default logging format for console logs, will be verbose if :attr:`DEBUG` is true"""
 
@@ -221,6 +327,39 @@ TABLE_FORMAT: str = "fancy_grid"
 TABLE_MAX_ROWS: int = 5
 """Default row limit for tablize export"""
 
+PARQUET_COMPRESSION: str = "snappy"
+"""Default compression codec for parquet export"""
+
+PARQUET_COMPRESSIONS: List[str] = ["snappy", "gzip", "brotli", "lz4", "zstd", "none"]
+"""Valid compression codecs for parquet export"""
+
+PARQUET_ROW_GROUP_SIZE: int = 10000
+"""Default number of rows to buffer and write per row group for parquet and arrow export"""
+
+ARROW_COMPRESSION: str = "none"
+"""Default compression codec for arrow export"""
+
+ARROW_COMPRESSIONS: List[str] = ["lz4", "zstd", "none"]
+"""Valid compression codecs for arrow export"""
+
+SQLITE_BATCH_SIZE: int = 5000
+"""Default number of rows to buffer and insert per batch for sqlite export"""
+
+DELTA_HASH_VERSION: int = 2
+"""Version of the content hash of assets in delta manifests, bump when the hash changes"""
+
+EXPORT_COMPRESSIONS: Dict[str, str] = {"gzip": ".gz", "bz2": ".bz2", "zstd": ".zst"}
+"""compression codecs for export files and the file extension of each"""
+
+EXPORT_COMPRESSION_LEVELS: Dict[str, int] = {"gzip": 6, "bz2": 9, "zstd": 3}
+"""default compression level of each compression codec for export files"""
+
+EXPORT_COMPRESSION_BUFFER: int = 1024 * 1024
+"""characters to buffer before handing them to the thread that compresses an export file"""
+
+EXPORT_COMPRESSION_QUEUE: int = 8
+"""buffers that can wait to be compressed before writing to an export file blocks"""
+
 OK_ARGS: dict = {"fg": "green", "bold": True, "err": True}
 """default arguments for echo_ok"""
 
@@ -282,6 +421,24 @@ SCHEMAS_CUSTOM: Dict[str, dict] = {
             "is_custom": True,
         }
     },
+    "delta": {
+        "delta_change": {
+            "adapter_name": "report",
+            "column_name": "report:delta_change",
+            "column_title": "Report: Delta Change",
+            "is_complex": False,
+            "is_list": False,
+            "is_root": True,
+            "parent": "root",
+            "name": "delta_change",
+            "name_base": "delta_change",
+            "name_qual": "delta_change",
+            "title": "Delta Change",
+            "type": "string",
+            "type_norm": "string",
+            "is_custom": True,
+        }
+    },
     "report_software_whitelist": {
         "software_missing": {
             "adapter_name": "report",
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark the json codecs used by the export callbacks.
+
+Does not need an Axonius instance, the rows are generated to look like assets with wide
+complex fields. Install orjson and/or ujson to compare them to the stdlib json module.
+"""
+import time
+
+from axonius_api_client.tools import (
+    JSON_CODECS,
+    JSON_SEPARATORS,
+    json_codec,
+    json_dump,
+    json_load,
+)
+
+ROWS = 2000
+SOFTWARE = 200
+
+
+def make_row(num):
+    """Build a row that looks like a device asset with installed software."""
+    return {
+        "internal_axon_id": f"{num:032x}",
+        "adapters": ["aws_adapter", "crowd_strike_adapter", "active_directory_adapter"],
+        "labels": ["tag1", "tag2"],
+        "specific_data.data.hostname": [f"host{num}.example.com"],
+        "specific_data.data.network_interfaces.ips": [f"10.0.{num % 255}.{x}" for x in range(4)],
+        "specific_data.data.installed_software": [
+            {"name": f"software {x}", "version": f"{x}.{num}.0", "vendor": "vendor"}
+            for x in range(SOFTWARE)
+        ],
+    }
+
+
+def export_json(rows):
+    """Serialize rows the same way as the json export callback."""
+    for row in rows:
+        value = json_dump(obj=row, indent=2)
+        value = "  " + value.replace("\n", "\n  ")
+
+
+def export_json_to_csv(rows):
+    """Round trip rows through json the same way as the json_to_csv export callback."""
+    for row in rows:
+        json_load(obj=json_dump(obj=row, indent=None, separators=JSON_SEPARATORS))
+
+
+def bench(name, method, rows):
+    """Time method on rows for every codec installed."""
+    for codec in JSON_CODECS:
+        json_codec(codec)
+        start = time.perf_counter()
+        method(rows)
+        took = time.perf_counter() - start
+        print(f"{name:<20} {codec:<8} {len(rows) / took:>10.0f} rows/sec ({took:.2f} secs)")
+
+
+if __name__ == "__main__":
+    rows = [make_row(num) for num in range(ROWS)]
+    default = json_codec()
+    try:
+        bench(name="json", method=export_json, rows=rows)
+        bench(name="json_to_csv", method=export_json_to_csv, rows=rows)
+    finally:
+        json_codec(default)
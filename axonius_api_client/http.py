@@ -1,13 +1,40 @@
 # -*- coding: utf-8 -*-
 """HTTP client."""
+import asyncio
+import collections
+import email.utils
+import gzip
 import logging
 import pathlib
+import random
+import socket
+import ssl
+import threading
+import time
 import warnings
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple, Type, Union
 
 import requests
 
 from .constants import (
+    HTTP_GZIP_LEVEL,
+    HTTP_GZIP_REQUEST_MIN_SIZE,
+    HTTP_HISTORY_BODIES,
+    HTTP_HISTORY_MAX,
+    HTTP_HISTORY_MAX_BYTES,
+    HTTP_POOL_BLOCK,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_BACKOFF_MAX,
+    HTTP_RETRY_JITTER,
+    HTTP_RETRY_METHODS,
+    HTTP_RETRY_STATUSES,
+    HTTP_SOCKET_KEEPALIVE,
+    HTTP_SOCKET_KEEPALIVE_COUNT,
+    HTTP_SOCKET_KEEPALIVE_IDLE,
+    HTTP_SOCKET_KEEPALIVE_INTERVAL,
     LOG_LEVEL_HTTP,
     MAX_BODY_LEN,
     REQUEST_ATTR_MAP,
@@ -17,10 +44,16 @@ from .constants import (
 )
 from .exceptions import HttpError
 from .logs import get_obj_log, set_log_level
-from .tools import join_url, json_reload, listify, path_read
+from .metrics import METRICS, ROUTE_UNKNOWN, MetricsRegistry, get_route_name
+from .tools import JSON_SEPARATORS, join_url, json_dump, json_reload, listify, path_read
 from .url_parser import UrlParser
 from .version import __version__
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
 InsecureRequestWarning = requests.urllib3.exceptions.InsecureRequestWarning
 
 
@@ -78,6 +111,16 @@ class Http:
         self.SAVEHISTORY: bool = kwargs.get("save_history", False)
         """Append all responses to :attr:`HISTORY` ``kwargs=save_history``"""
 
+        self.HISTORY_MAX: int = kwargs.get("history_max", HTTP_HISTORY_MAX)
+        """number of responses to keep in :attr:`HISTORY` ``kwargs=history_max``"""
+
+        self.HISTORY_MAX_BYTES: int = kwargs.get("history_max_bytes", HTTP_HISTORY_MAX_BYTES)
+        """number of bytes of response bodies to keep in :attr:`HISTORY`
+        ``kwargs=history_max_bytes``"""
+
+        self.HISTORY_BODIES: bool = kwargs.get("history_bodies", HTTP_HISTORY_BODIES)
+        """keep responses in :attr:`HISTORY`, or only their metadata ``kwargs=history_bodies``"""
+
         self.CONNECT_TIMEOUT: int = kwargs.get("connect_timeout", TIMEOUT_CONNECT)
         """seconds to wait for connections to open to :attr:`url` ``kwargs=connect_timeout``"""
 
@@ -126,14 +169,66 @@ class Http:
         """cert file with both private key and cert to offer to :attr:`url`
         ``kwargs=cert_client_both``"""
 
+        self.POOL_CONNECTIONS: int = kwargs.get("pool_connections", HTTP_POOL_CONNECTIONS)
+        """number of connection pools (one per host) to keep ``kwargs=pool_connections``"""
+
+        self.POOL_MAXSIZE: int = kwargs.get("pool_maxsize", HTTP_POOL_MAXSIZE)
+        """number of connections per host to keep open for re-use ``kwargs=pool_maxsize``"""
+
+        self.POOL_BLOCK: bool = kwargs.get("pool_block", HTTP_POOL_BLOCK)
+        """wait for a free connection when all connections to a host are in use
+        ``kwargs=pool_block``"""
+
+        self.SOCKET_KEEPALIVE: bool = kwargs.get("socket_keepalive", HTTP_SOCKET_KEEPALIVE)
+        """enable TCP keepalive on connections ``kwargs=socket_keepalive``"""
+
+        self.SOCKET_OPTIONS: List[tuple] = kwargs.get(
+            "socket_options", self._get_socket_options(keepalive=self.SOCKET_KEEPALIVE)
+        )
+        """socket options to set on new connections ``kwargs=socket_options``"""
+
+        self.RETRY: RetryPolicy = kwargs.get("retry_policy", None) or RetryPolicy(
+            retries=kwargs.get("retries", HTTP_RETRIES),
+            backoff=kwargs.get("retry_backoff", HTTP_RETRY_BACKOFF),
+            backoff_max=kwargs.get("retry_backoff_max", HTTP_RETRY_BACKOFF_MAX),
+            jitter=kwargs.get("retry_jitter", HTTP_RETRY_JITTER),
+            statuses=kwargs.get("retry_statuses", HTTP_RETRY_STATUSES),
+        )
+        """policy for retrying requests that are safe to repeat ``kwargs=retry_policy`` or
+        ``kwargs=retries``, ``kwargs=retry_backoff``, ``kwargs=retry_backoff_max``,
+        ``kwargs=retry_jitter``, ``kwargs=retry_statuses``"""
+
+        self.ACCEPT_ENCODING: str = kwargs.get(
+            "accept_encoding", requests.urllib3.util.request.ACCEPT_ENCODING
+        )
+        """content encodings to ask for responses to be compressed with, defaults to all of the
+        encodings that urllib3 can decode ``kwargs=accept_encoding``"""
+
+        self.GZIP_REQUEST_MIN_SIZE: Optional[int] = kwargs.get(
+            "gzip_request_min_size", HTTP_GZIP_REQUEST_MIN_SIZE
+        )
+        """gzip compress request bodies of at least this many bytes for requests sent with
+        compress=True, None to never compress ``kwargs=gzip_request_min_size``"""
+
+        self.GZIP_LEVEL: int = kwargs.get("gzip_level", HTTP_GZIP_LEVEL)
+        """compression level to use for request bodies ``kwargs=gzip_level``"""
+
+        self.METRICS: Optional[MetricsRegistry] = kwargs.get("metrics", METRICS)
+        """registry to record the metrics of each request in, None to not record metrics
+        ``kwargs=metrics``"""
+
         self.LAST_REQUEST = None
         """:obj:`requests.PreparedRequest`: last request sent"""
 
         self.LAST_RESPONSE = None
         """:obj:`requests.Response`: last response received"""
 
-        self.HISTORY = []
-        """:obj:`list` of :obj:`requests.Response`: all responses received."""
+        self.HISTORY: HttpHistory = HttpHistory(
+            max_entries=self.HISTORY_MAX,
+            max_bytes=self.HISTORY_MAX_BYTES,
+            bodies=self.HISTORY_BODIES,
+        )
+        """:obj:`HttpHistory`: the most recent responses received."""
 
         self.log_request_attrs: Optional[List[str]] = self.LOG_REQUEST_ATTRS
         self.log_response_attrs: Optional[List[str]] = self.LOG_RESPONSE_ATTRS
@@ -141,6 +236,21 @@ class Http:
         self.session: requests.Session = requests.Session()
         """:obj:`requests.Session`: session object to use"""
 
+        self.adapter: HttpAdapter = HttpAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=self.POOL_BLOCK,
+            socket_options=self.SOCKET_OPTIONS,
+        )
+        """:obj:`HttpAdapter`: transport adapter mounted on :attr:`session`"""
+
+        self.session.headers["Accept-Encoding"] = self.ACCEPT_ENCODING
+        self._transfer_lock = threading.Lock()
+        self.reset_transfer_stats()
+
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
         self.session.proxies = {}
         self.session.proxies["https"] = self.HTTPS_PROXY
         self.session.proxies["http"] = self.HTTP_PROXY
@@ -184,12 +294,18 @@ class Http:
         headers: Optional[dict] = None,
         json: Optional[dict] = None,
         files: tuple = None,
+        safe: Optional[bool] = None,
+        compress: bool = False,
         # fmt: off
         **kwargs
         # fmt: on
     ) -> requests.Response:
         """Create, prepare, and then send a request using :attr:`session`.
 
+        Notes:
+            If the request is safe to repeat, it is retried using :attr:`RETRY` when a
+            connection error happens or the response has a retryable status code.
+
         Args:
             path (:obj:`str`, optional): default ``None`` - path to append to
                 :attr:`url`
@@ -202,6 +318,11 @@ class Http:
             json (:obj:`dict`, optional): default ``None`` - obj to encode as json
             files (:obj:`tuple` of :obj:`tuple`, optional): default ``None`` - files to
                 send
+            safe (:obj:`bool`, optional): default ``None`` - request can be repeated without
+                side effects, ``None`` to decide using the method
+            compress (:obj:`bool`, optional): default ``False`` - endpoint accepts gzip
+                compressed request bodies, compress the body if it is at least
+                :attr:`GZIP_REQUEST_MIN_SIZE` bytes
             **kwargs:
                 overrides for object attributes
 
@@ -225,6 +346,8 @@ class Http:
 
         headers = headers or {}
         headers.setdefault("User-Agent", self.user_agent)
+        data, json = self._encode_json(data=data, json=json, headers=headers)
+        data = self._compress_body(data=data, headers=headers, compress=compress)
 
         request = requests.Request(
             url=url,
@@ -256,7 +379,8 @@ class Http:
             kwargs.get("response_timeout", self.RESPONSE_TIMEOUT),
         )
 
-        response = self.session.send(**send_args)
+        route_name = get_route_name(path=join_url("", path, route))
+        response = self._send_retry(send_args=send_args, safe=safe, route=route_name)
 
         if self.SAVE_LAST:
             self.LAST_RESPONSE = response
@@ -264,10 +388,186 @@ class Http:
         if self.SAVEHISTORY:
             self.HISTORY.append(response)
 
-        self._do_log_response(response=response)
+        self._do_log_response(response=response, stream=kwargs.get("stream", False))
 
         return response
 
+    def _compress_body(self, data: Any, headers: dict, compress: bool = False) -> Any:
+        """Gzip compress a request body if it is large enough.
+
+        Args:
+            data: body to send
+            headers: headers to add a Content-Encoding to if the body is compressed
+            compress: endpoint accepts gzip compressed request bodies
+        """
+        min_size = self.GZIP_REQUEST_MIN_SIZE
+        if not compress or min_size is None or not isinstance(data, (str, bytes)):
+            return data
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if len(data) < min_size:
+            return data
+
+        compressed = gzip.compress(data, compresslevel=self.GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
+        self._count_transfer(
+            requests_compressed=1,
+            request_bytes=len(data),
+            request_bytes_sent=len(compressed),
+        )
+        return compressed
+
+    def _count_transfer(self, **counts):
+        """Increment the counters in :attr:`transfer_stats`.
+
+        Args:
+            **counts: counters to increment
+        """
+        with self._transfer_lock:
+            for key, value in counts.items():
+                self._transfer_stats[key] += value
+
+    @property
+    def transfer_stats(self) -> dict:
+        """Get the counters of compressed and decompressed bytes sent and received.
+
+        Notes:
+            request_bytes and request_bytes_sent only count the bodies that were compressed.
+            response_bytes and response_bytes_received only count the bodies that were read
+            before the response was returned, i.e. not streamed responses.
+        """
+        with self._transfer_lock:
+            return dict(self._transfer_stats)
+
+    def reset_transfer_stats(self):
+        """Reset the counters in :attr:`transfer_stats`."""
+        with self._transfer_lock:
+            self._transfer_stats = {
+                "requests_compressed": 0,
+                "request_bytes": 0,
+                "request_bytes_sent": 0,
+                "responses": 0,
+                "responses_compressed": 0,
+                "response_bytes": 0,
+                "response_bytes_received": 0,
+            }
+
+    def _count_response(self, response):
+        """Count the decompressed and received bytes of a response in :attr:`transfer_stats`.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` that was received
+        """
+        content = getattr(response, "_content", None)
+        if not isinstance(content, bytes):
+            return
+
+        encoding = response.headers.get("Content-Encoding", "").strip().lower()
+        compressed = encoding not in ["", "identity"]
+        self._count_transfer(
+            responses=1,
+            responses_compressed=1 if compressed else 0,
+            response_bytes=len(content),
+            response_bytes_received=self.get_received_size(response=response),
+        )
+
+    @staticmethod
+    def get_received_size(response) -> int:
+        """Get the number of bytes of the body of a response that were received before decoding.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` object
+        """
+        received = getattr(response, "num_bytes_downloaded", None)
+        if received is None:
+            raw = getattr(response, "raw", None)
+            received = raw.tell() if hasattr(raw, "tell") else None
+
+        if received is None:
+            received = HttpHistory.get_body_size(response=response)
+        return received
+
+    def _send_retry(
+        self, send_args: dict, safe: Optional[bool] = None, route: str = ROUTE_UNKNOWN
+    ) -> requests.Response:
+        """Send a prepared request, retrying it using :attr:`RETRY` if it is safe to repeat.
+
+        Args:
+            send_args: arguments for :meth:`requests.Session.send`
+            safe: request can be repeated without side effects, ``None`` to decide using the
+                method
+            route: route name of the request to record metrics for in :attr:`METRICS`
+        """
+        request = send_args["request"]
+        retry = self.RETRY
+        attempt = 0
+
+        while True:
+            retry.count(key="requests")
+            response, exc = None, None
+            start = time.monotonic()
+
+            try:
+                response = self.session.send(**send_args)
+            except retry.EXCEPTIONS as send_exc:
+                exc = send_exc
+            finally:
+                self._observe(route=route, start=start, request=request, response=response)
+
+            reason = retry.get_reason(
+                method=request.method, attempt=attempt, safe=safe, response=response, exc=exc
+            )
+            if not reason:
+                if exc is not None:
+                    raise exc
+                return response
+
+            sleep = retry.get_sleep(attempt=attempt, response=response)
+            attempt += 1
+            retry.count(key="retries", reason=reason, sleep=sleep)
+            if self.METRICS is not None:
+                self.METRICS.observe_retry(route=route)
+            self.LOG.warning(
+                f"Retrying request {attempt}/{retry.RETRIES} in {sleep:.2f} seconds due to "
+                f"{reason}: {request.method} {request.url}"
+            )
+
+            if response is not None:
+                response.close()
+            time.sleep(sleep)
+
+    def _observe(self, route: str, start: float, request, response=None):
+        """Record the metrics of a request in :attr:`METRICS` and :attr:`transfer_stats`.
+
+        Args:
+            route: route name of the request
+            start: :func:`time.monotonic` when the request was sent
+            request: :obj:`requests.PreparedRequest` or :obj:`httpx.Request` that was sent
+            response: :obj:`requests.Response` or :obj:`httpx.Response` that was received
+        """
+        seconds = time.monotonic() - start
+        if response is not None:
+            self._count_response(response=response)
+
+        if self.METRICS is None:
+            return
+
+        self.METRICS.observe(
+            route=route,
+            seconds=seconds,
+            status_code=None if response is None else response.status_code,
+            request_bytes=HttpHistory.get_request_size(request=request),
+            response_bytes=0 if response is None else HttpHistory.get_body_size(response),
+            response_bytes_received=0 if response is None else self.get_received_size(response),
+        )
+
+    @property
+    def retry_stats(self) -> dict:
+        """Get the counters of requests sent and retried by :attr:`RETRY`."""
+        return self.RETRY.stats
+
     def __str__(self) -> str:
         """Show object info."""
         return "{c.__module__}.{c.__name__}(url={url!r})".format(c=self.__class__, url=self.url)
@@ -276,53 +576,105 @@ class Http:
         """Show object info."""
         return self.__str__()
 
+    @property
+    def pool_stats(self) -> dict:
+        """Get the connection re-use statistics per host of :attr:`adapter`."""
+        return self.adapter.stats
+
+    @staticmethod
+    def _get_socket_options(keepalive: bool = HTTP_SOCKET_KEEPALIVE) -> List[tuple]:
+        """Get the socket options to set on new connections.
+
+        Args:
+            keepalive: enable TCP keepalive, with the idle/interval/count options that this
+                platform supports
+        """
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            tcp_options = [
+                ("TCP_KEEPIDLE", HTTP_SOCKET_KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", HTTP_SOCKET_KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", HTTP_SOCKET_KEEPALIVE_COUNT),
+            ]
+            for name, value in tcp_options:
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
     @property
     def user_agent(self) -> str:
         """Value to use in User-Agent header."""
         return f"{__name__}.{self.__class__.__name__}/{__version__}"
 
+    def _encode_json(self, data: Any, json: Any, headers: dict) -> Tuple[Any, None]:
+        """Serialize a json body using :func:`axonius_api_client.tools.json_codec`.
+
+        Args:
+            data: body to send, returned as is if supplied or json is None
+            json: obj to encode as json
+            headers: headers to add a Content-Type for json to
+        """
+        if json is None or data:
+            return data, None
+
+        headers.setdefault("Content-Type", "application/json")
+        value = json_dump(obj=json, indent=None, separators=JSON_SEPARATORS)
+        return value.encode("utf-8"), None
+
     def _do_log_request(self, request):
         """Do it.
 
         Args:
-            request (:obj:`requests.PreparedRequest`): prepared request to log attrs of
+            request (:obj:`requests.PreparedRequest` or :obj:`httpx.Request`): request to log
+                attrs of
         """
+        # httpx requests (from AsyncHttp) name the body attribute differently
+        body = request.body if hasattr(request, "body") else request.content
+
         if self.log_request_attrs:
             lattrs = ", ".join(self.log_request_attrs).format(
                 url=request.url,
-                body_size=len(request.body or ""),
+                body_size=len(body or ""),
                 method=request.method,
                 headers=self._clean_headers(headers=request.headers),
             )
             self.LOG.debug(f"REQUEST ATTRS: {lattrs}")
 
         if self.LOG_REQUEST_BODY:
-            self.log_body(body=request.body, body_type="REQUEST")
+            self.log_body(body=body, body_type="REQUEST")
 
     def _clean_headers(self, headers: dict) -> dict:
         hide = "*********"
         hidden = self.LOG_HIDE_HEADERS
         return {k: hide if k in hidden else v for k, v in headers.items()}
 
-    def _do_log_response(self, response):
+    def _do_log_response(self, response, stream: bool = False):
         """Do it.
 
         Args:
-            response (:obj:`requests.Response`): response to log attrs of
+            response (:obj:`requests.Response` or :obj:`httpx.Response`): response to log
+                attrs of
+            stream: response body has not been read, do not log it or read it to get its size
         """
         if self.log_response_attrs:
+            if stream:
+                body_size = response.headers.get("Content-Length", "unknown")
+            else:
+                body_size = len(response.text or "")
+
             lattrs = ", ".join(self.log_response_attrs).format(
                 url=response.url,
-                body_size=len(response.text or ""),
+                body_size=body_size,
                 method=response.request.method,
                 status_code=response.status_code,
-                reason=response.reason,
+                reason=response.reason if hasattr(response, "reason") else response.reason_phrase,
                 elapsed=response.elapsed,
                 headers=self._clean_headers(headers=response.headers),
             )
             self.LOG.debug(f"RESPONSE ATTRS: {lattrs}")
 
-        if self.LOG_RESPONSE_BODY:
+        if self.LOG_RESPONSE_BODY and not stream:
             self.log_body(body=response.text, body_type="RESPONSE")
 
     @property
@@ -383,3 +735,604 @@ class Http:
         body = body or ""
         body = json_reload(obj=body, error=False, trim=MAX_BODY_LEN)
         self.LOG.debug(f"{body_type} BODY:\n{body}")
+
+
+class HttpAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter for :obj:`Http` that sets socket options and tracks connection re-use."""
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ["SOCKET_OPTIONS"]
+
+    def __init__(self, socket_options: Optional[List[tuple]] = None, **kwargs):
+        """Transport adapter for :obj:`Http`.
+
+        Args:
+            socket_options: socket options to set on new connections, uses the urllib3
+                defaults if None
+            **kwargs: passed to :obj:`requests.adapters.HTTPAdapter`
+        """
+        self.SOCKET_OPTIONS: Optional[List[tuple]] = socket_options
+        """socket options to set on new connections"""
+
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with :attr:`SOCKET_OPTIONS`."""
+        if self.SOCKET_OPTIONS is not None:
+            kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        """Create the pool manager for a proxy with :attr:`SOCKET_OPTIONS`."""
+        if self.SOCKET_OPTIONS is not None:
+            kwargs["socket_options"] = self.SOCKET_OPTIONS
+        return super().proxy_manager_for(*args, **kwargs)
+
+    @property
+    def stats(self) -> dict:
+        """Get the connection re-use statistics of the pools of this adapter per host.
+
+        Notes:
+            Hosts whose pool was dropped because more than pool_connections hosts were used
+            are no longer included.
+        """
+        stats = {}
+        managers = [self.poolmanager, *self.proxy_manager.values()]
+        for manager in managers:
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:  # pragma: no cover
+                    continue
+
+                host = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+                stat = stats.setdefault(
+                    host, {"connections": 0, "requests": 0, "reused": 0, "idle": 0}
+                )
+                stat["connections"] += pool.num_connections
+                stat["requests"] += pool.num_requests
+                stat["reused"] += max(pool.num_requests - pool.num_connections, 0)
+                stat["idle"] += len([x for x in list(getattr(pool.pool, "queue", [])) if x])
+        return stats
+
+
+class HttpHistory:
+    """Ring buffer of the most recent responses, or their metadata, received by :obj:`Http`."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = HTTP_HISTORY_MAX,
+        max_bytes: Optional[int] = HTTP_HISTORY_MAX_BYTES,
+        bodies: bool = HTTP_HISTORY_BODIES,
+    ):
+        """Ring buffer of the most recent responses received by :obj:`Http`.
+
+        Notes:
+            The oldest entries are dropped once there are more than max_entries entries or the
+            response bodies of the entries add up to more than max_bytes, the newest entry is
+            always kept. If bodies is False, a dict with the method, url, status code, elapsed
+            seconds, and request and response body sizes of each response is kept instead of
+            the response itself, and max_bytes is not used.
+
+        Args:
+            max_entries: number of entries to keep, None for no limit
+            max_bytes: number of bytes of response bodies to keep, None for no limit
+            bodies: keep the responses themselves, or only their metadata
+        """
+        self.MAX_ENTRIES: Optional[int] = max_entries
+        """number of entries to keep"""
+
+        self.MAX_BYTES: Optional[int] = max_bytes
+        """number of bytes of response bodies to keep"""
+
+        self.BODIES: bool = bodies
+        """keep the responses themselves, or only their metadata"""
+
+        self.size: int = 0
+        """number of bytes of response bodies in the entries kept"""
+
+        self._entries = collections.deque()
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return (
+            f"{self.__class__.__name__}(entries={len(self)}, size={self.size}, "
+            f"max_entries={self.MAX_ENTRIES}, max_bytes={self.MAX_BYTES}, bodies={self.BODIES})"
+        )
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+    def __len__(self) -> int:
+        """Get the number of entries kept."""
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the entries kept, oldest first."""
+        with self._lock:
+            entries = [x[0] for x in self._entries]
+        return iter(entries)
+
+    def __getitem__(self, index: int):
+        """Get an entry by index, oldest first."""
+        with self._lock:
+            return self._entries[index][0]
+
+    def __contains__(self, item) -> bool:
+        """Check if a response or metadata dict is kept."""
+        return any(x is item or x == item for x in self)
+
+    def append(self, response):
+        """Add a response, dropping the oldest entries that do not fit.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` object to add
+        """
+        if self.BODIES:
+            entry, size = response, self.get_body_size(response=response)
+        else:
+            entry, size = self.get_metadata(response=response), 0
+
+        with self._lock:
+            self._entries.append((entry, size))
+            self.size += size
+
+            while len(self._entries) > 1 and (
+                (self.MAX_ENTRIES and len(self._entries) > self.MAX_ENTRIES)
+                or (self.MAX_BYTES and self.size > self.MAX_BYTES)
+            ):
+                self.size -= self._entries.popleft()[1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def get_metadata(self, response) -> dict:
+        """Get the metadata of a response.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` object
+        """
+        request = response.request
+        elapsed = getattr(response, "elapsed", None)
+        return {
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": response.status_code,
+            "elapsed": elapsed.total_seconds() if elapsed is not None else None,
+            "request_size": self.get_request_size(request=request),
+            "response_size": self.get_body_size(response=response),
+        }
+
+    @staticmethod
+    def get_body_size(response) -> int:
+        """Get the size of the body of a response without reading a streamed body.
+
+        Args:
+            response: :obj:`requests.Response` or :obj:`httpx.Response` object
+        """
+        content = getattr(response, "_content", None)
+        if isinstance(content, bytes):
+            return len(content)
+
+        length = response.headers.get("Content-Length", "")
+        return int(length) if length.isdigit() else 0
+
+    @staticmethod
+    def get_request_size(request) -> int:
+        """Get the size of the body of a request.
+
+        Args:
+            request: :obj:`requests.PreparedRequest` or :obj:`httpx.Request` object
+        """
+        body = getattr(request, "body", None)
+        if body is None:
+            body = getattr(request, "_content", None)
+
+        if isinstance(body, str):
+            return len(body.encode("utf-8"))
+        if isinstance(body, bytes):
+            return len(body)
+        return 0
+
+
+class RetryPolicy:
+    """Policy for retrying requests that are safe to repeat, with counters of retries made."""
+
+    EXCEPTIONS: Tuple[Type[Exception], ...] = (requests.ConnectionError, requests.Timeout)
+    """exceptions raised by sending a request that can be retried"""
+
+    def __init__(
+        self,
+        retries: int = HTTP_RETRIES,
+        backoff: float = HTTP_RETRY_BACKOFF,
+        backoff_max: float = HTTP_RETRY_BACKOFF_MAX,
+        jitter: float = HTTP_RETRY_JITTER,
+        statuses: List[int] = HTTP_RETRY_STATUSES,
+        methods: List[str] = HTTP_RETRY_METHODS,
+        retry_after: bool = True,
+    ):
+        """Policy for retrying requests that are safe to repeat.
+
+        Notes:
+            The sleep before retry N is backoff * 2 ** (N - 1), capped at backoff_max, with up
+            to jitter of it randomly removed. If retry_after is True and the response has a
+            Retry-After header, the sleep is the value of the header instead.
+
+        Args:
+            retries: number of times to retry a request, 0 to never retry
+            backoff: seconds to sleep before the first retry
+            backoff_max: maximum seconds to sleep between retries
+            jitter: fraction (0 to 1) of each sleep to randomly remove
+            statuses: response status codes that can be retried
+            methods: request methods that are safe to repeat
+            retry_after: use the Retry-After header of a response as the sleep
+        """
+        self.RETRIES: int = retries or 0
+        """number of times to retry a request"""
+
+        self.BACKOFF: float = backoff
+        """seconds to sleep before the first retry"""
+
+        self.BACKOFF_MAX: float = backoff_max
+        """maximum seconds to sleep between retries"""
+
+        self.JITTER: float = min(max(jitter or 0, 0), 1)
+        """fraction of each sleep to randomly remove"""
+
+        self.STATUSES: List[int] = [int(x) for x in listify(statuses)]
+        """response status codes that can be retried"""
+
+        self.METHODS: List[str] = [x.upper() for x in listify(methods)]
+        """request methods that are safe to repeat"""
+
+        self.RETRY_AFTER: bool = retry_after
+        """use the Retry-After header of a response as the sleep"""
+
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return (
+            f"{self.__class__.__name__}(retries={self.RETRIES}, backoff={self.BACKOFF}, "
+            f"backoff_max={self.BACKOFF_MAX}, jitter={self.JITTER}, statuses={self.STATUSES})"
+        )
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+    def get_reason(
+        self,
+        method: str,
+        attempt: int,
+        safe: Optional[bool] = None,
+        response: Optional[requests.Response] = None,
+        exc: Optional[Exception] = None,
+    ) -> Optional[str]:
+        """Get the reason a request should be retried.
+
+        Args:
+            method: method of the request
+            attempt: number of retries already made for the request
+            safe: request can be repeated without side effects, ``None`` to decide using method
+            response: response received for the request
+            exc: exception raised sending the request
+
+        Returns:
+            :obj:`str`: status code or exception name, or None if the request should not be
+            retried
+        """
+        if safe is None:
+            safe = method.upper() in self.METHODS
+
+        if exc is not None:
+            reason = exc.__class__.__name__
+        elif response is not None and response.status_code in self.STATUSES:
+            reason = str(response.status_code)
+        else:
+            return None
+
+        if not safe:
+            return None
+
+        if attempt >= self.RETRIES:
+            self.count(key="exhausted")
+            return None
+        return reason
+
+    def get_sleep(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Get the seconds to sleep before retrying a request.
+
+        Args:
+            attempt: number of retries already made for the request
+            response: response received for the request
+        """
+        if self.RETRY_AFTER and response is not None:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+
+        sleep = min(self.BACKOFF * (2**attempt), self.BACKOFF_MAX)
+        return sleep - (sleep * self.JITTER * random.random())
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse the value of a Retry-After header into seconds.
+
+        Args:
+            value: seconds or HTTP date
+        """
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(date.timestamp() - time.time(), 0.0)
+
+    def count(self, key: str, reason: Optional[str] = None, sleep: float = 0):
+        """Increment the counters in :attr:`stats`.
+
+        Args:
+            key: counter to increment
+            reason: status code or exception name that caused a retry
+            sleep: seconds slept before a retry
+        """
+        with self._lock:
+            self._stats[key] += 1
+            if reason:
+                self._stats["reasons"][reason] = self._stats["reasons"].get(reason, 0) + 1
+            self._stats["sleep_seconds"] += sleep
+
+    @property
+    def stats(self) -> dict:
+        """Get the counters of requests sent, retries made, and retries given up on."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["reasons"] = dict(self._stats["reasons"])
+        return stats
+
+    def reset_stats(self):
+        """Reset the counters in :attr:`stats`."""
+        with self._lock:
+            self._stats = {
+                "requests": 0,
+                "retries": 0,
+                "exhausted": 0,
+                "sleep_seconds": 0.0,
+                "reasons": {},
+            }
+
+
+class AsyncHttp(Http):
+    """HTTP client that can also send requests using asyncio via :obj:`httpx.AsyncClient`."""
+
+    RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (httpx.TransportError,) if httpx else ()
+    """exceptions raised by sending a request using :attr:`client` that can be retried"""
+
+    def __init__(
+        self,
+        url: Union["UrlParser", str],
+        certpath: Optional[Union[str, pathlib.Path]] = None,
+        certwarn: bool = True,
+        certverify: bool = False,
+        **kwargs,
+    ):
+        """HTTP client that can also send requests using asyncio.
+
+        Notes:
+            * Requires the optional dependency httpx: ``pip install axonius_api_client[async]``
+            * :meth:`__call__` still sends synchronous requests using :attr:`session`,
+              :meth:`acall` sends asynchronous requests using :attr:`client`
+            * the headers of :attr:`session` (i.e. the credentials set by auth login) are sent
+              with every request made by :meth:`acall`
+
+        Args:
+            url: URL, hostname, or IP address of Axonius instance
+            certpath: path to CA bundle file to use when verifying certs offered by :attr:`url`
+            certverify: raise exception if cert is self-signed or only if cert is invalid
+            certwarn: show insecure warning once or never show insecure warning
+            **kwargs: passed to :obj:`Http`
+
+        Raises:
+            :exc:`HttpError`: if httpx is not installed
+        """
+        if httpx is None:  # pragma: no cover
+            raise HttpError("httpx must be installed to use asyncio: pip install httpx")
+
+        super().__init__(
+            url=url, certpath=certpath, certwarn=certwarn, certverify=certverify, **kwargs
+        )
+
+        self.ASYNC_MAX_CONNECTIONS: int = kwargs.get("async_max_connections", 100)
+        """maximum number of concurrent connections :attr:`client` will open to :attr:`url`
+        ``kwargs=async_max_connections``"""
+
+        self._client = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """:obj:`httpx.AsyncClient` to use for :meth:`acall`, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                verify=self._get_ssl_context(),
+                proxy=self.HTTPS_PROXY or self.HTTP_PROXY,
+                limits=httpx.Limits(max_connections=self.ASYNC_MAX_CONNECTIONS),
+            )
+        return self._client
+
+    async def acall(
+        self,
+        path: Optional[str] = None,
+        route: Optional[str] = None,
+        method: str = "get",
+        data: Optional[str] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        json: Optional[dict] = None,
+        files: tuple = None,
+        safe: Optional[bool] = None,
+        compress: bool = False,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ) -> "httpx.Response":
+        """Create and then send a request using :attr:`client`.
+
+        Notes:
+            If the request is safe to repeat, it is retried using :attr:`RETRY` when a
+            connection error happens or the response has a retryable status code, the same
+            as :meth:`__call__`.
+
+        Args:
+            path: path to append to :attr:`url`
+            route: route to append to :attr:`url`
+            method: method to use
+            data: body to send
+            params: parameters to url encode
+            headers: headers to send
+            json: obj to encode as json
+            files: files to send
+            safe: request can be repeated without side effects, ``None`` to decide using the
+                method
+            compress: endpoint accepts gzip compressed request bodies
+            **kwargs:
+                overrides for object attributes
+
+                * connect_timeout (:obj:`int`): default :attr:`CONNECT_TIMEOUT` -
+                  seconds to wait for connection to open to :attr:`url`
+                * response_timeout (:obj:`int`): default :attr:`RESPONSE_TIMEOUT` -
+                  seconds to wait for for response from :attr:`url`
+
+        Returns:
+            :obj:`httpx.Response`: raw response object
+        """
+        url = join_url(self.url, path, route)
+
+        headers = headers or {}
+        headers.setdefault("User-Agent", self.user_agent)
+        data, json = self._encode_json(data=data, json=json, headers=headers)
+        data = self._compress_body(data=data, headers=headers, compress=compress)
+        send_headers = dict(self.session.headers)
+        send_headers.update(headers)
+
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+
+        timeout = httpx.Timeout(
+            kwargs.get("response_timeout", self.RESPONSE_TIMEOUT),
+            connect=kwargs.get("connect_timeout", self.CONNECT_TIMEOUT),
+        )
+
+        request = self.client.build_request(
+            url=url,
+            method=method,
+            content=content,
+            data=data,
+            headers=send_headers,
+            params=params,
+            json=json,
+            files=files or None,
+            timeout=timeout,
+        )
+
+        if self.SAVE_LAST:
+            self.LAST_REQUEST = request
+
+        self._do_log_request(request=request)
+
+        route_name = get_route_name(path=join_url("", path, route))
+        response = await self._asend_retry(request=request, safe=safe, route=route_name)
+
+        if self.SAVE_LAST:
+            self.LAST_RESPONSE = response
+
+        if self.SAVEHISTORY:
+            self.HISTORY.append(response)
+
+        self._do_log_response(response=response)
+
+        return response
+
+    async def _asend_retry(
+        self, request: "httpx.Request", safe: Optional[bool] = None, route: str = ROUTE_UNKNOWN
+    ) -> "httpx.Response":
+        """Send a request using :attr:`client`, retrying it using :attr:`RETRY` if it is safe
+        to repeat.
+
+        Args:
+            request: request to send
+            safe: request can be repeated without side effects, ``None`` to decide using the
+                method
+            route: route name of the request to record metrics for in :attr:`METRICS`
+        """
+        retry = self.RETRY
+        attempt = 0
+
+        while True:
+            retry.count(key="requests")
+            response, exc = None, None
+            start = time.monotonic()
+
+            try:
+                response = await self.client.send(request)
+            except self.RETRY_EXCEPTIONS as send_exc:
+                exc = send_exc
+            finally:
+                self._observe(route=route, start=start, request=request, response=response)
+
+            reason = retry.get_reason(
+                method=request.method, attempt=attempt, safe=safe, response=response, exc=exc
+            )
+            if not reason:
+                if exc is not None:
+                    raise exc
+                return response
+
+            sleep = retry.get_sleep(attempt=attempt, response=response)
+            attempt += 1
+            retry.count(key="retries", reason=reason, sleep=sleep)
+            if self.METRICS is not None:
+                self.METRICS.observe_retry(route=route)
+            self.LOG.warning(
+                f"Retrying request {attempt}/{retry.RETRIES} in {sleep:.2f} seconds due to "
+                f"{reason}: {request.method} {request.url}"
+            )
+
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(sleep)
+
+    async def aclose(self):
+        """Close the connections opened by :attr:`client`."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Build the SSL context for :attr:`client` from the settings of :attr:`session`."""
+        verify = self.session.verify
+
+        if verify is True or verify is False:
+            context = ssl.create_default_context()
+        else:
+            context = ssl.create_default_context(cafile=str(verify))
+
+        if verify is False:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+
+        if self.session.cert:
+            context.load_cert_chain(*listify(self.session.cert))
+        return context
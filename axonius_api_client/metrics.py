@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Metrics of the requests sent by the HTTP client."""
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .constants import METRICS_BUCKETS, METRICS_PREFIX
+
+ROUTE_UNKNOWN: str = "unknown"
+"""route name to use for paths that do not match a route of :data:`API_VERSION`"""
+
+
+def get_routes() -> Tuple[Dict[str, str], List[Tuple["re.Pattern", str]]]:
+    """Get the maps of paths and path patterns to route names for :func:`get_route_name`.
+
+    Notes:
+        Route names are the name of the router in
+        :data:`axonius_api_client.api.routers.API_VERSION` and the name of the route, i.e.
+        ``devices.cached`` or ``adapters.root``. Patterns with fewer placeholders are tried
+        first, so ``adapters.cnxs`` is matched before ``adapters.config_set``.
+    """
+    if hasattr(get_routes, "_routes"):
+        return get_routes._routes
+
+    from .api.routers import API_VERSION, Router
+
+    paths = {}
+    patterns = []
+    for router_name, router in vars(API_VERSION).items():
+        if not isinstance(router, Router):
+            continue
+
+        for route in router.ROUTES:
+            path = getattr(router, route).strip("/")
+            name = f"{router_name}.{route}"
+            if "{" in path:
+                regex = re.sub(r"\\{\w+\\}", "[^/]+", re.escape(path))
+                patterns.append((path.count("{"), -len(path), re.compile(f"^{regex}$"), name))
+            else:
+                paths.setdefault(path, name)
+
+    patterns = [(x[2], x[3]) for x in sorted(patterns, key=lambda x: x[:2])]
+    get_routes._routes = (paths, patterns)
+    return get_routes._routes
+
+
+def get_route_name(path: Optional[str]) -> str:
+    """Get the route name of a path.
+
+    Args:
+        path: path of a request relative to the URL of the HTTP client
+    """
+    path = (path or "").split("?")[0].strip("/")
+    paths, patterns = get_routes()
+
+    if path in paths:
+        return paths[path]
+
+    for pattern, name in patterns:
+        if pattern.match(path):
+            return name
+    return ROUTE_UNKNOWN
+
+
+class MetricsRegistry:
+    """In-process registry of per-route request metrics."""
+
+    def __init__(self, buckets: List[float] = METRICS_BUCKETS, prefix: str = METRICS_PREFIX):
+        """In-process registry of per-route request metrics.
+
+        Args:
+            buckets: upper bounds in seconds of the latency histogram buckets
+            prefix: prefix of the metric names in :meth:`to_prometheus`
+        """
+        self.BUCKETS: List[float] = sorted(buckets)
+        """upper bounds in seconds of the latency histogram buckets"""
+
+        self.PREFIX: str = prefix
+        """prefix of the metric names in :meth:`to_prometheus`"""
+
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(routes={len(self._routes)})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+    def _get_route(self, route: str) -> dict:
+        """Get the metrics of a route, creating them if needed (must hold the lock).
+
+        Args:
+            route: route name
+        """
+        if route not in self._routes:
+            self._routes[route] = {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "request_bytes": 0,
+                "response_bytes": 0,
+                "response_bytes_received": 0,
+                "seconds": 0.0,
+                "statuses": {},
+                "buckets": [0] * len(self.BUCKETS),
+            }
+        return self._routes[route]
+
+    def observe(
+        self,
+        route: str,
+        seconds: float,
+        status_code: Optional[int] = None,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        response_bytes_received: int = 0,
+    ):
+        """Record a request that was sent.
+
+        Args:
+            route: route name of the request
+            seconds: seconds until the response was received or an error happened
+            status_code: status code of the response, None if no response was received
+            request_bytes: size of the request body
+            response_bytes: size of the response body
+            response_bytes_received: size of the response body before it was decompressed
+        """
+        with self._lock:
+            metrics = self._get_route(route)
+            metrics["requests"] += 1
+            metrics["seconds"] += seconds
+            metrics["request_bytes"] += request_bytes
+            metrics["response_bytes"] += response_bytes
+            metrics["response_bytes_received"] += response_bytes_received
+
+            if status_code is None:
+                metrics["errors"] += 1
+            else:
+                code = str(status_code)
+                metrics["statuses"][code] = metrics["statuses"].get(code, 0) + 1
+
+            for idx, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    metrics["buckets"][idx] += 1
+                    break
+
+    def observe_retry(self, route: str):
+        """Record a retry of a request.
+
+        Args:
+            route: route name of the request
+        """
+        with self._lock:
+            self._get_route(route)["retries"] += 1
+
+    def clear(self):
+        """Remove all metrics."""
+        with self._lock:
+            self._routes = {}
+
+    def to_dict(self) -> dict:
+        """Get the metrics of all routes.
+
+        Notes:
+            The buckets of each route are cumulative, keyed by their upper bound.
+        """
+        data = {}
+        with self._lock:
+            for route, metrics in sorted(self._routes.items()):
+                item = dict(metrics)
+                item["statuses"] = dict(metrics["statuses"])
+                item["buckets"] = self._get_cumulative(metrics=metrics)
+                data[route] = item
+        return data
+
+    def _get_cumulative(self, metrics: dict) -> Dict[str, int]:
+        """Get the cumulative counts of the latency buckets of a route.
+
+        Args:
+            metrics: metrics of a route
+        """
+        buckets = {}
+        total = 0
+        for bound, count in zip(self.BUCKETS, metrics["buckets"]):
+            total += count
+            buckets[f"{bound:g}"] = total
+        buckets["+Inf"] = metrics["requests"]
+        return buckets
+
+    def to_prometheus(self) -> str:
+        """Get the metrics of all routes in the Prometheus text exposition format."""
+        data = self.to_dict()
+        prefix = self.PREFIX
+        lines = []
+
+        counters = [
+            ("requests_total", "requests", "Requests sent per route."),
+            ("errors_total", "errors", "Requests per route that did not get a response."),
+            ("retries_total", "retries", "Requests retried per route."),
+            ("request_bytes_total", "request_bytes", "Bytes of request bodies sent per route."),
+            ("response_bytes_total", "response_bytes", "Bytes of response bodies per route."),
+            (
+                "response_bytes_received_total",
+                "response_bytes_received",
+                "Bytes of response bodies received before decompression per route.",
+            ),
+        ]
+        for name, key, text in counters:
+            lines += [f"# HELP {prefix}_{name} {text}", f"# TYPE {prefix}_{name} counter"]
+            lines += [f'{prefix}_{name}{{route="{r}"}} {m[key]}' for r, m in data.items()]
+
+        name = f"{prefix}_responses_total"
+        lines += [f"# HELP {name} Responses per route and status code.", f"# TYPE {name} counter"]
+        for route, metrics in data.items():
+            for code, count in sorted(metrics["statuses"].items()):
+                lines.append(f'{name}{{route="{route}",code="{code}"}} {count}')
+
+        name = f"{prefix}_request_duration_seconds"
+        lines += [f"# HELP {name} Request latency per route.", f"# TYPE {name} histogram"]
+        for route, metrics in data.items():
+            for bound, count in metrics["buckets"].items():
+                lines.append(f'{name}_bucket{{route="{route}",le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{route="{route}"}} {metrics["seconds"]}')
+            lines.append(f'{name}_count{{route="{route}"}} {metrics["requests"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+METRICS: MetricsRegistry = MetricsRegistry()
+"""default registry used by all HTTP clients"""
@@ -2,6 +2,7 @@
 """Test suite."""
 import copy
 import warnings
+from collections.abc import Mapping
 
 import pytest
 
@@ -433,7 +434,8 @@ class TestAdaptersPublic(TestAdaptersBase):
             assert isinstance(x, str) and x
 
         schemas = adapter.pop("schemas")
-        assert isinstance(schemas, dict) and schemas
+        assert isinstance(schemas, Mapping) and schemas
+        schemas = dict(schemas)
 
         schema_cnx = schemas.pop("cnx")
         assert isinstance(schema_cnx, dict) and schema_cnx
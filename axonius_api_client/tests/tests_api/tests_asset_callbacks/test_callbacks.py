@@ -4,12 +4,15 @@ import copy
 import io
 import logging
 import sys
+import types
+from collections.abc import Mapping
 
 import pytest
 
 from axonius_api_client.api.asset_callbacks import get_callbacks_cls
 from axonius_api_client.constants import FIELD_TRIM_LEN, SCHEMAS_CUSTOM
 from axonius_api_client.exceptions import ApiError
+from axonius_api_client.tools import JSON_CODECS, json_codec, json_dump, json_load
 
 from ...utils import get_rows_exist, get_schema, log_check, random_string
 
@@ -28,7 +31,7 @@ def get_cbobj_main(apiobj, cbexport, getargs=None, state=None, store=None):
     assert cbobj.STORE == store
     assert cbobj.STATE == state
 
-    assert isinstance(cbobj.ALL_SCHEMAS, dict) and cbobj.ALL_SCHEMAS
+    assert isinstance(cbobj.ALL_SCHEMAS, Mapping) and cbobj.ALL_SCHEMAS
     assert isinstance(cbobj.args_map(), list)
     assert isinstance(cbobj.args_strs, list)
 
@@ -73,6 +76,18 @@ class Callbacks:
         cbobj.stop()
         log_check(caplog=caplog, entries=["Stopping"], exists=True)
 
+    def test_plan(self, cbexport, apiobj):
+        getargs = {"field_join": True, "field_excludes": [apiobj.FIELD_ADAPTERS]}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+        names = [x.__name__ for x in cbobj.plan["callbacks"]]
+        assert "do_join_values" in names
+        assert "do_excludes" in names
+        assert "do_flatten_fields" not in names
+        assert "do_change_field_titles" not in names
+        assert (apiobj.FIELD_ADAPTERS, []) in cbobj.plan["excludes"]
+        assert apiobj.FIELD_ADAPTERS not in [x["name_qual"] for x in cbobj.plan["schemas"]]
+
     def test_add_report_adapters_missing_false(self, cbexport, apiobj):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
@@ -298,6 +313,32 @@ class Callbacks:
         for tag in tags:
             assert tag not in row_tags
 
+    def test_process_tags_batch_size(self, cbexport, apiobj, caplog):
+        original_row = get_rows_exist(apiobj=apiobj)
+        test_row = copy.deepcopy(original_row)
+        row_id = test_row[apiobj.FIELD_AXON_ID]
+        tags = [f"badwolf_{random_string(9)}"]
+        getargs = {"tags_add": tags, "tags_remove": tags, "tags_batch_size": 1}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+        rows = cbobj.process_tags_to_add(rows=[test_row, test_row])
+        assert rows[0] == original_row
+        assert not cbobj.TAG_ROWS_ADD
+        log_check(caplog=caplog, entries=["Adding tags.*to 1 assets"], exists=True)
+
+        rows = cbobj.process_tags_to_remove(rows=test_row)
+        assert rows[0] == original_row
+        assert not cbobj.TAG_ROWS_REMOVE
+        log_check(caplog=caplog, entries=["Removing tags.*from 1 assets"], exists=True)
+
+        row_refetch = apiobj.get_by_value(
+            field=apiobj.FIELD_AXON_ID, value=row_id, field_manual=True
+        )[0]
+
+        row_tags = row_refetch.get(apiobj.FIELD_TAGS, [])
+        for tag in tags:
+            assert tag not in row_tags
+
     def test_process_tags_to_add_empty(self, cbexport, apiobj, caplog):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
@@ -381,6 +422,53 @@ class Callbacks:
         for item in test_row[field_complex]:
             assert sub_exclude not in item
 
+    def test_do_delta(self, cbexport, apiobj, tmp_path):
+        field = SCHEMAS_CUSTOM["delta"]["delta_change"]["name_qual"]
+        getargs = {"delta_manifest": tmp_path / "manifest.json"}
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=2)
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=dict(getargs))
+        rows = cbobj.do_delta(rows=copy.deepcopy(original_rows))
+        assert [x[field] for x in rows] == ["added", "added"]
+        cbobj.delta_save()
+        assert (tmp_path / "manifest.json").is_file()
+
+        test_rows = copy.deepcopy(original_rows)
+        test_rows[0]["badwolf"] = random_string(6)
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=dict(getargs))
+        rows = cbobj.do_delta(rows=test_rows)
+        assert len(rows) == 1
+        assert rows[0][field] == "changed"
+        assert cbobj.DELTA_COUNTS["unchanged"] == 1
+
+        manifest = tmp_path / "manifest.json"
+        data = json_load(obj=manifest.read_text())
+        data["hash_version"] = 1
+        manifest.write_text(json_dump(obj=data))
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=dict(getargs))
+        rows = cbobj.do_delta(rows=copy.deepcopy(original_rows))
+        assert [x[field] for x in rows] == ["changed", "changed"]
+
+        cbobj.delta_save()
+        getargs["field_excludes"] = ["badwolf"]
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=dict(getargs))
+        with pytest.raises(ApiError):
+            cbobj.do_delta(rows=copy.deepcopy(original_rows))
+
+        default = json_codec()
+        try:
+            hashes = []
+            for codec in JSON_CODECS:
+                json_codec(name=codec)
+                hashes.append(cbobj.get_row_hash(row={"a": "ü", "b": [1, {"c": None}]}))
+            assert len(set(hashes)) == 1
+        finally:
+            json_codec(name=default)
+
+        assert cbobj.delta_complete
+        assert "do_delta" in [x.__name__ for x in cbobj.plan["callbacks"]]
+        assert "do_delta" not in [x.__name__ for x in cbobj.plan["callbacks_removed"]]
+
     def test_do_join_values_true(self, cbexport, apiobj):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
@@ -693,6 +781,40 @@ class Callbacks:
             assert isinstance(value, str)
             assert value == row_val[idx]
 
+    def test_do_explode_field_shared(self, cbexport, apiobj):
+        original_row = get_rows_exist(apiobj=apiobj)
+        test_row = copy.deepcopy(original_row)
+
+        key = apiobj.FIELD_ADAPTERS
+        test_row[key] += ["test1", "test2"]
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={"field_explode": key})
+
+        rows = cbobj.do_explode_field(rows=test_row)
+        assert len(rows) > 1
+        for row in rows:
+            for field, value in row.items():
+                if field != key:
+                    assert value is rows[0][field]
+
+    def test_do_row_explode_stream(self, cbexport, apiobj):
+        original_row = get_rows_exist(apiobj=apiobj)
+        key = apiobj.FIELD_ADAPTERS
+        original_row[key] += ["test1", "test2"]
+        getargs = {"field_explode": key, "field_join": True, "field_titles": True}
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        rows = cbobj.do_row(rows=copy.deepcopy(original_row))
+        assert not cbobj.plan["explode_stream"]
+        assert isinstance(rows, list)
+
+        getargs["field_explode_stream"] = True
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        rows_stream = cbobj.do_row(rows=copy.deepcopy(original_row))
+        assert cbobj.plan["explode_stream"]
+        assert isinstance(rows_stream, types.GeneratorType)
+        assert cbobj.iter_rows(rows=rows_stream) is rows_stream
+        assert list(rows_stream) == rows
+
     def test_do_explode_field_exclude(self, cbexport, apiobj):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
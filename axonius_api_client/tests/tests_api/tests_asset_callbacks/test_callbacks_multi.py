@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import json
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks import Multi
+from axonius_api_client.exceptions import ApiError
+
+
+class TestCallbacksMulti:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    def test_multi(self, apiobj, tmp_path):
+        export = [
+            {"export": "csv", "export_file": "badwolf.csv", "field_titles": True},
+            {"export": "json", "export_file": "badwolf.json"},
+        ]
+        rows = apiobj.get(max_rows=2, export=export, export_path=tmp_path)
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+
+        callbacks = apiobj.LAST_CALLBACKS
+        assert isinstance(callbacks, Multi)
+        assert [x.CB_NAME for x in callbacks.SINKS] == ["csv", "json"]
+        assert [x.row_copy for x in callbacks.SINKS] == ["deep", None]
+
+        data = json.loads((tmp_path / "badwolf.json").read_text())
+        assert [x[apiobj.FIELD_AXON_ID] for x in data] == [x[apiobj.FIELD_AXON_ID] for x in rows]
+        assert (tmp_path / "badwolf.csv").is_file()
+
+    def test_copy_value(self):
+        value = {"a": [{"b": 1}], "c": "d"}
+        copy = Multi.copy_value(value=value)
+        assert copy == value
+        assert copy["a"] is not value["a"]
+        assert copy["a"][0] is not value["a"][0]
+
+    def test_fail_same_export_file(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=["csv", "json"], export_file=tmp_path / "badwolf")
+
+    def test_fail_bad_export(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=[{"export_file": tmp_path / "badwolf"}])
+
+    def test_fail_checkpoint(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(
+                max_rows=1,
+                export=["csv", "json"],
+                export_path=tmp_path,
+                checkpoint=tmp_path / "checkpoint.json",
+            )
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import pytest
+
+from axonius_api_client.exceptions import ApiError
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+class TestCallbacksParquet:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "parquet"
+
+    def test_parquet(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.parquet"
+        rows = apiobj.get(max_rows=2, export=cbexport, export_file=export_file)
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+
+        table = pyarrow_parquet.read_table(export_file)
+        assert table.num_rows == len(rows)
+        assert apiobj.FIELD_AXON_ID in table.column_names
+        assert table.schema.field(apiobj.FIELD_AXON_ID).type == pyarrow.string()
+
+    def test_parquet_row_groups(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        rows = apiobj.get(
+            max_rows=3,
+            export=cbexport,
+            export_file=export_file,
+            parquet_row_group_size=1,
+            parquet_compression="none",
+        )
+        metadata = pyarrow_parquet.ParquetFile(tmp_path / "badwolf.parquet").metadata
+        assert metadata.num_rows == len(rows)
+        assert metadata.num_row_groups == len(rows)
+
+    def test_arrow(self, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        rows = apiobj.get(max_rows=2, export="arrow", export_file=export_file)
+        with pyarrow.ipc.open_file(tmp_path / "badwolf.arrow") as reader:
+            assert reader.read_all().num_rows == len(rows)
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import sqlite3
+
+import pytest
+
+from axonius_api_client.exceptions import ApiError
+
+
+class TestCallbacksSqlite:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "sqlite"
+
+    def test_sqlite(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        rows = apiobj.get(max_rows=2, export=cbexport, export_file=export_file)
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+
+        table = apiobj.router.OBJ_TYPE
+        conn = sqlite3.connect(str(tmp_path / "badwolf.sqlite"))
+        count = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+        indexes = [x[0] for x in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")]
+        conn.close()
+        assert count == len(rows)
+        assert f"ix_{table}_internal_axon_id" in indexes
+
+    def test_sqlite_upsert(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.sqlite"
+        rows = apiobj.get(max_rows=2, export=cbexport, export_file=export_file)
+        apiobj.get(max_rows=2, export=cbexport, export_file=export_file, sqlite_upsert=True)
+
+        table = apiobj.router.OBJ_TYPE
+        conn = sqlite3.connect(str(export_file))
+        count = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+        conn.close()
+        assert count == len(rows)
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport)
+
+    def test_fail_bad_index(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(
+                max_rows=1,
+                export=cbexport,
+                export_file=tmp_path / "badwolf",
+                sqlite_indexes=["badwolf"],
+            )
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import asyncio
+
 import pytest
 import requests
 
@@ -243,6 +245,86 @@ class AssetsPublic:
         check_assets(rows)
         assert len(rows) == 20
 
+    def test_get_workers(self, apiobj):
+        get_args = {"page_size": 20, "max_pages": 3, "sort_field": apiobj.FIELD_MAIN}
+        rows = apiobj.get(use_cursor=False, **get_args)
+        rows_workers = apiobj.get(workers=3, **get_args)
+        check_assets(rows_workers)
+        assert "cached" not in apiobj.auth.http.LAST_RESPONSE.request.url
+        assert [x["internal_axon_id"] for x in rows_workers] == [
+            x["internal_axon_id"] for x in rows
+        ]
+
+    def test_get_workers_unordered(self, apiobj):
+        get_args = {"page_size": 20, "max_rows": 50, "sort_field": apiobj.FIELD_MAIN}
+        rows = apiobj.get(use_cursor=False, **get_args)
+        rows_workers = apiobj.get(workers=3, workers_ordered=False, **get_args)
+        check_assets(rows_workers)
+        assert len(rows_workers) == len(rows)
+        assert sorted([x["internal_axon_id"] for x in rows_workers]) == sorted(
+            [x["internal_axon_id"] for x in rows]
+        )
+
+    def test_get_prefetch(self, apiobj):
+        get_args = {"page_size": 20, "max_pages": 3, "sort_field": apiobj.FIELD_MAIN}
+        rows = apiobj.get(**get_args)
+        rows_prefetch = apiobj.get(prefetch_pages=2, **get_args)
+        check_assets(rows_prefetch)
+        assert [x["internal_axon_id"] for x in rows_prefetch] == [
+            x["internal_axon_id"] for x in rows
+        ]
+
+    def test_get_stream(self, apiobj):
+        for use_cursor in [True, False]:
+            get_args = {"page_size": 20, "max_pages": 3, "use_cursor": use_cursor}
+            rows = apiobj.get(**get_args)
+            rows_stream = apiobj.get(stream=True, **get_args)
+            check_assets(rows_stream)
+            assert [x["internal_axon_id"] for x in rows_stream] == [
+                x["internal_axon_id"] for x in rows
+            ]
+            assert apiobj.LAST_CALLBACKS.STATE["rows_to_fetch_total"]
+
+    def test_get_checkpoint_resume(self, apiobj, tmp_path):
+        checkpoint = tmp_path / "checkpoint.json"
+        get_args = {
+            "page_size": 20,
+            "max_pages": 3,
+            "sort_field": apiobj.FIELD_MAIN,
+            "export": "json",
+            "export_path": tmp_path,
+            "export_overwrite": True,
+        }
+        apiobj.get(export_file="full.json", **get_args)
+
+        gen = apiobj.get(
+            generator=True, export_file="resumed.json", checkpoint=checkpoint, **get_args
+        )
+        for idx, row in enumerate(gen):
+            if idx == 30:
+                break
+        gen.close()
+        assert checkpoint.is_file()
+
+        with pytest.raises(ApiError):
+            apiobj.get(export_file="resumed.json", checkpoint=checkpoint, resume=True, query="x")
+
+        rows = apiobj.get(
+            export_file="resumed.json", checkpoint=checkpoint, resume=True, **get_args
+        )
+        assert len(rows) == 40
+        assert not checkpoint.exists()
+        full = (tmp_path / "full.json").read_bytes()
+        assert (tmp_path / "resumed.json").read_bytes() == full
+
+    def test_get_checkpoint_unsupported(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(export="xlsx", checkpoint=tmp_path / "checkpoint.json")
+
+    def test_arequest_sync_http(self, apiobj):
+        with pytest.raises(ApiError):
+            asyncio.run(apiobj.arequest(path=apiobj.router.count))
+
     def test_get_id(self, apiobj):
         asset = apiobj.get(max_rows=1)[0]
         id = asset["internal_axon_id"]
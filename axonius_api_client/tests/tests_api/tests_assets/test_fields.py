@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import copy
+import os
+from collections.abc import Mapping
 
 import pytest
 
+from axonius_api_client.api.assets import Fields
+from axonius_api_client.api.assets.fields import FuzzyIndex
 from axonius_api_client.constants import AGG_ADAPTER_ALTS, AGG_ADAPTER_NAME
 from axonius_api_client.exceptions import ApiError, NotFoundError
 
@@ -183,7 +187,7 @@ class FieldsPublic:
 
     def val_parsed_fields(self, fields):
         fields = copy.deepcopy(fields)
-        assert isinstance(fields, dict)
+        assert isinstance(fields, Mapping)
 
         for adapter, schemas in fields.items():
             assert not adapter.endswith("_adapter")
@@ -321,6 +325,34 @@ class FieldsPublic:
 
         assert not schema, list(schema)
 
+    def test_get_cache_path(self, apiobj, tmp_path, monkeypatch):
+        monkeypatch.setattr(apiobj, "FIELDS_CACHE_PATH", str(tmp_path))
+
+        fields = Fields(parent=apiobj)
+        cache_file = fields.cache_file
+        assert cache_file.parent == tmp_path
+        assert not cache_file.is_file()
+
+        data = fields.get()
+        assert cache_file.is_file()
+
+        fields_new = Fields(parent=apiobj)
+        assert fields_new.cache_file == cache_file
+        assert fields_new._cache_load() == data
+
+        fields_new.cache_clear()
+        assert not cache_file.is_file()
+        assert fields_new._cache_load() is None
+
+    def test_get_cache_path_expired(self, apiobj, tmp_path, monkeypatch):
+        monkeypatch.setattr(apiobj, "FIELDS_CACHE_PATH", str(tmp_path))
+        monkeypatch.setattr(apiobj, "FIELDS_CACHE_TTL", 60)
+
+        fields = Fields(parent=apiobj)
+        fields.get()
+        os.utime(fields.cache_file, (0, 0))
+        assert fields._cache_load() is None
+
     def test_get_adapter_name(self, apiobj):
         search = AGG_ADAPTER_ALTS[0]
         exp = AGG_ADAPTER_NAME
@@ -356,6 +388,18 @@ class FieldsPublic:
         result = apiobj.fields.get_field_schema(value=search, schemas=schemas)
         assert exp == result
 
+    def test_get_schemas_index(self, apiobj):
+        schemas = get_schemas(apiobj=apiobj)
+        keys = ["name_base", "name_qual"]
+        index = apiobj.fields._get_schemas_index(schemas=schemas, keys=keys)
+        assert index is apiobj.fields._get_schemas_index(schemas=schemas, keys=keys)
+
+        for schema in index["selectable"]:
+            assert index["lookup"][schema["name_qual"].lower()] is schema
+
+        schemas_new = list(schemas)
+        assert index is not apiobj.fields._get_schemas_index(schemas=schemas_new, keys=keys)
+
     def test_get_field_names_re(self, apiobj):
         search = ["seen"]
         result = apiobj.fields.get_field_names_re(value=search)
@@ -515,6 +559,24 @@ class FieldsPublic:
         assert len(matches) > 1
         assert "specific_data.data.id" in matches
 
+    def test_fuzzy_filter_ranked(self, apiobj):
+        schemas = [
+            {"name": x, "name_qual": x, "name_base": x, "title": x, "is_root": True}
+            for x in ["host_names", "hostname", "host_name_dns"]
+        ]
+        matches = apiobj.fields.fuzzy_filter(
+            search="host name", schemas=schemas, names=True, do_contains=False
+        )
+        assert matches == ["hostname", "host_names", "host_name_dns"]
+
+    def test_fuzzy_index(self, apiobj):
+        schemas = apiobj.fields.get()["agg"]
+        index = FuzzyIndex(schemas=schemas, keys=["name_base", "title"])
+        for schema, entries in index.ENTRIES:
+            assert schema["is_root"]
+            assert len(entries) == 2
+        assert index.search(search="badwolf_badwolf", partial_score=0) == []
+
 
 class TestFieldsDevices(FieldsPrivate, FieldsPublic):
     @pytest.fixture(scope="class")
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonapi.api.assets."""
 import pytest
+import requests
 
 
 class LabelsPrivate:
@@ -114,6 +115,59 @@ class LabelsPublic:
         for label in labels:
             assert label not in all_labels_post_remove
 
+    def test_add_remove_batches(self, apiobj):
+        labels = ["badwolf3"]
+
+        assets = apiobj.get(max_rows=3)
+
+        add_label_result = apiobj.labels.add(labels=labels, rows=assets, batch_size=1, workers=2)
+        assert add_label_result == len(assets)
+
+        summary = apiobj.labels.LAST_SUMMARY
+        assert summary["method"] == "_add"
+        assert summary["processed"] == len(assets)
+        assert summary["failed"] == 0
+        assert len(summary["batches"]) == len(assets)
+        for batch in summary["batches"]:
+            assert batch["processed"] == 1
+            assert batch["error"] is None
+
+        remove_label_result = apiobj.labels.remove(
+            labels=labels, rows=assets, batch_size=1, workers=2
+        )
+        assert remove_label_result == len(assets)
+        assert apiobj.labels.LAST_SUMMARY["method"] == "_remove"
+
+        assets_removed = apiobj.get_by_values(values=labels, field="labels", fields="labels")
+        assert not assets_removed
+
+    def test_do_batch_retries(self, apiobj):
+        calls = []
+
+        def method(labels, ids):
+            calls.append(ids)
+            raise requests.ConnectionError("badwolf")
+
+        result = apiobj.labels._do_batch(
+            method=method, labels=["badwolf"], ids=["x"], number=1, retries=2, retry_sleep=0
+        )
+        assert result["tries"] == 3
+        assert len(calls) == 3
+        assert "badwolf" in result["error"]
+
+    def test_do_batch_no_retry(self, apiobj):
+        calls = []
+
+        def method(labels, ids):
+            calls.append(ids)
+            raise ValueError("badwolf")
+
+        with pytest.raises(ValueError):
+            apiobj.labels._do_batch(
+                method=method, labels=["badwolf"], ids=["x"], number=1, retries=2, retry_sleep=0
+            )
+        assert len(calls) == 1
+
 
 class TestLabelsDevices(LabelsPrivate, LabelsPublic):
     @pytest.fixture(scope="class")
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.cache."""
+from axonius_api_client.cache import CacheRegistry
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class TestCacheRegistry:
+    def test_get(self):
+        cache = CacheRegistry()
+        loader = Loader()
+        assert cache.get(namespace="labels", key="devices", loader=loader) == 1
+        assert cache.get(namespace="labels", key="devices", loader=loader) == 1
+        assert cache.get(namespace="labels", key="users", loader=loader) == 2
+        assert loader.calls == 2
+
+        stats = cache.stats["labels"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["keys"] == 2
+
+    def test_invalidate(self):
+        cache = CacheRegistry()
+        loader = Loader()
+        cache.get(namespace="labels", key="devices", loader=loader)
+        cache.get(namespace="labels", key="users", loader=loader)
+
+        cache.invalidate(namespace="labels", key="devices")
+        assert cache.get(namespace="labels", key="devices", loader=loader) == 3
+        assert cache.get(namespace="labels", key="users", loader=loader) == 2
+
+        cache.invalidate(namespace="labels")
+        assert cache.get(namespace="labels", key="users", loader=loader) == 4
+
+        cache.clear()
+        assert cache.get(namespace="labels", key="users", loader=loader) == 5
+        assert cache.stats["labels"]["invalidations"] == 3
+
+    def test_invalidate_while_loading(self):
+        cache = CacheRegistry()
+
+        def loader():
+            cache.invalidate(namespace="adapters")
+            return "stale"
+
+        assert cache.get(namespace="adapters", key="x", loader=loader) == "stale"
+        assert cache.get(namespace="adapters", key="x", loader=lambda: "new") == "new"
+        assert cache.stats["adapters"]["discarded"] == 1
+
+    def test_ttl(self):
+        cache = CacheRegistry(ttls={"labels": 0})
+        loader = Loader()
+        cache.get(namespace="labels", key="devices", loader=loader)
+        cache.get(namespace="labels", key="devices", loader=loader)
+        assert loader.calls == 2
+
+        cache = CacheRegistry(enabled=False)
+        loader = Loader()
+        cache.get(namespace="adapters", key="x", loader=loader)
+        cache.get(namespace="adapters", key="x", loader=loader)
+        assert loader.calls == 2
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.tools."""
+import asyncio
 import logging
 
 import pytest
 
-from axonius_api_client.connect import Connect
+from axonius_api_client.connect import AsyncConnect, Connect
 from axonius_api_client.exceptions import ConnectError, InvalidCredentials
-from axonius_api_client.http import requests
+from axonius_api_client.http import AsyncHttp, requests
 
 from ..utils import IS_LINUX, get_key_creds, get_url
 
@@ -116,3 +117,27 @@ class TestConnect:
         reason = Connect._get_exc_reason(exc)
 
         assert format(reason) == "badwolf"
+
+
+class TestAsyncConnect:
+    def test_no_start(self, request):
+        ax_url = get_url(request)
+
+        c = AsyncConnect(url=ax_url, key=BAD_CRED, secret=BAD_CRED)
+
+        assert "Not connected" in format(c)
+        assert isinstance(c.HTTP, AsyncHttp)
+
+    def test_start(self, request):
+        ax_url = get_url(request)
+
+        async def start():
+            async with AsyncConnect(url=ax_url, certwarn=False, **get_key_creds(request)) as c:
+                count = await c.devices.acount()
+                rows = [x async for x in c.devices.aget(max_rows=1)]
+                return c, count, rows
+
+        c, count, rows = asyncio.run(start())
+        assert c.STARTED
+        assert isinstance(count, int)
+        assert len(rows) <= 1
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.http."""
+import asyncio
+import datetime
+import gzip
 import logging
+import socket
 import sys
 
 import pytest
 import requests
 
 from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http
+from axonius_api_client.http import AsyncHttp, Http, HttpHistory, RetryPolicy
 from axonius_api_client.url_parser import UrlParser
 from axonius_api_client.version import __version__
 
@@ -17,6 +21,18 @@ from ..utils import get_url, log_check
 InsecureRequestWarning = requests.urllib3.exceptions.InsecureRequestWarning
 
 
+def make_response(size: int) -> requests.Response:
+    """Make a response with a body of a given size."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"x" * size
+    response.elapsed = datetime.timedelta(seconds=1.5)
+    response.request = requests.Request(
+        method="POST", url="https://example.com/api", data="test"
+    ).prepare()
+    return response
+
+
 class TestHttp:
     """Test Http."""
 
@@ -100,6 +116,174 @@ class TestHttp:
 
         assert response in http.HISTORY
 
+    def test_accept_encoding(self):
+        """Test the session asks for compressed responses."""
+        http = Http(url="https://127.0.0.1:9")
+        assert "gzip" in http.session.headers["Accept-Encoding"]
+
+        http = Http(url="https://127.0.0.1:9", accept_encoding="identity")
+        assert http.session.headers["Accept-Encoding"] == "identity"
+
+    def test_compress_body(self):
+        """Test request bodies are only compressed when allowed and large enough."""
+        data = b"x" * 100
+        http = Http(url="https://127.0.0.1:9")
+        headers = {}
+        assert http._compress_body(data=data, headers=headers, compress=True) == data
+        assert headers == {}
+
+        http = Http(url="https://127.0.0.1:9", gzip_request_min_size=50)
+        assert http._compress_body(data=data, headers=headers, compress=False) == data
+        assert http._compress_body(data=b"x", headers=headers, compress=True) == b"x"
+        assert headers == {}
+
+        body = http._compress_body(data=data, headers=headers, compress=True)
+        assert gzip.decompress(body) == data
+        assert headers == {"Content-Encoding": "gzip"}
+
+        stats = http.transfer_stats
+        assert stats["requests_compressed"] == 1
+        assert stats["request_bytes"] == 100
+        assert stats["request_bytes_sent"] == len(body)
+
+    def test_count_response(self):
+        """Test the decompressed and received bytes of responses are counted."""
+        http = Http(url="https://127.0.0.1:9")
+        response = make_response(size=100)
+        response.headers["Content-Encoding"] = "gzip"
+        http._count_response(response=response)
+
+        stats = http.transfer_stats
+        assert stats["responses"] == 1
+        assert stats["responses_compressed"] == 1
+        assert stats["response_bytes"] == 100
+
+        http.reset_transfer_stats()
+        assert http.transfer_stats["responses"] == 0
+
+    def test_history_max(self):
+        """Test the oldest responses are dropped from history."""
+        history = HttpHistory(max_entries=3, max_bytes=None)
+        responses = [make_response(size=10) for _ in range(5)]
+        for response in responses:
+            history.append(response)
+
+        assert list(history) == responses[2:]
+        assert history.size == 30
+        assert responses[1] not in history
+
+        history.clear()
+        assert len(history) == 0
+        assert history.size == 0
+
+    def test_history_max_bytes(self):
+        """Test responses are dropped from history once the bodies are too large."""
+        history = HttpHistory(max_entries=None, max_bytes=25)
+        responses = [make_response(size=10) for _ in range(5)]
+        for response in responses:
+            history.append(response)
+
+        assert list(history) == responses[3:]
+        assert history.size == 20
+
+        big = make_response(size=100)
+        history.append(big)
+        assert list(history) == [big]
+
+    def test_history_metadata(self):
+        """Test only the metadata of responses is kept in history with bodies=False."""
+        history = HttpHistory(max_entries=2, bodies=False)
+        response = make_response(size=10)
+        history.append(response)
+
+        assert response not in history
+        assert history.size == 0
+        assert history[-1] == {
+            "method": "POST",
+            "url": "https://example.com/api",
+            "status_code": 200,
+            "elapsed": 1.5,
+            "request_size": 4,
+            "response_size": 10,
+        }
+
+    def test_pool_args(self, request):
+        """Test pool and socket options are set on the mounted adapter."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url, pool_connections=2, pool_maxsize=20, pool_block=True)
+        assert http.session.get_adapter(ax_url) is http.adapter
+        assert http.adapter._pool_connections == 2
+        assert http.adapter._pool_maxsize == 20
+        assert http.adapter._pool_block is True
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in http.SOCKET_OPTIONS
+
+    def test_socket_keepalive_false(self, request):
+        """Test socket_keepalive=False only sets TCP_NODELAY."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url, socket_keepalive=False)
+        assert http.SOCKET_OPTIONS == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+    def test_pool_stats(self, request, httpbin):
+        """Test pool_stats shows connections being re-used."""
+        http = Http(url=httpbin.url)
+        assert http.pool_stats == {}
+
+        for _ in range(3):
+            http(path="get")
+
+        stats = list(http.pool_stats.values())
+        assert len(stats) == 1
+        assert stats[0]["requests"] == 3
+        assert stats[0]["connections"] == 1
+        assert stats[0]["reused"] == 2
+        assert stats[0]["idle"] == 1
+
+    def test_retry_status(self, request, httpbin):
+        """Test safe requests are retried on retryable status codes and unsafe ones are not."""
+        http = Http(url=httpbin.url, retries=2, retry_backoff=0.01)
+
+        response = http(path="status/503")
+        assert response.status_code == 503
+        stats = http.retry_stats
+        assert stats["requests"] == 3
+        assert stats["retries"] == 2
+        assert stats["exhausted"] == 1
+        assert stats["reasons"] == {"503": 2}
+
+        http.RETRY.reset_stats()
+        response = http(path="status/503", method="post")
+        assert response.status_code == 503
+        assert http.retry_stats["requests"] == 1
+
+        response = http(path="status/503", method="post", safe=True)
+        assert http.retry_stats["requests"] == 4
+
+    def test_retry_connection_error(self, request):
+        """Test safe requests are retried on connection errors."""
+        http = Http(url="http://127.0.0.1:9", retries=1, retry_backoff=0.01)
+
+        with pytest.raises(requests.ConnectionError):
+            http(path="get")
+
+        assert http.retry_stats["retries"] == 1
+        assert http.retry_stats["reasons"] == {"ConnectionError": 1}
+
+    def test_retry_policy_sleep(self):
+        """Test the sleeps of a retry policy."""
+        policy = RetryPolicy(backoff=1, backoff_max=3, jitter=0)
+        assert [policy.get_sleep(attempt=x) for x in range(4)] == [1, 2, 3, 3]
+
+        policy = RetryPolicy(backoff=1, backoff_max=30, jitter=0.5)
+        for attempt in range(4):
+            assert 2**attempt / 2 <= policy.get_sleep(attempt=attempt) <= 2**attempt
+
+        assert RetryPolicy.parse_retry_after("7") == 7
+        assert RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert RetryPolicy.parse_retry_after("bad") is None
+        assert RetryPolicy.parse_retry_after(None) is None
+
     def test_client_cert_missing_one(self, request, tmp_path):
         """Test cert or key supplied, but not the other."""
         ax_url = get_url(request)
@@ -269,3 +453,68 @@ class TestHttp:
         http()
 
         assert not caplog.records
+
+
+class TestAsyncHttp:
+    """Test AsyncHttp."""
+
+    def test_acall(self, request):
+        """Test acall returns a response and saves last req/resp and history."""
+        ax_url = get_url(request)
+
+        http = AsyncHttp(url=ax_url, save_last=True, save_history=True, certwarn=False)
+
+        async def acall():
+            try:
+                return await http.acall()
+            finally:
+                await http.aclose()
+
+        response = asyncio.run(acall())
+        assert response.status_code == 200
+        assert response == http.LAST_RESPONSE
+        assert response.request == http.LAST_REQUEST
+        assert response in http.HISTORY
+        assert http.user_agent in response.request.headers["User-Agent"]
+
+    def test_acall_session_headers(self, request):
+        """Test headers set on the session are sent by acall."""
+        ax_url = get_url(request)
+
+        http = AsyncHttp(url=ax_url, certwarn=False)
+        http.session.headers["api-key"] = "badwolf"
+
+        async def acall():
+            try:
+                return await http.acall()
+            finally:
+                await http.aclose()
+
+        response = asyncio.run(acall())
+        assert response.request.headers["api-key"] == "badwolf"
+
+    def test_acall_retry_status(self, request, httpbin):
+        """Test safe requests are retried by acall on retryable status codes."""
+        http = AsyncHttp(url=httpbin.url, retries=2, retry_backoff=0.01)
+
+        async def acall():
+            try:
+                response = await http.acall(path="status/503")
+                stats = dict(http.retry_stats)
+
+                http.RETRY.reset_stats()
+                await http.acall(path="status/503", method="post")
+                unsafe = http.retry_stats["requests"]
+
+                await http.acall(path="status/503", method="post", safe=True)
+                return response, stats, unsafe
+            finally:
+                await http.aclose()
+
+        response, stats, unsafe = asyncio.run(acall())
+        assert response.status_code == 503
+        assert stats["requests"] == 3
+        assert stats["retries"] == 2
+        assert stats["reasons"] == {"503": 2}
+        assert unsafe == 1
+        assert http.retry_stats["requests"] == 4
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.metrics."""
+import pytest
+
+from axonius_api_client.metrics import ROUTE_UNKNOWN, MetricsRegistry, get_route_name
+
+
+class TestGetRouteName:
+    @pytest.mark.parametrize(
+        "path,name",
+        [
+            ("api/V4.0/devices", "devices.root"),
+            ("/api/V4.0/devices/cached", "devices.cached"),
+            ("api/V4.0/users/count/", "users.count"),
+            ("api/V4.0/devices/abc123", "devices.by_id"),
+            ("api/V4.0/adapters/aws_adapter/connections", "adapters.cnxs"),
+            ("api/V4.0/adapters/aws_adapter/connections/test", "adapters.cnxs_test"),
+            ("api/V4.0/settings/meta/about", "system.meta_about"),
+            ("api/V4.0/settings/roles/abc", "system.roles_by_uuid"),
+            ("api/V4.0/devices/cached?x=1", "devices.cached"),
+            ("nope", ROUTE_UNKNOWN),
+            (None, ROUTE_UNKNOWN),
+        ],
+    )
+    def test_valid(self, path, name):
+        assert get_route_name(path=path) == name
+
+
+class TestMetricsRegistry:
+    def test_to_dict(self):
+        metrics = MetricsRegistry(buckets=[1, 0.1])
+        metrics.observe(route="devices.cached", seconds=0.05, status_code=200, response_bytes=5)
+        metrics.observe(route="devices.cached", seconds=0.5, status_code=503, request_bytes=2)
+        metrics.observe(route="devices.cached", seconds=3, status_code=None)
+        metrics.observe_retry(route="devices.cached")
+
+        data = metrics.to_dict()
+        assert list(data) == ["devices.cached"]
+        route = data["devices.cached"]
+        assert route["requests"] == 3
+        assert route["errors"] == 1
+        assert route["retries"] == 1
+        assert route["request_bytes"] == 2
+        assert route["response_bytes"] == 5
+        assert route["seconds"] == pytest.approx(3.55)
+        assert route["statuses"] == {"200": 1, "503": 1}
+        assert route["buckets"] == {"0.1": 1, "1": 2, "+Inf": 3}
+
+        metrics.clear()
+        assert metrics.to_dict() == {}
+
+    def test_to_prometheus(self):
+        metrics = MetricsRegistry(buckets=[1], prefix="test")
+        metrics.observe(route="devices.count", seconds=0.5, status_code=200)
+
+        lines = metrics.to_prometheus().splitlines()
+        assert "# TYPE test_requests_total counter" in lines
+        assert 'test_requests_total{route="devices.count"} 1' in lines
+        assert 'test_responses_total{route="devices.count",code="200"} 1' in lines
+        assert "# TYPE test_request_duration_seconds histogram" in lines
+        assert 'test_request_duration_seconds_bucket{route="devices.count",le="1"} 1' in lines
+        assert 'test_request_duration_seconds_bucket{route="devices.count",le="+Inf"} 1' in lines
+        assert 'test_request_duration_seconds_sum{route="devices.count"} 0.5' in lines
+        assert 'test_request_duration_seconds_count{route="devices.count"} 1' in lines
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client."""
+import bz2
+import copy
+import gzip
+import json
 import tempfile
+import uuid
 
 import pytest
 
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.tools import (
+    CompressedWriter,
     calc_percent,
     check_empty,
     check_type,
@@ -19,6 +25,7 @@ from axonius_api_client.tools import (
     dt_parse,
     dt_parse_tmpl,
     dt_within_min,
+    get_compressor,
     get_path,
     get_raw_version,
     get_type_str,
@@ -27,7 +34,12 @@ from axonius_api_client.tools import (
     join_kv,
     join_url,
     json_dump,
+    JSON_CODECS,
+    JSON_SEPARATORS,
+    LazyMap,
+    json_codec,
     json_load,
+    json_stream_object,
     json_reload,
     listify,
     longest_str,
@@ -714,6 +726,152 @@ class TestJsonLoad:
             json_load(obj=x, error=True)
 
 
+class TestJsonCodec:
+    """Test json_codec."""
+
+    @pytest.mark.parametrize("codec", JSON_CODECS)
+    def test_codec(self, codec):
+        """Simple test."""
+        default = json_codec()
+        try:
+            assert json_codec(name=codec) == codec
+            x = {"x": [1, 2.5, None, True, "a/b"], "y": {"z": "badwolf"}}
+            assert json_load(obj=json_dump(obj=x)) == x
+            assert json_load(obj=json_dump(obj=x, indent=None)) == x
+            assert json_load(obj=json_dump(obj=x).encode("utf-8")) == x
+            assert json_dump(obj={"x": 2}) == '{\n  "x": 2\n}'
+            assert json_dump(obj={"b": 1, "a": 2}, indent=4, sort_keys=True).startswith(
+                '{\n    "a"'
+            )
+        finally:
+            json_codec(name=default)
+
+    @pytest.mark.parametrize("codec", JSON_CODECS)
+    def test_codec_lazy_map(self, codec):
+        """Simple test."""
+        default = json_codec()
+        try:
+            json_codec(name=codec)
+            x = LazyMap(loaders={"a": (dict, {"c": [2]})}, values={"b": 1})
+            assert json_load(obj=json_dump(obj={"x": [x]}, indent=None)) == {
+                "x": [{"a": {"c": [2]}, "b": 1}]
+            }
+        finally:
+            json_codec(name=default)
+
+    @pytest.mark.parametrize("codec", JSON_CODECS)
+    def test_codec_big_int(self, codec):
+        """Simple test."""
+        default = json_codec()
+        try:
+            json_codec(name=codec)
+            big = 123456789012345678901234567890
+            assert json_load(obj='{"a": 123456789012345678901234567890}') == {"a": big}
+            assert json_load(obj=b"18446744073709551616") == 18446744073709551616
+            assert json_load(obj=json_dump(obj={"a": [big, -big]})) == {"a": [big, -big]}
+            assert json_load(obj=b'{"a": 9223372036854775807}') == {"a": 9223372036854775807}
+        finally:
+            json_codec(name=default)
+
+    @pytest.mark.parametrize("codec", JSON_CODECS)
+    def test_codec_same_output(self, codec):
+        """Test every codec serializes the same as the stdlib json module."""
+        default = json_codec()
+        try:
+            json_codec(name=codec)
+            x = {"a": ["\u00e9\x7f\U0001f600", 1e-07, 1e-05, 1e16, 2.5, 2**70], 1: None}
+            assert json_dump(obj=x) == json.dumps(x, indent=2)
+            assert json_dump(obj=x, indent=None) == json.dumps(x)
+            assert json_dump(obj=x, indent=None, separators=JSON_SEPARATORS) == json.dumps(
+                x, separators=JSON_SEPARATORS
+            )
+
+            assert json_dump(obj=[float("nan"), float("inf")], indent=None) == "[NaN, Infinity]"
+            value = uuid.UUID(int=1)
+            assert json_dump(obj=[value], indent=None) == f'["{value}"]'
+
+            for value in [datetime.now(), {(1, 2): 1}]:
+                with pytest.raises(TypeError):
+                    json_dump(obj=value)
+        finally:
+            json_codec(name=default)
+
+    def test_codec_invalid(self):
+        """Simple test."""
+        with pytest.raises(ToolsError):
+            json_codec(name="badwolf")
+
+
+class TestLazyMap:
+    """Test LazyMap."""
+
+    def test_lazy(self):
+        """Simple test."""
+        calls = []
+
+        def loader(value):
+            calls.append(value)
+            return [value]
+
+        x = LazyMap(loaders={"a": (loader, {"value": 1}), "b": (loader, {"value": 2})})
+        assert list(x) == ["a", "b"] and len(x) == 2
+        assert "b" in x and "c" not in x
+        assert calls == [] and x.loaded == []
+
+        assert x["b"] == [2] and x["b"] is x["b"]
+        assert calls == [2] and x.loaded == ["b"]
+
+        y = copy.copy(x)
+        assert y is not x and y.loaded == ["b"] and y["b"] is x["b"]
+        assert y["a"] == [1] and calls == [2, 1] and x.loaded == ["b"]
+
+        z = copy.deepcopy(x)
+        assert z == {"a": [1], "b": [2]} and z["b"] is not x["b"]
+        z["b"].append(3)
+        assert x["b"] == [2] and calls == [2, 1, 1] and x.loaded == ["b"]
+
+        with pytest.raises(KeyError):
+            x["c"]
+        assert x.get("c") is None
+
+
+class TestJsonStreamObject:
+    """Test json_stream_object."""
+
+    def test_stream(self):
+        """Simple test."""
+        x = {"assets": [{"x": 1}, {"y": [2, "\u00e9"]}], "cursor": "abc", "page": {"number": 3}}
+        raw = json.dumps(x, ensure_ascii=False).encode("utf-8")
+        for size in [1, 3, 1024]:
+            chunks = [raw[i:][:size] for i in range(0, len(raw), size)]
+            store = {}
+            y = list(json_stream_object(chunks=chunks, array_key="assets", store=store))
+            assert y == x["assets"]
+            assert store == {"cursor": "abc", "page": {"number": 3}}
+
+    def test_stream_number_split(self):
+        """Simple test."""
+        store = {}
+        y = list(json_stream_object(chunks=['{"count": 12', "34}"], array_key="a", store=store))
+        assert y == []
+        assert store == {"count": 1234}
+
+    def test_stream_empty(self):
+        """Simple test."""
+        store = {}
+        y = list(json_stream_object(chunks=['{"assets": [ ]}'], array_key="assets", store=store))
+        assert y == []
+        assert store == {}
+
+    def test_stream_error(self):
+        """Simple test."""
+        with pytest.raises(json.JSONDecodeError):
+            list(json_stream_object(chunks=['{"assets": [1, 2'], array_key="assets", store={}))
+
+        with pytest.raises(json.JSONDecodeError):
+            list(json_stream_object(chunks=["[]"], array_key="assets", store={}))
+
+
 class TestJsonDump:
     """Test json_dump."""
 
@@ -766,6 +924,45 @@ class TestSplitStr:
             split_str({})
 
 
+class TestCompressedWriter:
+    def test_gzip_bz2(self, tmp_path):
+        text = "".join(f"row {i},ü\n" for i in range(5000))
+        for compression, decompress in [("gzip", gzip.decompress), ("bz2", bz2.decompress)]:
+            path = tmp_path / f"test.{compression}"
+            with CompressedWriter(path=path, compression=compression, buffer_size=100) as fd:
+                for line in text.splitlines(keepends=True):
+                    fd.write(line)
+            assert fd.closed
+            assert fd.bytes_in == len(text.encode("utf-8"))
+            assert fd.bytes_out == path.stat().st_size
+            assert decompress(path.read_bytes()).decode("utf-8") == text
+
+    def test_zstd(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "test.zst"
+        with CompressedWriter(path=path, compression="zstd", level=1) as fd:
+            fd.write("x" * 1000)
+        reader = zstandard.ZstdDecompressor().stream_reader(path.read_bytes())
+        assert reader.read() == b"x" * 1000
+
+    def test_closed(self, tmp_path):
+        fd = CompressedWriter(path=tmp_path / "test.gz", compression="gzip")
+        fd.close()
+        fd.close()
+        with pytest.raises(ValueError):
+            fd.write("x")
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ToolsError):
+            get_compressor(compression="badwolf")
+
+        fd = CompressedWriter(path=tmp_path / "test.gz", compression="gzip", encoding="ascii")
+        fd.write("ü")
+        fd.flush()
+        with pytest.raises(ToolsError):
+            fd.close()
+
+
 class TestLongestStr:
     def test_valid(self):
         assert longest_str(["a" * 5, "b" * 20, "c" * 3]) == 20
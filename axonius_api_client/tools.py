@@ -1,14 +1,36 @@
 # -*- coding: utf-8 -*-
 """Utilities and tools."""
+import bz2
+import codecs
+import copy
+import enum
 import ipaddress
 import json
 import logging
 import pathlib
 import platform
+import queue
+import re
 import sys
+import threading
+import uuid
+import zlib
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from itertools import zip_longest
-from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin
 
 import click
@@ -18,12 +40,194 @@ import dateutil.tz
 
 from . import __file__ as PACKAGE_FILE
 from . import __package__ as PACKAGE_ROOT
-from .constants import ERROR_ARGS, ERROR_TMPL, NO, OK_ARGS, OK_TMPL, WARN_ARGS, WARN_TMPL, YES
+from .constants import (
+    ERROR_ARGS,
+    ERROR_TMPL,
+    EXPORT_COMPRESSION_BUFFER,
+    EXPORT_COMPRESSION_LEVELS,
+    EXPORT_COMPRESSION_QUEUE,
+    NO,
+    OK_ARGS,
+    OK_TMPL,
+    WARN_ARGS,
+    WARN_TMPL,
+    YES,
+)
 from .exceptions import ToolsError
 from .version import VERSION
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
 LOG: logging.Logger = logging.getLogger(PACKAGE_ROOT).getChild("tools")
 
+JSON_CODECS: List[str] = [
+    x for x, mod in [("orjson", orjson), ("ujson", ujson), ("json", json)] if mod is not None
+]
+"""json codecs that are installed, in order of preference"""
+
+JSON_CODEC: str = JSON_CODECS[0]
+"""json codec used by :func:`json_dump` and :func:`json_load`, see :func:`json_codec`"""
+
+JSON_BIG_INTS: Dict[type, Any] = {
+    str: re.compile(r"\d{19}"),
+    bytes: re.compile(rb"\d{19}"),
+}
+"""patterns for runs of digits that may be integers the json codecs can not load exactly"""
+
+JSON_SEPARATORS: Tuple[str, str] = (",", ":")
+"""separators for json strs without whitespace, see :func:`json_dump`"""
+
+JSON_DUMP_FALLBACK: Any = re.compile(r"\de[-+]\d|(?<!\d)0\.0000|null")
+"""pattern of values orjson may serialize differently than the stdlib json module: floats with
+an exponent or under 0.0001, and nulls that may be NaN or Infinity floats"""
+
+JSON_DUMP_MARKERS: List[str] = ["e-", "e+", "0.0000", "null"]
+"""strs that are checked for before :data:`JSON_DUMP_FALLBACK`, since searching for a str is
+much faster than searching for a pattern"""
+
+JSON_NON_ASCII: Any = re.compile("[\x7f-\U0010ffff]")
+"""pattern of characters the stdlib json module escapes that orjson does not"""
+
+
+class LazyMap(Mapping):
+    """Read only mapping that gets the value of a key the first time the key is accessed.
+
+    Notes:
+        Each loader is a tuple of a callable and the kwargs to call it with. The value it returns
+        is kept, and the loader is dropped. Iterating over :meth:`items` or :meth:`values`
+        loads all keys. :func:`json_dump` serializes it like a dict. Copies of it are also lazy,
+        they get the loaders and the values loaded so far, and keys loaded afterwards by either
+        object are not loaded by the other.
+    """
+
+    def __init__(
+        self,
+        loaders: Dict[Hashable, Tuple[Callable, dict]],
+        values: Optional[Dict[Hashable, Any]] = None,
+    ):
+        """Read only mapping that gets the value of a key the first time it is accessed.
+
+        Args:
+            loaders: callable and kwargs to call it with to get the value of each key
+            values: values of keys that do not need loading
+        """
+        values = values or {}
+        self._keys = list(loaders) + [x for x in values if x not in loaders]
+        self._loaders = dict(loaders)
+        self._values = dict(values)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Get the value of a key, calling its loader if it has not been loaded yet."""
+        if key in self._values:
+            return self._values[key]
+
+        with self._lock:
+            if key not in self._values:
+                method, kwargs = self._loaders[key]
+                self._values[key] = method(**kwargs)
+                del self._loaders[key]
+        return self._values[key]
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the keys without loading them."""
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key exists without loading it."""
+        return key in self._values or key in self._loaders
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(keys={len(self)}, loaded={len(self.loaded)})"
+
+    def __copy__(self) -> "LazyMap":
+        """Copy this object, sharing the values loaded so far and the kwargs of the loaders."""
+        return self._copy(state=self.__getstate__())
+
+    def __deepcopy__(self, memo: dict) -> "LazyMap":
+        """Copy this object, deep copying the values loaded so far and the kwargs of the loaders.
+
+        Notes:
+            The loader callables are not copied, so a loader that is a bound method does not
+            copy the object it is bound to.
+        """
+        state = self.__getstate__()
+        state["_values"] = copy.deepcopy(state["_values"], memo)
+        state["_loaders"] = {
+            k: (method, copy.deepcopy(kwargs, memo))
+            for k, (method, kwargs) in state["_loaders"].items()
+        }
+        return self._copy(state=state)
+
+    def _copy(self, state: dict) -> "LazyMap":
+        """Create a new object of this class with the state of a copy.
+
+        Args:
+            state: state from :meth:`__getstate__`
+        """
+        value = self.__class__.__new__(self.__class__)
+        value.__setstate__(state)
+        return value
+
+    def __getstate__(self) -> dict:
+        """Get the state of this object for pickle and copies, with new containers."""
+        with self._lock:
+            return {
+                "_keys": list(self._keys),
+                "_loaders": dict(self._loaders),
+                "_values": dict(self._values),
+            }
+
+    def __setstate__(self, state: dict):
+        """Set the state of this object for pickle and copies."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> List[Hashable]:
+        """Get the keys that have been loaded."""
+        return [x for x in self._keys if x in self._values]
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize objects that json codecs do not support natively.
+
+    Args:
+        obj: object to serialize
+
+    Notes:
+        UUIDs and enums are serialized here so that the stdlib json module serializes them
+        the same as orjson does natively.
+
+    Raises:
+        :exc:`TypeError`: if obj is not a mapping, UUID, or enum
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj.items())
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 def listify(obj: Any, dictkeys: bool = False) -> list:
     """Force an object into a list.
@@ -213,6 +417,11 @@ def json_dump(
 ) -> Any:
     """Serialize an object into json str.
 
+    Notes:
+        The json str is the same no matter which codec is used, see :func:`json_codec`. Supply
+        ``separators=JSON_SEPARATORS`` with ``indent=None`` for json strs without whitespace,
+        which the codec can also serialize.
+
     Args:
         obj: object to serialize into json str
         indent: json str indent level
@@ -223,6 +432,17 @@ def json_dump(
     if isinstance(obj, bytes):
         obj = obj.decode("utf-8")
 
+    compact = indent is None and kwargs == {"separators": JSON_SEPARATORS}
+    if not kwargs or compact:
+        try:
+            value = _json_dump_codec(obj=obj, indent=indent, sort_keys=sort_keys, compact=compact)
+            if value is not None:
+                return value
+        except Exception:
+            # let the stdlib encoder decide if obj can be serialized
+            pass
+
+    kwargs.setdefault("default", json_default)
     try:
         return json.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
     except Exception:
@@ -231,7 +451,7 @@ def json_dump(
         return obj
 
 
-def json_load(obj: str, error: bool = True, **kwargs) -> Any:
+def json_load(obj: Union[str, bytes], error: bool = True, **kwargs) -> Any:
     """Deserialize a json str into an object.
 
     Args:
@@ -239,6 +459,13 @@ def json_load(obj: str, error: bool = True, **kwargs) -> Any:
         error: if json error happens, raise it
         **kwargs: passed to :func:`json.loads`
     """
+    if not kwargs and JSON_CODEC != "json" and not _json_has_big_int(obj=obj):
+        try:
+            return orjson.loads(obj) if JSON_CODEC == "orjson" else ujson.loads(obj)
+        except Exception:
+            # let the stdlib decoder decide if obj is valid
+            pass
+
     try:
         return json.loads(obj, **kwargs)
     except Exception:
@@ -247,6 +474,94 @@ def json_load(obj: str, error: bool = True, **kwargs) -> Any:
         return obj
 
 
+def _json_has_big_int(obj: Any) -> bool:
+    """Check if a json str has a run of 19 or more digits.
+
+    Notes:
+        orjson loads integers over 64 bits as floats and ujson fails on them, so payloads
+        that may have one are loaded by the stdlib json module to keep them exact. Runs of
+        digits in strings or floats are also matched, which only costs using the stdlib.
+    """
+    pattern = JSON_BIG_INTS.get(type(obj), None)
+    return pattern is None or bool(pattern.search(obj))
+
+
+def json_codec(name: Optional[str] = None) -> str:
+    """Get or set the json codec used by :func:`json_dump` and :func:`json_load`.
+
+    Notes:
+        The fastest codec installed is used by default: orjson, ujson, or the stdlib json.
+        The codec is only used when no extra kwargs for the stdlib json module are supplied,
+        and the stdlib json module is used if the codec fails. json strs with a run of 19 or
+        more digits are always deserialized by the stdlib json module, since orjson would
+        deserialize integers over 64 bits as floats.
+
+        Serializing gives the same json str as the stdlib json module with any codec. orjson
+        is only used for an indent of 2 or no whitespace, its output is escaped to ASCII, and
+        the stdlib json module is used for objects that have a value orjson may serialize
+        differently, see :data:`JSON_DUMP_FALLBACK`. ujson is only used for deserializing,
+        since it serializes dict keys of any type as strs where the stdlib json module fails.
+
+    Args:
+        name: name of codec to use, one of :data:`JSON_CODECS`
+
+    Raises:
+        :exc:`ToolsError`: if name is not an installed codec
+    """
+    global JSON_CODEC
+
+    if name is not None:
+        if name not in JSON_CODECS:
+            valid = ", ".join(JSON_CODECS)
+            raise ToolsError(f"Invalid json codec {name!r}, valid codecs: {valid}")
+        JSON_CODEC = name
+    return JSON_CODEC
+
+
+def _json_dump_codec(
+    obj: Any, indent: Optional[int], sort_keys: bool, compact: bool
+) -> Optional[str]:
+    """Serialize an object into json str using :data:`JSON_CODEC`.
+
+    Args:
+        obj: object to serialize into json str
+        indent: json str indent level
+        sort_keys: sort dict keys
+        compact: separators are :data:`JSON_SEPARATORS`
+
+    Returns:
+        the json str, or None if the codec can not give the same json str as the stdlib
+    """
+    if JSON_CODEC != "orjson" or not (indent == 2 or (indent is None and compact)):
+        return None
+
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    option |= orjson.OPT_PASSTHROUGH_DATACLASS
+    option |= orjson.OPT_PASSTHROUGH_SUBCLASS
+    option |= orjson.OPT_INDENT_2 if indent else 0
+    option |= orjson.OPT_SORT_KEYS if sort_keys else 0
+    value = orjson.dumps(obj, option=option, default=json_default).decode("utf-8")
+
+    if any(x in value for x in JSON_DUMP_MARKERS) and JSON_DUMP_FALLBACK.search(value):
+        return None
+    if value.isascii() and "\x7f" not in value:
+        return value
+    return JSON_NON_ASCII.sub(_json_escape, value)
+
+
+def _json_escape(match: Any) -> str:
+    """Escape a character the same as the stdlib json module with ensure_ascii.
+
+    Args:
+        match: match of a character from :data:`JSON_NON_ASCII`
+    """
+    code = ord(match.group(0))
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
 def json_reload(obj: Any, error: bool = False, trim: int = None, **kwargs) -> str:
     """Re-serialize a json str into a pretty json str.
 
@@ -266,6 +581,112 @@ def json_reload(obj: Any, error: bool = False, trim: int = None, **kwargs) -> st
     return obj
 
 
+def json_stream_object(
+    chunks: Iterable[Union[str, bytes]], array_key: str, store: dict
+) -> Generator[Any, None, None]:
+    """Incrementally deserialize a json object, yielding the items of one of its arrays.
+
+    Notes:
+        Only the item being parsed is kept in memory instead of the whole json str. The values
+        of all other keys in the object are added to store as they are parsed, so store is only
+        complete once the generator is exhausted.
+
+    Args:
+        chunks: chunks of the json str (bytes are decoded as utf-8)
+        array_key: key in the json object whose array items should be yielded
+        store: dict to add the values of all other keys in the json object to
+
+    Raises:
+        :exc:`json.JSONDecodeError`: if chunks is not a valid json object
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            eof = True
+            text = utf8.decode(b"", final=True)
+        else:
+            text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+        buf = buf[pos:] + text
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\n\r":
+                pos += 1
+            if pos < len(buf) or not more():
+                return buf[pos] if pos < len(buf) else ""
+
+    def token(char: str):
+        nonlocal pos
+        if peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", buf, pos)
+        pos += 1
+
+    def value() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # read at least as much again as is buffered so large items are not re-parsed
+                # once per chunk
+                need = 2 * (len(buf) - pos)
+                if not more():
+                    raise
+                while len(buf) - pos < need and more():
+                    pass
+                continue
+
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(buf) and isinstance(obj, (int, float)) and more():
+                continue
+
+            pos = end
+            return obj
+
+    token("{")
+    if peek() == "}":
+        return
+
+    while True:
+        key = value()
+        token(":")
+
+        if key == array_key:
+            token("[")
+            if peek() == "]":
+                pos += 1
+            else:
+                while True:
+                    yield value()
+                    if peek() == "]":
+                        pos += 1
+                        break
+                    token(",")
+        else:
+            store[key] = value()
+
+        if peek() == "}":
+            break
+        token(",")
+
+
 def dt_parse(obj: Union[str, timedelta, datetime]) -> datetime:
     """Parse a str, datetime, or timedelta into a datetime object.
 
@@ -482,6 +903,175 @@ def path_write(
     return obj, method(data)
 
 
+def get_compressor(compression: str, level: Optional[int] = None) -> Any:
+    """Get a streaming compressor object with compress and flush methods.
+
+    Args:
+        compression: compression codec, one of gzip, bz2, or zstd
+        level: compression level, or None to use the default of compression from
+            :data:`axonius_api_client.constants.EXPORT_COMPRESSION_LEVELS`
+
+    Raises:
+        :exc:`ToolsError`: if compression is not valid or zstd is not installed
+    """
+    if compression not in EXPORT_COMPRESSION_LEVELS:
+        valid = list(EXPORT_COMPRESSION_LEVELS)
+        raise ToolsError(f"Invalid compression {compression!r}, valids: {valid}")
+
+    level = EXPORT_COMPRESSION_LEVELS[compression] if level is None else coerce_int(level)
+
+    if compression == "gzip":
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    if compression == "bz2":
+        return bz2.BZ2Compressor(level)
+
+    if zstandard is None:  # pragma: no cover
+        raise ToolsError("Must install zstandard for zstd compression: pip install zstandard")
+    return zstandard.ZstdCompressor(level=level).compressobj()
+
+
+class CompressedWriter:
+    """Text file object that compresses what is written to it in a worker thread.
+
+    Notes:
+        Writes are buffered until ``buffer_size`` characters are waiting, then handed to the
+        worker thread to encode, compress, and write to the file. The worker releases the GIL
+        while compressing, so the thread writing rows does not wait on compression unless
+        ``queue_size`` buffers are already waiting.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        compression: str,
+        level: Optional[int] = None,
+        encoding: str = "utf-8",
+        buffer_size: int = EXPORT_COMPRESSION_BUFFER,
+        queue_size: int = EXPORT_COMPRESSION_QUEUE,
+    ):
+        """Text file object that compresses what is written to it in a worker thread.
+
+        Args:
+            path: path of the file to write to
+            compression: compression codec, see :func:`get_compressor`
+            level: compression level, see :func:`get_compressor`
+            encoding: encoding to use on the text written
+            buffer_size: characters to buffer before handing them to the worker thread
+            queue_size: buffers that can wait for the worker thread before writes block
+        """
+        self.name: str = str(path)
+        self.encoding: str = encoding
+        self.compression: str = compression
+        self.closed: bool = False
+        self.bytes_in: int = 0
+        self.bytes_out: int = 0
+
+        self._compressor = get_compressor(compression=compression, level=level)
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._error = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._fh = open(self.name, "wb")
+        self._thread = threading.Thread(
+            target=self._work, name=f"{self.__class__.__name__}-{compression}", daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(name={self.name!r}, compression={self.compression!r})"
+
+    def __enter__(self) -> "CompressedWriter":
+        """Use as a context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close when exiting the context manager."""
+        self.close()
+
+    def write(self, data: str) -> int:
+        """Write text to the file.
+
+        Args:
+            data: text to write
+        """
+        self._check()
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self._buffer_size:
+            self._put()
+        return len(data)
+
+    def flush(self):
+        """Hand the buffered text to the worker thread."""
+        self._check()
+        self._put()
+
+    def close(self):
+        """Compress the buffered text, finish the compressed stream, and close the file.
+
+        Raises:
+            :exc:`ToolsError`: if the worker thread failed to compress or write
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        try:
+            self._put()
+            self._queue.put(None)
+            self._thread.join()
+            if self._error is None:
+                self._write(data=self._compressor.flush())
+        finally:
+            self._fh.close()
+        self._raise_error()
+
+    def _check(self):
+        """Raise an error if the file is closed or the worker thread failed."""
+        if self.closed:
+            raise ValueError(f"I/O operation on closed file {self.name!r}")
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raise the error of the worker thread if it failed."""
+        if self._error is not None:
+            raise ToolsError(f"Failed to write compressed file {self.name!r}: {self._error}")
+
+    def _put(self):
+        """Hand the buffered text to the worker thread."""
+        if self._buffer:
+            data = "".join(self._buffer)
+            self._buffer = []
+            self._buffered = 0
+            self._queue.put(data)
+
+    def _write(self, data: bytes):
+        """Write compressed data to the file."""
+        if data:
+            self._fh.write(data)
+            self.bytes_out += len(data)
+
+    def _work(self):
+        """Compress and write the text handed to the worker thread until None is handed."""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+
+            if self._error is not None:
+                continue
+
+            try:
+                data = data.encode(self.encoding)
+                self.bytes_in += len(data)
+                self._write(data=self._compressor.compress(data))
+            except Exception as exc:
+                self._error = exc
+
+
 def longest_str(obj: List[str]) -> int:
     """Determine the length of the longest string in a list of strings.
 
@@ -48,6 +48,14 @@ setup(
     include_package_data=True,
     python_requires=">=3.5",
     install_requires=install_requires,
+    extras_require={
+        "async": ["httpx>=0.26.0"],
+        "orjson": ["orjson>=3.5.0"],
+        "parquet": ["pyarrow>=4.0.0"],
+        "zstd": ["zstandard>=0.15.0"],
+        "rapidfuzz": ["rapidfuzz>=2.0.0"],
+        "ujson": ["ujson>=4.0.0"],
+    },
     keywords=["Axonius", "API Library"],
     tests_require=["pytest", "pytest-cov", "pytest-httpbin", "coverage"],
     license=ABOUT["__license__"],